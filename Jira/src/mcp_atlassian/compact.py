@@ -0,0 +1,469 @@
+"""Compact serialization of tool results.
+
+Tool results are JSON documents built from ``to_simplified_dict()`` output.
+In compact mode they are emitted as minified JSON without empty values, and
+user/status objects that occur more than once are interned into a lookup
+table. Independently of compact mode, a text budget truncates long text
+fields and stores the remainder behind a continuation handle that can be
+fetched with the ``atlassian_get_continuation`` tool. Texts are either cut
+after their beginning or summarized: the beginning and end are kept along
+with the headings and code fences of the elided middle.
+"""
+
+import json
+import os
+import re
+import secrets
+from dataclasses import dataclass, replace
+from typing import Any
+
+from . import json_codec
+from .utils import TTLCache
+
+# Keys whose dictionary values describe a user or a status
+USER_KEYS = frozenset({"assignee", "reporter", "author", "lead", "creator", "by"})
+STATUS_KEYS = frozenset({"status", "to_status"})
+
+# Keys whose string values are free text subject to the text budget
+TEXT_KEYS = frozenset({"description", "body", "content", "value", "comment"})
+
+CONTINUATION_SUFFIX = "_continuation"
+
+# How texts over the budget are truncated
+TRUNCATION_MODES = ("head", "summary")
+
+# Markdown and Jira headings, kept from the elided middle of summarized texts
+_HEADING_LINE_RE = re.compile(r"[ \t]{0,3}(?:#{1,6}|h[1-6]\.)[ \t]")
+
+# Code block fences: Markdown fences start a line, Jira macros can be inline
+_MARKDOWN_FENCE_RE = re.compile(r"[ \t]{0,3}(```|~~~)")
+_JIRA_FENCE_RE = re.compile(r"\{(code|noformat)(?::[^}\n]*)?\}")
+
+# Longest line added to close or reopen a code block
+_MAX_FENCE_LINE = len("{noformat}\n")
+
+
+class ContinuationStore:
+    """Short-lived, bounded store for the elided remainder of long texts."""
+
+    def __init__(self, ttl: float = 900.0, max_entries: int = 256) -> None:
+        """
+        Initialize the continuation store.
+
+        Args:
+            ttl: Seconds a continuation stays available
+            max_entries: Maximum number of stored continuations; the least
+                recently used entries are evicted first
+        """
+        self._entries = TTLCache(ttl=ttl, maxsize=max_entries)
+
+    def put(self, text: str) -> str:
+        """
+        Store text and return a handle for it.
+
+        Args:
+            text: The text to store
+
+        Returns:
+            An opaque continuation handle
+        """
+        handle = f"cont-{secrets.token_urlsafe(9)}"
+        self._entries.set(handle, text)
+        return handle
+
+    def get(self, handle: str) -> str | None:
+        """
+        Return the text stored for a handle.
+
+        Args:
+            handle: A handle returned by put()
+
+        Returns:
+            The stored text, or None if the handle is unknown or expired
+        """
+        return self._entries.get(handle)
+
+
+# Process-wide store shared by all tools
+continuations = ContinuationStore()
+
+
+def _parse_int(value: Any) -> int | None:
+    """Parse a positive integer setting, treating empty or invalid values as None."""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return None
+    return number if number > 0 else None
+
+
+def _parse_truncation(value: Any) -> str:
+    """Parse a truncation mode, treating empty or unknown values as "head"."""
+    mode = str(value or "").lower()
+    return mode if mode in TRUNCATION_MODES else "head"
+
+
+@dataclass(frozen=True)
+class OutputOptions:
+    """Options controlling how tool results are serialized."""
+
+    compact: bool = False  # Minify, drop empty values and intern users/statuses
+    max_text_length: int | None = None  # Text budget per field, in characters
+    truncation: str = "head"  # Keep the beginning or a summary of long texts
+
+    @classmethod
+    def from_env(cls) -> "OutputOptions":
+        """Create the global output options from environment variables.
+
+        Returns:
+            OutputOptions read from ATLASSIAN_COMPACT_OUTPUT,
+            ATLASSIAN_MAX_TEXT_LENGTH and ATLASSIAN_TEXT_TRUNCATION
+        """
+        compact_env = os.getenv("ATLASSIAN_COMPACT_OUTPUT", "false").lower()
+        return cls(
+            compact=compact_env in ("true", "1", "yes"),
+            max_text_length=_parse_int(os.getenv("ATLASSIAN_MAX_TEXT_LENGTH")),
+            truncation=_parse_truncation(os.getenv("ATLASSIAN_TEXT_TRUNCATION")),
+        )
+
+    def with_arguments(self, arguments: dict[str, Any]) -> "OutputOptions":
+        """
+        Apply per-call overrides and remove them from the tool arguments.
+
+        Args:
+            arguments: Tool arguments; the ``compact``, ``max_text_length`` and
+                ``truncation`` keys are popped if present
+
+        Returns:
+            OutputOptions with the per-call overrides applied
+        """
+        options = self
+        if (compact := arguments.pop("compact", None)) is not None:
+            options = replace(options, compact=bool(compact))
+        if "max_text_length" in arguments:
+            max_text_length = _parse_int(arguments.pop("max_text_length"))
+            options = replace(options, max_text_length=max_text_length)
+        if (truncation := arguments.pop("truncation", None)) is not None:
+            options = replace(options, truncation=_parse_truncation(truncation))
+        return options
+
+    def dumps(self, data: Any) -> str:
+        """
+        Serialize a tool result according to these options.
+
+        Args:
+            data: JSON-serializable tool result
+
+        Returns:
+            The serialized JSON text
+        """
+        if self.max_text_length:
+            data = truncate_text_fields(
+                data, self.max_text_length, summarize=self.truncation == "summary"
+            )
+        if not self.compact:
+            return json_codec.dumps(data, pretty=True)
+        return json_codec.dumps(compact_result(data))
+
+
+def drop_empty(data: Any) -> Any:
+    """
+    Recursively remove None values, empty strings and empty containers.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        A copy of the data without empty values
+    """
+    if isinstance(data, dict):
+        cleaned = {key: drop_empty(value) for key, value in data.items()}
+        return {
+            key: value
+            for key, value in cleaned.items()
+            if value is not None and value != "" and value != [] and value != {}
+        }
+    if isinstance(data, list):
+        return [drop_empty(item) for item in data]
+    return data
+
+
+def _ref_key(value: dict[str, Any]) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def intern_references(data: Any) -> tuple[Any, dict[str, dict[str, Any]]]:
+    """
+    Replace user and status objects that occur more than once with references.
+
+    Args:
+        data: JSON-compatible data
+
+    Returns:
+        Tuple of (data with references, lookup table). The lookup table maps
+        "users" and "statuses" to {reference: object}; it is empty when nothing
+        was interned.
+    """
+    counts: dict[str, int] = {}
+
+    def count(node: Any) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if isinstance(value, dict) and (key in USER_KEYS or key in STATUS_KEYS):
+                    ref_key = _ref_key(value)
+                    counts[ref_key] = counts.get(ref_key, 0) + 1
+                count(value)
+        elif isinstance(node, list):
+            for item in node:
+                count(item)
+
+    count(data)
+    if not any(n > 1 for n in counts.values()):
+        return data, {}
+
+    refs: dict[str, dict[str, Any]] = {}
+    assigned: dict[str, str] = {}
+
+    def replace_refs(node: Any) -> Any:
+        if isinstance(node, list):
+            return [replace_refs(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        result = {}
+        for key, value in node.items():
+            if isinstance(value, dict) and (key in USER_KEYS or key in STATUS_KEYS):
+                ref_key = _ref_key(value)
+                if counts.get(ref_key, 0) > 1:
+                    if ref_key not in assigned:
+                        table = "users" if key in USER_KEYS else "statuses"
+                        prefix = "u" if table == "users" else "s"
+                        ref = f"{prefix}{len(refs.get(table, {})) + 1}"
+                        refs.setdefault(table, {})[ref] = value
+                        assigned[ref_key] = ref
+                    result[key] = assigned[ref_key]
+                    continue
+            result[key] = replace_refs(value)
+        return result
+
+    return replace_refs(data), refs
+
+
+def compact_result(data: Any) -> Any:
+    """
+    Compact a tool result by dropping empty values and interning references.
+
+    Args:
+        data: JSON-compatible tool result
+
+    Returns:
+        The compacted data, wrapped as {"data": ..., "refs": ...} when any
+        user or status object was interned
+    """
+    data, refs = intern_references(drop_empty(data))
+    if refs:
+        return {"data": data, "refs": refs}
+    return data
+
+
+def split_text(
+    text: str, max_length: int, store: ContinuationStore | None = None
+) -> tuple[str, str | None]:
+    """
+    Cut text to a budget and store the remainder.
+
+    Args:
+        text: The text to cut
+        max_length: Maximum number of characters to keep
+        store: Continuation store for the remainder (defaults to the global one)
+
+    Returns:
+        Tuple of (kept text, continuation handle or None if nothing was cut)
+    """
+    if len(text) <= max_length:
+        return text, None
+    # Prefer to cut at a line break so that markdown structures stay intact
+    cut = text.rfind("\n", 0, max_length)
+    if cut < max_length // 2:
+        cut = max_length
+    handle = (store or continuations).put(text[cut:])
+    return text[:cut], handle
+
+
+def _omitted_marker(count: int) -> str:
+    """Return the line standing in for count omitted lines."""
+    return f"[... {count} lines omitted ...]\n"
+
+
+def _fence_tokens(line: str) -> list[str]:
+    """Return the code block fences in a line, as the token closing each."""
+    if match := _MARKDOWN_FENCE_RE.match(line):
+        return [match.group(1)]
+    return [f"{{{name}}}" for name in _JIRA_FENCE_RE.findall(line)]
+
+
+def _track_fence(open_fence: str | None, line: str) -> str | None:
+    """Return the fence left open after a line, given the one open before it."""
+    for token in _fence_tokens(line):
+        open_fence = token if open_fence is None else None
+    return open_fence
+
+
+def summarize_text(
+    text: str, max_length: int, store: ContinuationStore | None = None
+) -> tuple[str, str | None]:
+    """
+    Summarize text to a budget and store the elided middle.
+
+    The first lines (half of the budget) and the last lines (a quarter) are
+    kept. In between, the headings and code block fences of the elided part
+    are kept while the budget allows, with markers for the omitted lines, so
+    the summary keeps the document outline and balanced code blocks.
+
+    Args:
+        text: The text to summarize
+        max_length: Maximum number of characters to keep
+        store: Continuation store for the elided middle (defaults to the
+            global one)
+
+    Returns:
+        Tuple of (summary, continuation handle or None if nothing was elided).
+        The continuation holds the elided lines in full, so the text is the
+        kept beginning, the continuation and the kept end.
+    """
+    if len(text) <= max_length:
+        return text, None
+
+    lines = text.splitlines(keepends=True)
+    # Room for the last omission marker and for closing and reopening a fence
+    reserve = len(_omitted_marker(len(lines))) + 2 * _MAX_FENCE_LINE
+    head_end = used = 0
+    while used + len(lines[head_end]) <= max_length // 2:
+        used += len(lines[head_end])
+        head_end += 1
+    tail_length = min(max_length // 4, max_length - used - reserve)
+
+    # A beginning without line breaks can't be summarized by lines, and a
+    # tiny budget leaves no room for the markers
+    if head_end == 0 or tail_length < 0:
+        return split_text(text, max_length, store)
+
+    tail_start = len(lines)
+    used = 0
+    while used + len(lines[tail_start - 1]) <= tail_length:
+        tail_start -= 1
+        used += len(lines[tail_start])
+
+    head = "".join(lines[:head_end])
+    tail = "".join(lines[tail_start:])
+    budget = max_length - len(head) - len(tail) - reserve
+    open_fence = None
+    for line in lines[:head_end]:
+        open_fence = _track_fence(open_fence, line)
+
+    # Keep headings and fences, with the markers before them, until the
+    # budget runs out
+    summary = [head]
+    kept_fence = open_fence
+    omitted = 0
+    budget_left = True
+    for line in lines[head_end:tail_start]:
+        open_fence = _track_fence(open_fence, line)
+        structural = _fence_tokens(line) or _HEADING_LINE_RE.match(line)
+        if structural and budget_left:
+            kept = line if line.endswith("\n") else f"{line}\n"
+            marker = _omitted_marker(omitted) if omitted else ""
+            budget_left = len(marker) + len(kept) <= budget
+        if structural and budget_left:
+            summary.extend((marker, kept))
+            budget -= len(marker) + len(kept)
+            omitted = 0
+            kept_fence = open_fence
+        else:
+            omitted += 1
+    if omitted:
+        summary.append(_omitted_marker(omitted))
+
+    # Leave the code blocks open or closed the way the kept end expects
+    if kept_fence is not None and kept_fence != open_fence:
+        summary.append(f"{kept_fence}\n")
+    if open_fence is not None and kept_fence != open_fence:
+        summary.append(f"{open_fence}\n")
+    summary.append(tail)
+
+    handle = (store or continuations).put("".join(lines[head_end:tail_start]))
+    return "".join(summary), handle
+
+
+def truncate_text_fields(
+    data: Any,
+    max_length: int,
+    store: ContinuationStore | None = None,
+    *,
+    summarize: bool = False,
+) -> Any:
+    """
+    Truncate long text fields and add continuation handles next to them.
+
+    Args:
+        data: JSON-compatible data
+        max_length: Maximum number of characters per text field
+        store: Continuation store for the remainders
+        summarize: Summarize texts with summarize_text instead of cutting
+            them after their beginning
+
+    Returns:
+        A copy of the data where every long text field is cut and followed by
+        a ``<field>_continuation`` key holding the handle for the remainder
+    """
+    if isinstance(data, list):
+        return [
+            truncate_text_fields(item, max_length, store, summarize=summarize)
+            for item in data
+        ]
+    if not isinstance(data, dict):
+        return data
+
+    truncate = summarize_text if summarize else split_text
+    result: dict[str, Any] = {}
+    for key, value in data.items():
+        if key in TEXT_KEYS and isinstance(value, str):
+            kept, handle = truncate(value, max_length, store)
+            result[key] = kept
+            if handle:
+                result[f"{key}{CONTINUATION_SUFFIX}"] = handle
+        else:
+            result[key] = truncate_text_fields(
+                value, max_length, store, summarize=summarize
+            )
+    return result
+
+
+def read_continuation(
+    handle: str, max_length: int | None = None, store: ContinuationStore | None = None
+) -> dict[str, Any]:
+    """
+    Fetch the next chunk of a truncated text.
+
+    Args:
+        handle: Continuation handle from a previous tool result
+        max_length: Maximum number of characters to return
+        store: Continuation store to read from
+
+    Returns:
+        Dictionary with the "text" chunk and, if more text remains, a
+        "continuation" handle for the rest
+
+    Raises:
+        ValueError: If the handle is unknown or expired
+    """
+    text = (store or continuations).get(handle)
+    if text is None:
+        error_msg = f"Continuation {handle} is unknown or has expired"
+        raise ValueError(error_msg)
+    if not max_length:
+        return {"text": text}
+    chunk, next_handle = split_text(text, max_length, store)
+    result: dict[str, Any] = {"text": chunk}
+    if next_handle:
+        result["continuation"] = next_handle
+    return result
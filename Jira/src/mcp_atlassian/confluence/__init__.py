@@ -3,6 +3,7 @@
 This module provides access to Confluence content through the Model Context Protocol.
 """
 
+from .attachments import AttachmentsMixin
 from .client import ConfluenceClient
 from .comments import CommentsMixin
 from .config import ConfluenceConfig
@@ -11,7 +12,9 @@ from .search import SearchMixin
 from .spaces import SpacesMixin
 
 
-class ConfluenceFetcher(SearchMixin, SpacesMixin, PagesMixin, CommentsMixin):
+class ConfluenceFetcher(
+    SearchMixin, SpacesMixin, PagesMixin, CommentsMixin, AttachmentsMixin
+):
     """Main entry point for Confluence operations, providing backward compatibility.
 
     This class combines functionality from various mixins to maintain the same
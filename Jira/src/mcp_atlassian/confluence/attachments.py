@@ -0,0 +1,260 @@
+"""Module for Confluence attachment operations."""
+
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+
+import requests
+
+from ..models.confluence import ConfluenceAttachment
+from .client import ConfluenceClient
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Attachment expansions; the container identifies the page a file belongs to
+ATTACHMENT_EXPAND = "version,container"
+ATTACHMENTS_PAGE_SIZE = 50
+
+# Size of the chunks streamed from the server, which bounds download memory
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class AttachmentsMixin(ConfluenceClient):
+    """Mixin for Confluence attachment operations."""
+
+    def get_page_attachments(
+        self,
+        page_id: str,
+        *,
+        filename: str | None = None,
+        media_type: str | None = None,
+    ) -> list[ConfluenceAttachment]:
+        """
+        Get the metadata of all files attached to a page.
+
+        Args:
+            page_id: The ID of the page
+            filename: Optional file name to filter by
+            media_type: Optional media type to filter by, e.g. 'application/pdf'
+
+        Returns:
+            List of ConfluenceAttachment models
+        """
+        try:
+            attachments = []
+            start = 0
+            while True:
+                response = self.confluence.get_attachments_from_content(
+                    page_id,
+                    start=start,
+                    limit=ATTACHMENTS_PAGE_SIZE,
+                    expand=ATTACHMENT_EXPAND,
+                    filename=filename,
+                    media_type=media_type,
+                )
+                results = response["results"]
+                attachments.extend(
+                    ConfluenceAttachment.from_api_response(
+                        result, base_url=self.config.url
+                    )
+                    for result in results
+                )
+                # The server links the next page while there are more attachments
+                if not results or "next" not in response.get("_links", {}):
+                    return attachments
+                start += len(results)
+
+        except KeyError as e:
+            logger.error(f"Missing key in attachment data: {str(e)}")
+            return []
+        except requests.RequestException as e:
+            logger.error(f"Network error when fetching attachments: {str(e)}")
+            return []
+        except (ValueError, TypeError) as e:
+            logger.error(f"Error processing attachment data: {str(e)}")
+            return []
+        except Exception as e:  # noqa: BLE001 - Intentional fallback with full logging
+            logger.error(f"Unexpected error fetching attachments: {str(e)}")
+            logger.debug("Full exception details for attachments:", exc_info=True)
+            return []
+
+    def get_attachment(self, attachment_id: str) -> ConfluenceAttachment | None:
+        """
+        Get the metadata of an attachment by ID.
+
+        Args:
+            attachment_id: The ID of the attachment
+
+        Returns:
+            ConfluenceAttachment model, or None if no such attachment exists
+        """
+        try:
+            data = self.confluence.get_page_by_id(
+                page_id=attachment_id, expand=ATTACHMENT_EXPAND
+            )
+            if not data or data.get("type") != "attachment":
+                return None
+            return ConfluenceAttachment.from_api_response(
+                data, base_url=self.config.url
+            )
+        except Exception as e:  # noqa: BLE001 - Intentional fallback with full logging
+            logger.error(f"Error fetching attachment {attachment_id}: {str(e)}")
+            logger.debug("Full exception details:", exc_info=True)
+            return None
+
+    def iter_attachment_chunks(
+        self,
+        attachment: ConfluenceAttachment,
+        *,
+        offset: int = 0,
+        max_bytes: int | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream the content of an attachment in chunks.
+
+        Args:
+            attachment: The attachment to download
+            offset: Byte position to start from, e.g. to resume a download
+            max_bytes: Size cap; defaults to the configured attachment_max_bytes
+                (0 removes the cap)
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            Consecutive chunks of the attachment content from offset onwards;
+            nothing if offset is at the end of the content
+
+        Raises:
+            ValueError: If the attachment has no download URL or exceeds the cap
+            requests.RequestException: If the download fails
+        """
+        if not attachment.download_url:
+            error_msg = f"Attachment {attachment.id} has no download URL"
+            raise ValueError(error_msg)
+
+        cap = self.config.attachment_max_bytes if max_bytes is None else max_bytes
+        if cap and attachment.file_size is not None and attachment.file_size > cap:
+            error_msg = (
+                f"Attachment {attachment.title} is {attachment.file_size} bytes, "
+                f"larger than the {cap} byte limit"
+            )
+            raise ValueError(error_msg)
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        with self.confluence._session.get(
+            attachment.download_url,
+            headers=headers,
+            stream=True,
+            timeout=self.confluence.timeout,
+        ) as response:
+            # A range starting at the end of the content is refused, which
+            # means an unknown-size download was already complete
+            if offset and response.status_code == 416:
+                return
+            response.raise_for_status()
+
+            # A server ignoring the range sends everything; skip to the offset
+            skip = offset if offset and response.status_code != 206 else 0
+            position = offset
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if skip:
+                    skipped = min(skip, len(chunk))
+                    chunk = chunk[skipped:]
+                    skip -= skipped
+                if not chunk:
+                    continue
+                position += len(chunk)
+                if cap and position > cap:
+                    error_msg = (
+                        f"Attachment {attachment.title} exceeds the {cap} byte limit"
+                    )
+                    raise ValueError(error_msg)
+                yield chunk
+
+    def read_attachment(
+        self, attachment: ConfluenceAttachment, *, max_bytes: int | None = None
+    ) -> bytes:
+        """
+        Read the content of an attachment into memory, e.g. for a blob resource.
+
+        Args:
+            attachment: The attachment to read
+            max_bytes: Size cap; defaults to the configured attachment_max_bytes
+
+        Returns:
+            The attachment content
+
+        Raises:
+            ValueError: If the attachment has no download URL or exceeds the cap
+            requests.RequestException: If the download fails
+        """
+        return b"".join(self.iter_attachment_chunks(attachment, max_bytes=max_bytes))
+
+    def download_attachment(
+        self,
+        attachment: ConfluenceAttachment,
+        destination: str | Path,
+        *,
+        max_bytes: int | None = None,
+    ) -> Path:
+        """
+        Download an attachment to disk without holding it in memory.
+
+        The content is written to a partial file next to the destination
+        first. If a download is interrupted, calling this again resumes it with
+        a range request as long as the attachment version is unchanged.
+
+        Args:
+            attachment: The attachment to download
+            destination: Target file, or a directory to save the attachment
+                under its title
+            max_bytes: Size cap; defaults to the configured attachment_max_bytes
+
+        Returns:
+            Path of the downloaded file
+
+        Raises:
+            ValueError: If the attachment has no download URL, exceeds the cap
+                or the download is incomplete
+            Exception: If the download fails; the partial file is kept for
+                resuming
+        """
+        path = Path(destination).expanduser()
+        if path.is_dir():
+            path = path / Path(attachment.title).name
+
+        version = attachment.version.number if attachment.version else 0
+        partial = path.with_name(f"{path.name}.v{version}.part")
+        offset = partial.stat().st_size if partial.exists() else 0
+        if attachment.file_size is not None and offset > attachment.file_size:
+            offset = 0
+
+        # A partial file that is already complete only needs to be renamed;
+        # asking for the range after its end would be refused
+        complete = bool(offset) and offset == attachment.file_size
+        try:
+            if not complete:
+                with partial.open("ab" if offset else "wb") as file:
+                    for chunk in self.iter_attachment_chunks(
+                        attachment, offset=offset, max_bytes=max_bytes
+                    ):
+                        file.write(chunk)
+        except ValueError:
+            partial.unlink(missing_ok=True)
+            raise
+        except Exception as e:
+            logger.error(f"Error downloading attachment {attachment.id}: {str(e)}")
+            error_msg = f"Failed to download attachment {attachment.id}: {str(e)}"
+            raise Exception(error_msg) from e
+
+        size = partial.stat().st_size
+        if attachment.file_size is not None and size != attachment.file_size:
+            error_msg = (
+                f"Downloaded {size} of {attachment.file_size} bytes of attachment "
+                f"{attachment.title}"
+            )
+            raise ValueError(error_msg)
+
+        partial.replace(path)
+        logger.debug(f"Downloaded attachment {attachment.id} to {path}")
+        return path
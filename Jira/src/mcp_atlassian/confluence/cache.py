@@ -0,0 +1,228 @@
+"""Caches shared by the Confluence mixins."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..models.confluence import ConfluencePage
+
+logger = logging.getLogger("mcp-atlassian")
+
+
+class SpaceIndex:
+    """Cached index of all Confluence spaces keyed by space key.
+
+    The index is loaded page by page on first use. Once it is older than the
+    TTL, lookups keep answering from the stale index while a background thread
+    reloads it. A lookup for an unknown key reloads the index synchronously
+    (at most once per ``min_refresh_interval``) so newly created spaces are
+    found without waiting for the TTL.
+    """
+
+    def __init__(
+        self,
+        fetch_spaces: Callable[[int, int], Any],
+        ttl: float = 300,
+        page_size: int = 500,
+        min_refresh_interval: float = 30,
+    ) -> None:
+        """Initialize an empty index.
+
+        Args:
+            fetch_spaces: Callable taking (start, limit) and returning one page
+                of the space list, e.g. ``Confluence.get_all_spaces``
+            ttl: Seconds before the index is refreshed; 0 disables caching
+            page_size: Number of spaces requested per page
+            min_refresh_interval: Minimum seconds between reloads caused by
+                unknown keys
+        """
+        self.fetch_spaces = fetch_spaces
+        self.ttl = ttl
+        self.page_size = page_size
+        self.min_refresh_interval = min_refresh_interval
+        self._spaces: dict[str, dict[str, Any]] | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+
+    def get(self, space_key: str) -> dict[str, Any] | None:
+        """Look up a space by key.
+
+        Args:
+            space_key: The key of the space
+
+        Returns:
+            The space data from the space list, or None if the space does not exist
+        """
+        spaces = self._current()
+        space = spaces.get(space_key)
+        if (
+            space is None
+            and self.ttl > 0
+            and self._age() >= min(self.min_refresh_interval, self.ttl)
+        ):
+            space = self.refresh().get(space_key)
+        return space
+
+    def __contains__(self, space_key: str) -> bool:
+        """Check whether a space exists."""
+        return self.get(space_key) is not None
+
+    def spaces(self) -> dict[str, dict[str, Any]]:
+        """Return all known spaces keyed by space key."""
+        return dict(self._current())
+
+    def refresh(self) -> dict[str, dict[str, Any]]:
+        """Reload the index synchronously.
+
+        Returns:
+            The reloaded spaces keyed by space key
+
+        Raises:
+            Any exception raised while fetching the space list
+        """
+        with self._refresh_lock:
+            spaces = self._fetch_all()
+            with self._lock:
+                self._spaces = spaces
+                self._loaded_at = time.monotonic()
+        return spaces
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup reloads it."""
+        with self._lock:
+            self._spaces = None
+            self._loaded_at = 0.0
+
+    def _age(self) -> float:
+        return time.monotonic() - self._loaded_at
+
+    def _current(self) -> dict[str, dict[str, Any]]:
+        spaces = self._spaces
+        if spaces is None or self.ttl <= 0:
+            return self.refresh()
+        if self._age() >= self.ttl:
+            self._refresh_in_background()
+        return spaces
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name="confluence-space-index",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:  # noqa: BLE001 - Keep serving the stale index
+            logger.warning(f"Failed to refresh Confluence space index: {str(e)}")
+            logger.debug("Full exception details for space index:", exc_info=True)
+
+    def _fetch_all(self) -> dict[str, dict[str, Any]]:
+        spaces: dict[str, dict[str, Any]] = {}
+        start = 0
+        while True:
+            response = self.fetch_spaces(start, self.page_size)
+            if isinstance(response, dict):
+                results = response.get("results", [])
+                # The server may cap the page size below what was requested
+                limit = response.get("limit", self.page_size)
+            else:
+                results = response or []
+                limit = self.page_size
+
+            known = len(spaces)
+            for space in results:
+                spaces[space["key"]] = space
+
+            # Stop on a short page, or if the server ignored the start offset
+            if len(results) < limit or len(spaces) == known:
+                return spaces
+            start += len(results)
+
+
+@dataclass
+class SpaceSnapshot:
+    """Local copy of the pages of a space with their converted content.
+
+    The snapshot is kept up to date incrementally: ``synced_at`` is the
+    watermark from which the next sync asks for modified pages only.
+    """
+
+    space_key: str
+    pages: dict[str, ConfluencePage] = field(default_factory=dict)
+    last_modified: dict[str, str] = field(default_factory=dict)
+    synced_at: float = 0.0  # Wall-clock time the last successful sync started
+    reconciled_at: float = 0.0  # Wall-clock time deleted pages were last dropped
+    complete: bool = False  # Whether every page of the space is in the snapshot
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def put(self, page: ConfluencePage, last_modified: str) -> None:
+        """Add or replace a page.
+
+        Args:
+            page: The page with its converted content
+            last_modified: ISO timestamp of the page's last modification
+        """
+        self.pages[page.id] = page
+        self.last_modified[page.id] = last_modified
+
+    def retain(self, page_ids: set[str]) -> set[str]:
+        """Drop all pages whose ID is not in page_ids.
+
+        Args:
+            page_ids: IDs of the pages that still exist
+
+        Returns:
+            IDs of the dropped pages
+        """
+        dropped = set(self.pages) - page_ids
+        for page_id in dropped:
+            del self.pages[page_id]
+            self.last_modified.pop(page_id, None)
+        return dropped
+
+    def trim(self, max_pages: int) -> set[str]:
+        """Drop the least recently modified pages beyond max_pages.
+
+        Args:
+            max_pages: Maximum number of pages to keep
+
+        Returns:
+            IDs of the dropped pages
+        """
+        dropped = {page.id for page in self.recent()[max_pages:]}
+        for page_id in dropped:
+            del self.pages[page_id]
+            self.last_modified.pop(page_id, None)
+        return dropped
+
+    def version_of(self, page_id: str) -> int | None:
+        """Return the version number of a page in the snapshot, if present."""
+        page = self.pages.get(page_id)
+        return page.version.number if page and page.version else None
+
+    def recent(self, limit: int | None = None) -> list[ConfluencePage]:
+        """Return pages ordered by last modification, most recent first.
+
+        Args:
+            limit: Maximum number of pages to return (None = all)
+
+        Returns:
+            List of ConfluencePage models
+        """
+        page_ids = sorted(
+            self.pages, key=lambda page_id: self.last_modified[page_id], reverse=True
+        )
+        return [self.pages[page_id] for page_id in page_ids[:limit]]
@@ -5,12 +5,22 @@ from typing import Any
 
 from atlassian import Confluence
 
-from ..utils import configure_ssl_verification
+from ..json_codec import configure_json_decoding
+from ..models.confluence import ConfluencePage
+from ..utils import TTLCache, configure_ssl_verification
+from .cache import SpaceIndex
 from .config import ConfluenceConfig
+from .index import SearchIndex
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian")
 
+# Number of processed pages kept in the page content cache
+PAGE_CONTENT_CACHE_SIZE = 100
+
+# Number of space snapshots kept in memory
+SPACE_SNAPSHOT_CACHE_SIZE = 20
+
 
 class ConfluenceClient:
     """Base client for Confluence API interactions."""
@@ -51,11 +61,45 @@ class ConfluenceClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Decode responses with the fast JSON codec when available
+        configure_json_decoding(self.confluence._session)
+
+        # Space list and (space key, title) -> page ID lookups shared by the mixins
+        self.space_index = SpaceIndex(
+            lambda start, limit: self.confluence.get_all_spaces(
+                start=start, limit=limit
+            ),
+            ttl=self.config.cache_ttl,
+        )
+        self.page_id_cache = TTLCache(ttl=self.config.cache_ttl)
+
+        # Processed page content keyed by (page ID, expand); entries never
+        # expire because every read revalidates them against the page version
+        self.page_content_cache = TTLCache(
+            ttl=float("inf") if self.config.cache_ttl else 0,
+            maxsize=PAGE_CONTENT_CACHE_SIZE,
+        )
+
+        # Incrementally synced page snapshots by space key; like the page
+        # contents they never expire, as every read syncs the modified pages
+        self.space_snapshots = TTLCache(
+            ttl=float("inf") if self.config.cache_ttl else 0,
+            maxsize=SPACE_SNAPSHOT_CACHE_SIZE,
+        )
+
+        # Optional local full-text index of fetched and synced pages
+        self.search_index = SearchIndex.from_env()
+
         # Import here to avoid circular imports
         from ..preprocessing.confluence import ConfluencePreprocessor
+        from ..preprocessing.pool import ConversionPool
+        from ..preprocessing.store import ConversionStore
 
         self.preprocessor = ConfluencePreprocessor(
-            base_url=self.config.url, confluence_client=self.confluence
+            base_url=self.config.url,
+            confluence_client=self.confluence,
+            conversion_store=ConversionStore.from_env(),
+            conversion_pool=ConversionPool.from_env(),
         )
 
     def get_user_details_by_accountid(
@@ -77,6 +121,16 @@ class ConfluenceClient:
         """
         return self.confluence.get_user_details_by_accountid(account_id, expand)
 
+    def _index_page(self, page: ConfluencePage, content: str) -> None:
+        """Add a page to the local search index, if one is configured.
+
+        Args:
+            page: The page model with ID, version, title, space and URL
+            content: The page content in markdown format
+        """
+        if self.search_index is not None:
+            self.search_index.add(page, content)
+
     def _process_html_content(
         self, html_content: str, space_key: str
     ) -> tuple[str, str]:
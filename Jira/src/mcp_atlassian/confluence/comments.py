@@ -1,14 +1,26 @@
 """Module for Confluence comment operations."""
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
 
 import requests
 
 from ..models.confluence import ConfluenceComment
 from .client import ConfluenceClient
+from .pages import PAGE_EXPAND
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Comment expansions; the container's space saves a separate page lookup
+COMMENT_EXPAND = "body.view.value,version,container.space"
+COMMENTS_PAGE_SIZE = 100
+
+# Number of comments in a result page from which they are converted in parallel
+PARALLEL_COMMENT_THRESHOLD = 20
+MAX_COMMENT_WORKERS = 8
+
 
 class CommentsMixin(ConfluenceClient):
     """Mixin for Confluence comment operations."""
@@ -28,47 +40,36 @@ class CommentsMixin(ConfluenceClient):
             List of ConfluenceComment models containing comment content and metadata
         """
         try:
-            # Get page info to extract space details
-            page = self.confluence.get_page_by_id(page_id=page_id, expand="space")
-            space_key = page.get("space", {}).get("key", "")
-
-            # Get comments with expanded content
-            comments_response = self.confluence.get_page_comments(
-                content_id=page_id, expand="body.view.value,version", depth="all"
-            )
-
-            # Process each comment
-            comment_models = []
-            for comment_data in comments_response.get("results", []):
-                # Get the content based on format
-                body = comment_data["body"]["view"]["value"]
-                processed_html, processed_markdown = (
-                    self.preprocessor.process_html_content(body, space_key=space_key)
-                )
-
-                # Create a copy of the comment data to modify
-                modified_comment_data = comment_data.copy()
-
-                # Modify the body value based on the return format
-                if "body" not in modified_comment_data:
-                    modified_comment_data["body"] = {}
-                if "view" not in modified_comment_data["body"]:
-                    modified_comment_data["body"]["view"] = {}
-
-                # Set the appropriate content based on return format
-                modified_comment_data["body"]["view"]["value"] = (
-                    processed_markdown if return_markdown else processed_html
-                )
-
-                # Create the model with the processed content
-                comment_model = ConfluenceComment.from_api_response(
-                    modified_comment_data,
-                    base_url=self.config.url,
-                )
-
-                comment_models.append(comment_model)
-
-            return comment_models
+            space_key: str | None = None
+            comments: list[ConfluenceComment | Future[ConfluenceComment]] = []
+            with ThreadPoolExecutor(max_workers=MAX_COMMENT_WORKERS) as executor:
+                for batch in self._iter_comment_batches(page_id):
+                    if space_key is None:
+                        space_key = self._comment_space_key(page_id, batch)
+
+                    # Convert large batches in parallel while the next one loads
+                    if len(batch) < PARALLEL_COMMENT_THRESHOLD:
+                        comments.extend(
+                            self._process_comment(
+                                comment, space_key, return_markdown=return_markdown
+                            )
+                            for comment in batch
+                        )
+                    else:
+                        comments.extend(
+                            executor.submit(
+                                self._process_comment,
+                                comment,
+                                space_key,
+                                return_markdown=return_markdown,
+                            )
+                            for comment in batch
+                        )
+
+            return [
+                comment.result() if isinstance(comment, Future) else comment
+                for comment in comments
+            ]
 
         except KeyError as e:
             logger.error(f"Missing key in comment data: {str(e)}")
@@ -83,3 +84,94 @@ class CommentsMixin(ConfluenceClient):
             logger.error(f"Unexpected error fetching comments: {str(e)}")
             logger.debug("Full exception details for comments:", exc_info=True)
             return []
+
+    def _iter_comment_batches(self, page_id: str) -> Iterator[list[dict[str, Any]]]:
+        """
+        Fetch the comments of a page one result page at a time.
+
+        Args:
+            page_id: The ID of the page
+
+        Yields:
+            Lists of raw comment data in thread order
+        """
+        start = 0
+        while True:
+            response = self.confluence.get_page_comments(
+                content_id=page_id,
+                expand=COMMENT_EXPAND,
+                depth="all",
+                start=start,
+                limit=COMMENTS_PAGE_SIZE,
+            )
+            results = response["results"]
+            if results:
+                yield results
+            # The server links the next page while there are more comments
+            if not results or "next" not in response.get("_links", {}):
+                return
+            start += len(results)
+
+    def _comment_space_key(self, page_id: str, comments: list[dict[str, Any]]) -> str:
+        """
+        Determine the space key of a page's comments.
+
+        The key is taken from the expanded comment container, then from the
+        processed page cache, and only fetched from the page as a last resort.
+
+        Args:
+            page_id: The ID of the page
+            comments: Raw comment data of the page
+
+        Returns:
+            The space key of the page
+        """
+        for comment in comments:
+            space_key = comment.get("container", {}).get("space", {}).get("key")
+            if space_key:
+                return space_key
+
+        cached = self.page_content_cache.get((str(page_id), PAGE_EXPAND))
+        if cached:
+            space_key = cached[0].get("space", {}).get("key")
+            if space_key:
+                return space_key
+
+        page = self.confluence.get_page_by_id(page_id=page_id, expand="space")
+        return page.get("space", {}).get("key", "")
+
+    def _process_comment(
+        self, comment_data: dict[str, Any], space_key: str, *, return_markdown: bool
+    ) -> ConfluenceComment:
+        """
+        Convert a comment body and create its model.
+
+        Args:
+            comment_data: Raw comment data from the API
+            space_key: The space key of the page
+            return_markdown: Whether the body is returned as markdown or HTML
+
+        Returns:
+            ConfluenceComment model with the processed body
+        """
+        body = comment_data["body"]["view"]["value"]
+        processed_html, processed_markdown = self.preprocessor.process_html_content(
+            body, space_key=space_key, output="markdown" if return_markdown else "html"
+        )
+
+        # Copy the comment data and replace the body with the processed content
+        modified_comment_data = {
+            **comment_data,
+            "body": {
+                **comment_data["body"],
+                "view": {
+                    **comment_data["body"]["view"],
+                    "value": processed_markdown if return_markdown else processed_html,
+                },
+            },
+        }
+
+        return ConfluenceComment.from_api_response(
+            modified_comment_data,
+            base_url=self.config.url,
+        )
@@ -17,6 +17,8 @@ class ConfluenceConfig:
     api_token: str | None = None  # API token used as password
     personal_token: str | None = None  # Personal access token (Server/DC)
     ssl_verify: bool = True  # Whether to verify SSL certificates
+    cache_ttl: int = 300  # Seconds spaces and page lookups are cached
+    attachment_max_bytes: int = 50 * 1024 * 1024  # Size cap for attachment reads
 
     @property
     def is_cloud(self) -> bool:
@@ -80,6 +82,12 @@ class ConfluenceConfig:
         ssl_verify_env = os.getenv("CONFLUENCE_SSL_VERIFY", "true").lower()
         ssl_verify = ssl_verify_env not in ("false", "0", "no")
 
+        # Lifetime of the space index and page lookup caches (0 disables them)
+        cache_ttl = int(os.getenv("CONFLUENCE_CACHE_TTL", "300"))
+
+        # Largest attachment that is downloaded (0 removes the cap)
+        attachment_max_mb = int(os.getenv("CONFLUENCE_ATTACHMENT_MAX_MB", "50"))
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -87,4 +95,6 @@ class ConfluenceConfig:
             api_token=api_token,
             personal_token=personal_token,
             ssl_verify=ssl_verify,
+            cache_ttl=cache_ttl,
+            attachment_max_bytes=attachment_max_mb * 1024 * 1024,
         )
@@ -0,0 +1,233 @@
+"""Local full-text index over converted Confluence page content.
+
+Pages are added as they are fetched or synced and searched with SQLite FTS5
+ranked by bm25, so simple-term searches can be answered without a CQL round
+trip. The index is disabled unless ``CONFLUENCE_SEARCH_INDEX`` points to a
+database file.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from ..models.confluence import ConfluencePage, ConfluenceSpace
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Title matches weigh more than body matches when ranking
+TITLE_WEIGHT = 10.0
+CONTENT_WEIGHT = 1.0
+
+# Number of tokens around the matches included in a snippet
+SNIPPET_TOKENS = 24
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    page_id TEXT NOT NULL UNIQUE,
+    version INTEGER,
+    space_key TEXT NOT NULL,
+    space_name TEXT NOT NULL,
+    title TEXT NOT NULL,
+    url TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+    title, content, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def _match_expression(query: str) -> str | None:
+    """
+    Turn free text into an FTS5 query matching all of its terms.
+
+    Args:
+        query: Simple search terms as typed by the user
+
+    Returns:
+        FTS5 MATCH expression, or None if the query has no searchable terms
+    """
+    terms = _TERM_RE.findall(query)
+    if not terms:
+        return None
+    # Quote every term so words like AND/NOT or '*' are never FTS5 syntax
+    return " ".join(f'"{term}"' for term in terms)
+
+
+class SearchIndex:
+    """SQLite FTS5 index of page titles and markdown content."""
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Open (and create if needed) a search index.
+
+        Args:
+            path: Path of the SQLite database file, or ":memory:"
+        """
+        self.path = str(path) if str(path) == ":memory:" else Path(path).expanduser()
+        self._lock = threading.Lock()
+
+        if isinstance(self.path, Path):
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> "SearchIndex | None":
+        """
+        Create a search index from environment variables.
+
+        Returns:
+            The configured index, or None if CONFLUENCE_SEARCH_INDEX is not set
+            or the database cannot be opened
+        """
+        path = os.getenv("CONFLUENCE_SEARCH_INDEX")
+        if not path:
+            return None
+
+        try:
+            return cls(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open search index at {path}: {str(e)}")
+            return None
+
+    def __len__(self) -> int:
+        """Return the number of indexed pages."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def add(self, page: ConfluencePage, content: str | None = None) -> bool:
+        """
+        Index a page unless the same version is indexed already.
+
+        Args:
+            page: The page; its ID, version, title, space and URL are stored
+            content: The markdown content; defaults to page.content
+
+        Returns:
+            True if the page was (re)indexed, False if it was up to date
+        """
+        version = page.version.number if page.version else None
+        space_key = page.space.key if page.space else ""
+        space_name = page.space.name if page.space else ""
+        content = page.content if content is None else content
+
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT id, version FROM pages WHERE page_id = ?", (page.id,)
+                ).fetchone()
+                if row and version is not None and row[1] == version:
+                    return False
+
+                self._connection.execute("BEGIN")
+                try:
+                    if row:
+                        self._connection.execute(
+                            "DELETE FROM pages_fts WHERE rowid = ?", (row[0],)
+                        )
+                        self._connection.execute(
+                            "DELETE FROM pages WHERE id = ?", (row[0],)
+                        )
+                    rowid = self._connection.execute(
+                        "INSERT INTO pages "
+                        "(page_id, version, space_key, space_name, title, url) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (page.id, version, space_key, space_name, page.title, page.url),
+                    ).lastrowid
+                    self._connection.execute(
+                        "INSERT INTO pages_fts (rowid, title, content) "
+                        "VALUES (?, ?, ?)",
+                        (rowid, page.title, content),
+                    )
+                    self._connection.execute("COMMIT")
+                except sqlite3.Error:
+                    self._connection.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            logger.warning(f"Could not index page {page.id}: {str(e)}")
+            return False
+        return True
+
+    def remove(self, page_id: str) -> None:
+        """
+        Remove a page from the index.
+
+        Args:
+            page_id: The ID of the page
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT id FROM pages WHERE page_id = ?", (page_id,)
+            ).fetchone()
+            if row:
+                self._connection.execute(
+                    "DELETE FROM pages_fts WHERE rowid = ?", (row[0],)
+                )
+                self._connection.execute("DELETE FROM pages WHERE id = ?", (row[0],))
+
+    def search(
+        self, query: str, limit: int = 10, space_key: str | None = None
+    ) -> list[ConfluencePage]:
+        """
+        Search the index for pages containing all terms of the query.
+
+        Args:
+            query: Simple search terms
+            limit: Maximum number of results to return
+            space_key: Optional space to restrict the search to
+
+        Returns:
+            List of ConfluencePage models, best match first, whose content is a
+            snippet around the matches
+        """
+        expression = _match_expression(query)
+        if expression is None:
+            return []
+
+        sql = (
+            "SELECT p.page_id, p.space_key, p.space_name, p.title, p.url, "
+            "snippet(pages_fts, 1, '', '', '…', ?) "
+            "FROM pages_fts JOIN pages p ON p.id = pages_fts.rowid "
+            "WHERE pages_fts MATCH ?"
+        )
+        params: list[object] = [SNIPPET_TOKENS, expression]
+        if space_key:
+            sql += " AND p.space_key = ?"
+            params.append(space_key)
+        sql += " ORDER BY bm25(pages_fts, ?, ?) LIMIT ?"
+        params.extend([TITLE_WEIGHT, CONTENT_WEIGHT, limit])
+
+        try:
+            with self._lock:
+                rows = self._connection.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Local search for '{query}' failed: {str(e)}")
+            return []
+
+        return [
+            ConfluencePage(
+                id=page_id,
+                title=title,
+                space=ConfluenceSpace(key=space_key, name=space_name)
+                if space_key
+                else None,
+                content=snippet,
+                content_format="markdown",
+                url=url,
+            )
+            for page_id, space_key, space_name, title, url, snippet in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
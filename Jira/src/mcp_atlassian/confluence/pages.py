@@ -1,14 +1,74 @@
 """Module for Confluence page operations."""
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Literal, NamedTuple, get_args
 
 import requests
+from atlassian.errors import ApiError
 
 from ..models.confluence import ConfluencePage
+from ..preprocessing.base import ContentOutput
+from ..preprocessing.sections import split_storage_sections
 from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Fields expanded when fetching pages by ID and by title
+PAGE_EXPAND = "body.storage,version,space"
+TITLE_PAGE_EXPAND = "body.storage,version"
+
+
+# How update_page combines the new body with the current one
+PageUpdateMode = Literal["replace", "append", "prepend"]
+
+# Upper bound for concurrent requests while crawling a page tree
+MAX_TREE_WORKERS = 8
+
+# Number of child pages requested per page of results
+CHILDREN_PAGE_SIZE = 50
+
+
+def _version_number(page: dict) -> int | None:
+    """Return the version number of raw page data, if present."""
+    return (page.get("version") or {}).get("number")
+
+
+def _has_output(processed: tuple[dict, str, str], output: ContentOutput) -> bool:
+    """Return whether processed page content includes the requested formats."""
+    _, processed_html, processed_markdown = processed
+    return (bool(processed_html) or output == "markdown") and (
+        bool(processed_markdown) or output == "html"
+    )
+
+
+def _page_space_key(page: dict) -> str:
+    """Return the space key of a page, also when its space wasn't expanded."""
+    if space_key := (page.get("space") or {}).get("key"):
+        return space_key
+    # Unexpanded, the space is a link like /rest/api/space/KEY
+    space_link = page.get("_expandable", {}).get("space") or ""
+    return space_link.rstrip("/").rpartition("/")[2]
+
+
+class PageTreeNode(NamedTuple):
+    """A page visited while crawling a page tree."""
+
+    page: ConfluencePage
+    depth: int
+    parent_id: str | None
+
+
+class PageSection(NamedTuple):
+    """A section of a page, starting at a heading."""
+
+    index: int
+    level: int
+    title: str
+    size: int  # Length of the section in storage format
+    content: str | None  # Converted content, if it was requested
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
@@ -27,13 +87,10 @@ class PagesMixin(ConfluenceClient):
         Returns:
             ConfluencePage model containing the page content and metadata
         """
-        page = self.confluence.get_page_by_id(
-            page_id=page_id, expand="body.storage,version,space"
-        )
-        space_key = page.get("space", {}).get("key", "")
-        content = page["body"]["storage"]["value"]
-        processed_html, processed_markdown = self.preprocessor.process_html_content(
-            content, space_key=space_key
+        page, processed_html, processed_markdown = self._get_processed_page(
+            page_id,
+            PAGE_EXPAND,
+            output="markdown" if convert_to_markdown else "html",
         )
 
         # Use the appropriate content format based on the convert_to_markdown flag
@@ -49,6 +106,64 @@ class PagesMixin(ConfluenceClient):
             content_format="storage" if not convert_to_markdown else "markdown",
         )
 
+    def get_page_sections(
+        self,
+        page_id: str,
+        start: int | None = None,
+        end: int | None = None,
+        *,
+        convert_to_markdown: bool = True,
+    ) -> tuple[ConfluencePage, list[PageSection]]:
+        """
+        Get the sections of a page, converting only the requested ones.
+
+        Sections start at the top-level headings of the page. Each requested
+        section is parsed and converted on its own, so memory use grows with
+        the size of the sections rather than the size of the page.
+
+        Args:
+            page_id: The ID of the page
+            start: Index of the first section to convert; None only lists them
+            end: Index of the last section to convert; defaults to start
+            convert_to_markdown: When True, returns content in markdown format,
+                               otherwise returns raw HTML (keyword-only)
+
+        Returns:
+            Tuple of the page model without content and all of its sections
+        """
+        page = self._get_current_page(page_id, fetch=True)
+        body = page["body"]["storage"]["value"]
+        space_key = _page_space_key(page)
+        if end is None:
+            end = start
+
+        sections = []
+        for section in split_storage_sections(body):
+            content = None
+            if start is not None and start <= section.index <= end:
+                processed_html, processed_markdown = (
+                    self.preprocessor.process_html_content(
+                        body[section.start : section.end],
+                        space_key=space_key,
+                        output="markdown" if convert_to_markdown else "html",
+                    )
+                )
+                content = processed_markdown if convert_to_markdown else processed_html
+            sections.append(
+                PageSection(
+                    section.index,
+                    section.level,
+                    section.title,
+                    section.end - section.start,
+                    content,
+                )
+            )
+
+        page_model = ConfluencePage.from_api_response(
+            page, base_url=self.config.url, include_body=False
+        )
+        return page_model, sections
+
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
         Get ancestors (parent pages) of a specific page.
@@ -97,32 +212,29 @@ class PagesMixin(ConfluenceClient):
             ConfluencePage model containing the page content and metadata, or None if not found
         """
         try:
-            # First check if the space exists
-            spaces = self.confluence.get_all_spaces(start=0, limit=500)
-
-            # Handle case where spaces can be a dictionary with a "results" key
-            if isinstance(spaces, dict) and "results" in spaces:
-                space_keys = [s["key"] for s in spaces["results"]]
-            else:
-                space_keys = [s["key"] for s in spaces]
-
-            if space_key not in space_keys:
+            # First check if the space exists, using the cached space index
+            if self.space_index.get(space_key) is None:
                 logger.warning(f"Space {space_key} not found")
                 return None
 
-            # Then try to find the page by title
-            page = self.confluence.get_page_by_title(
-                space=space_key, title=title, expand="body.storage,version"
-            )
+            # Then try to find the page by title, by ID if we resolved it before
+            output = "markdown" if convert_to_markdown else "html"
+            processed = self._get_page_by_cached_title(space_key, title, output)
+            if processed is None:
+                page = self.confluence.get_page_by_title(
+                    space=space_key, title=title, expand=TITLE_PAGE_EXPAND
+                )
 
-            if not page:
-                logger.warning(f"Page '{title}' not found in space {space_key}")
-                return None
+                if not page:
+                    logger.warning(f"Page '{title}' not found in space {space_key}")
+                    return None
 
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
-            )
+                processed = self._process_page(
+                    page, TITLE_PAGE_EXPAND, space_key, output=output
+                )
+
+            page, processed_html, processed_markdown = processed
+            self.page_id_cache.set((space_key, title), page["id"])
 
             # Use the appropriate content format based on the convert_to_markdown flag
             page_content = processed_markdown if convert_to_markdown else processed_html
@@ -152,6 +264,140 @@ class PagesMixin(ConfluenceClient):
             logger.debug("Full exception details:", exc_info=True)
             return None
 
+    def _get_page_by_cached_title(
+        self, space_key: str, title: str, output: ContentOutput = "both"
+    ) -> tuple[dict, str, str] | None:
+        """
+        Fetch a page by the ID a previous title lookup resolved to.
+
+        Args:
+            space_key: The key of the space containing the page
+            title: The title of the page
+            output: Content formats to convert: "both", "html" or "markdown"
+
+        Returns:
+            Tuple of (page, processed_html, processed_markdown), or None if the
+            title is not cached or the page was deleted or renamed since
+        """
+        page_id = self.page_id_cache.get((space_key, title))
+        if page_id is None:
+            return None
+
+        try:
+            probe = self.confluence.get_page_by_id(page_id=page_id, expand="version")
+        except (ApiError, requests.RequestException) as e:
+            logger.debug(f"Cached page {page_id} for '{title}' is gone: {str(e)}")
+            probe = None
+
+        moved = probe and probe.get("space", {}).get("key", space_key) != space_key
+        if not probe or probe.get("title") != title or moved:
+            self.page_id_cache.pop((space_key, title))
+            return None
+        return self._get_processed_page(
+            page_id, TITLE_PAGE_EXPAND, output=output, space_key=space_key, probe=probe
+        )
+
+    def _get_processed_page(
+        self,
+        page_id: str,
+        expand: str,
+        *,
+        output: ContentOutput = "both",
+        space_key: str | None = None,
+        probe: dict | None = None,
+    ) -> tuple[dict, str, str]:
+        """
+        Fetch a page and its processed content, reusing unchanged cached content.
+
+        A cached page is revalidated with a version-only request, so an
+        unchanged page skips both the body transfer and the HTML conversion.
+        A format that was not converted for an earlier read is converted from
+        the cached body.
+
+        Args:
+            page_id: The ID of the page
+            expand: Fields to expand when the page has to be fetched
+            output: Content formats to convert: "both", "html" or "markdown";
+                the other format may be empty
+            space_key: Space key for processing; defaults to the page's space
+            probe: Page data with the current version, if already fetched
+
+        Returns:
+            Tuple of (page, processed_html, processed_markdown)
+        """
+        cached = self.page_content_cache.get((str(page_id), expand))
+        if cached is not None:
+            if probe is None:
+                probe = self.confluence.get_page_by_id(
+                    page_id=page_id, expand="version"
+                )
+            if _version_number(probe) == _version_number(cached[0]):
+                if _has_output(cached, output):
+                    return cached
+                return self._process_page(
+                    cached[0], expand, space_key, output=output, cached=cached
+                )
+
+        page = self.confluence.get_page_by_id(page_id=page_id, expand=expand)
+        return self._process_page(page, expand, space_key, output=output)
+
+    def _process_page(
+        self,
+        page: dict,
+        expand: str,
+        space_key: str | None = None,
+        *,
+        output: ContentOutput = "both",
+        cached: tuple[dict, str, str] | None = None,
+    ) -> tuple[dict, str, str]:
+        """
+        Convert the storage body of a page and cache the result by version.
+
+        Args:
+            page: Raw page data including body.storage
+            expand: Fields that were expanded when fetching the page
+            space_key: Space key for processing; defaults to the page's space
+            output: Content formats to convert: "both", "html" or "markdown"
+            cached: Processed content of the same page version, whose
+                formats are kept and not converted again
+
+        Returns:
+            Tuple of (page, processed_html, processed_markdown)
+        """
+        if space_key is None:
+            space_key = _page_space_key(page)
+        if cached is not None:
+            # Only convert the formats missing from the cached content
+            needs_html = output != "markdown" and not cached[1]
+            needs_markdown = output != "html" and not cached[2]
+            if not needs_html:
+                output = "markdown"
+            elif not needs_markdown:
+                output = "html"
+        content = page["body"]["storage"]["value"]
+        processed_html, processed_markdown = self.preprocessor.process_html_content(
+            content, space_key=space_key, output=output
+        )
+        if cached is not None:
+            processed_html = processed_html or cached[1]
+            processed_markdown = processed_markdown or cached[2]
+
+        processed = (page, processed_html, processed_markdown)
+        if "id" in page and _version_number(page) is not None:
+            self.page_content_cache.set((str(page["id"]), expand), processed)
+            # Pages are indexed once their Markdown has been converted anyway
+            if self.search_index is not None and processed_markdown:
+                space = page.get("space") or {"key": space_key, "name": space_key}
+                self._index_page(
+                    ConfluencePage.from_api_response(
+                        {**page, "space": space},
+                        base_url=self.config.url,
+                        include_body=False,
+                    ),
+                    processed_markdown,
+                )
+        return processed
+
     def get_space_pages(
         self,
         space_key: str,
@@ -181,7 +427,9 @@ class PagesMixin(ConfluenceClient):
         for page in pages:
             content = page["body"]["storage"]["value"]
             processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
+                content,
+                space_key=space_key,
+                output="markdown" if convert_to_markdown else "html",
             )
 
             # Use the appropriate content format based on the convert_to_markdown flag
@@ -273,10 +521,14 @@ class PagesMixin(ConfluenceClient):
         is_minor_edit: bool = False,
         version_comment: str = "",
         is_markdown: bool = True,
+        mode: PageUpdateMode = "replace",
     ) -> ConfluencePage:
         """
         Update an existing page in Confluence.
 
+        No new version is created if the update leaves the title and the
+        storage body unchanged, e.g. when the same update is sent again.
+
         Args:
             page_id: The ID of the page to update
             title: The new title of the page
@@ -284,6 +536,9 @@ class PagesMixin(ConfluenceClient):
             is_minor_edit: Whether this is a minor edit (keyword-only)
             version_comment: Optional comment for this version (keyword-only)
             is_markdown: Whether the body content is in markdown format (default: True, keyword-only)
+            mode: "replace" the page content with body, or "append"/"prepend"
+                body to the current content, which converts only body
+                (keyword-only)
 
         Returns:
             ConfluencePage model containing the updated page's data
@@ -292,6 +547,10 @@ class PagesMixin(ConfluenceClient):
             Exception: If there is an error updating the page
         """
         try:
+            if mode not in get_args(PageUpdateMode):
+                error_msg = f"Invalid update mode: {mode}"
+                raise ValueError(error_msg)
+
             # Convert markdown to Confluence storage format if needed
             storage_body = (
                 self.preprocessor.markdown_to_confluence_storage(body)
@@ -299,6 +558,20 @@ class PagesMixin(ConfluenceClient):
                 else body
             )
 
+            # Appending needs the current body; replacing only compares it
+            # when it is cached
+            current = self._get_current_page(page_id, fetch=mode != "replace")
+            if current is not None:
+                current_body = current["body"]["storage"]["value"]
+                if mode == "append":
+                    storage_body = current_body + storage_body
+                elif mode == "prepend":
+                    storage_body = storage_body + current_body
+
+                if storage_body == current_body and current.get("title") == title:
+                    logger.debug(f"Page {page_id} is unchanged, skipping update")
+                    return self.get_page_content(page_id)
+
             # We'll let the underlying Confluence API handle this operation completely
             # as it has internal logic for versioning and updating
             logger.debug(f"Updating page {page_id} with title '{title}'")
@@ -321,6 +594,37 @@ class PagesMixin(ConfluenceClient):
             logger.error(f"Error updating page {page_id}: {str(e)}")
             raise Exception(f"Failed to update page {page_id}: {str(e)}") from e
 
+    def _get_current_page(self, page_id: str, *, fetch: bool) -> dict | None:
+        """
+        Get the raw data of a page with its current storage body.
+
+        A page read before is taken from the content cache after checking
+        that its version is still current. A fetched page is cached without
+        converted content, so that later calls only send the version check.
+
+        Args:
+            page_id: The ID of the page
+            fetch: Whether to fetch the page if it is not cached
+
+        Returns:
+            Raw page data including body.storage, or None if the page is not
+            cached and fetch is False
+        """
+        cached = self.page_content_cache.get(
+            (str(page_id), PAGE_EXPAND)
+        ) or self.page_content_cache.get((str(page_id), TITLE_PAGE_EXPAND))
+        if cached is not None:
+            probe = self.confluence.get_page_by_id(page_id=page_id, expand="version")
+            if _version_number(probe) == _version_number(cached[0]):
+                return cached[0]
+
+        if not fetch:
+            return None
+        page = self.confluence.get_page_by_id(page_id=page_id, expand=PAGE_EXPAND)
+        if _version_number(page) is not None:
+            self.page_content_cache.set((str(page_id), PAGE_EXPAND), (page, "", ""))
+        return page
+
     def get_page_children(
         self,
         page_id: str,
@@ -373,7 +677,7 @@ class PagesMixin(ConfluenceClient):
                     content = page.get("body", {}).get("storage", {}).get("value", "")
                     if content:
                         _, processed_markdown = self.preprocessor.process_html_content(
-                            content, space_key=space_key
+                            content, space_key=space_key, output="markdown"
                         )
                         content_override = processed_markdown
 
@@ -395,6 +699,128 @@ class PagesMixin(ConfluenceClient):
             logger.debug("Full exception details:", exc_info=True)
             return []
 
+    def iter_page_tree(
+        self,
+        page_id: str,
+        *,
+        max_depth: int = 3,
+        max_pages: int = 50,
+        max_workers: int = 4,
+        include_content: bool = True,
+        convert_to_markdown: bool = True,
+    ) -> Iterator[PageTreeNode]:
+        """
+        Crawl a page and its descendants breadth-first.
+
+        Pages are fetched and converted concurrently and yielded as soon as they
+        are ready, so the order follows completion rather than the tree. Every
+        page is visited at most once.
+
+        Args:
+            page_id: The ID of the root page
+            max_depth: Maximum depth below the root page (0 = root page only)
+            max_pages: Maximum number of pages to visit, including the root
+            max_workers: Maximum number of concurrent requests
+            include_content: Whether to fetch and convert the page bodies
+            convert_to_markdown: When True, returns content in markdown format,
+                               otherwise returns raw HTML (keyword-only)
+
+        Yields:
+            PageTreeNode for each visited page; pages that fail to load are
+            logged and skipped together with their descendants
+        """
+        root_id = str(page_id)
+        seen = {root_id}
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, MAX_TREE_WORKERS))
+        )
+
+        def submit(node_id: str, depth: int) -> Future:
+            return executor.submit(
+                self._fetch_tree_node,
+                node_id,
+                children_limit=max_pages if depth < max_depth else 0,
+                include_content=include_content,
+                convert_to_markdown=convert_to_markdown,
+            )
+
+        pending = {submit(root_id, 0): (root_id, 0, None)}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_id, depth, parent_id = pending.pop(future)
+                    try:
+                        page, child_ids = future.result()
+                    except Exception as e:  # noqa: BLE001 - Skip the failed subtree
+                        logger.warning(f"Skipping page {node_id} in tree: {str(e)}")
+                        continue
+
+                    # Schedule the children before handing out the page
+                    for child_id in child_ids:
+                        if child_id in seen or len(seen) >= max_pages:
+                            continue
+                        seen.add(child_id)
+                        pending[submit(child_id, depth + 1)] = (
+                            child_id,
+                            depth + 1,
+                            node_id,
+                        )
+
+                    yield PageTreeNode(page, depth, parent_id)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_tree_node(
+        self,
+        page_id: str,
+        *,
+        children_limit: int,
+        include_content: bool,
+        convert_to_markdown: bool,
+    ) -> tuple[ConfluencePage, list[str]]:
+        """
+        Fetch one page of a page tree together with the IDs of its children.
+
+        Args:
+            page_id: The ID of the page
+            children_limit: Maximum number of child IDs to list (0 = none)
+            include_content: Whether to fetch and convert the page body
+            convert_to_markdown: Whether to convert the body to markdown
+
+        Returns:
+            Tuple of (page model, child page IDs)
+        """
+        if include_content:
+            page = self.get_page_content(
+                page_id, convert_to_markdown=convert_to_markdown
+            )
+        else:
+            page = ConfluencePage.from_api_response(
+                self.confluence.get_page_by_id(page_id=page_id, expand="version,space"),
+                base_url=self.config.url,
+                include_body=False,
+            )
+
+        child_ids: list[str] = []
+        try:
+            while len(child_ids) < children_limit:
+                results = self.confluence.get_page_child_by_type(
+                    page_id=page_id,
+                    type="page",
+                    start=len(child_ids),
+                    limit=CHILDREN_PAGE_SIZE,
+                )
+                if isinstance(results, dict):
+                    results = results.get("results", [])
+                child_ids.extend(str(child["id"]) for child in results or [])
+                if len(results or []) < CHILDREN_PAGE_SIZE:
+                    break
+        except (ApiError, KeyError, TypeError, requests.RequestException) as e:
+            logger.warning(f"Could not list child pages of {page_id}: {str(e)}")
+
+        return page, child_ids[:children_limit]
+
     def delete_page(self, page_id: str) -> bool:
         """
         Delete a Confluence page by its ID.
@@ -411,6 +837,8 @@ class PagesMixin(ConfluenceClient):
         try:
             logger.debug(f"Deleting page {page_id}")
             response = self.confluence.remove_page(page_id=page_id)
+            if self.search_index is not None:
+                self.search_index.remove(str(page_id))
 
             # The Atlassian library's remove_page returns the raw response from
             # the REST API call. For a successful deletion, we should get a
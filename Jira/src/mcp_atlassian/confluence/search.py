@@ -1,6 +1,7 @@
 """Module for Confluence search operations."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
@@ -9,6 +10,10 @@ from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Number of excerpts from which they are converted in parallel
+PARALLEL_EXCERPT_THRESHOLD = 20
+MAX_EXCERPT_WORKERS = 8
+
 
 class SearchMixin(ConfluenceClient):
     """Mixin for Confluence search operations."""
@@ -28,34 +33,32 @@ class SearchMixin(ConfluenceClient):
             # Execute the CQL search query
             results = self.confluence.cql(cql=cql, limit=limit)
 
-            # Convert the response to a search result model
+            # Convert the response to a search result model; this also
+            # collects the raw excerpt of every result by content ID
             search_result = ConfluenceSearchResult.from_api_response(
                 results, base_url=self.config.url, cql_query=cql
             )
 
             # Process result excerpts as content
-            processed_pages = []
-            for page in search_result.results:
-                # Get the excerpt from the original search results
-                for result_item in results.get("results", []):
-                    if result_item.get("content", {}).get("id") == page.id:
-                        excerpt = result_item.get("excerpt", "")
-                        if excerpt:
-                            # Process the excerpt as HTML content
-                            space_key = page.space.key if page.space else ""
-                            processed_html, processed_markdown = (
-                                self.preprocessor.process_html_content(
-                                    excerpt, space_key=space_key
-                                )
-                            )
-                            # Create a new page with processed content
-                            page.content = processed_markdown
-                        break
-
-                processed_pages.append(page)
+            pages_with_excerpts = [
+                page
+                for page in search_result.results
+                if page.id in search_result.excerpts
+            ]
+            contents = self._convert_excerpts(
+                [
+                    (
+                        search_result.excerpts[page.id],
+                        page.space.key if page.space else "",
+                    )
+                    for page in pages_with_excerpts
+                ]
+            )
+            for page, content in zip(pages_with_excerpts, contents, strict=True):
+                page.content = content
 
             # Return the list of result pages with processed content
-            return processed_pages
+            return search_result.results
         except KeyError as e:
             logger.error(f"Missing key in search results: {str(e)}")
             return []
@@ -69,3 +72,71 @@ class SearchMixin(ConfluenceClient):
             logger.error(f"Unexpected error during search: {str(e)}")
             logger.debug("Full exception details for search:", exc_info=True)
             return []
+
+    def search_text(
+        self, query: str, limit: int = 10, space_key: str | None = None
+    ) -> list[ConfluencePage]:
+        """
+        Search content for simple terms.
+
+        The local search index answers the query if it is configured, has
+        matches, and holds every page of the searched space, as after a
+        complete space snapshot sync. Otherwise it may be missing pages that
+        were never read, and the terms are searched remotely with a CQL text
+        query.
+
+        Args:
+            query: Simple search terms, e.g. 'project documentation'
+            limit: Maximum number of results to return
+            space_key: Optional space to restrict the search to
+
+        Returns:
+            List of ConfluencePage models containing search results
+        """
+        if self.search_index is not None and self._index_covers(space_key):
+            pages = self.search_index.search(query, limit=limit, space_key=space_key)
+            if pages:
+                logger.debug(f"Answered search for '{query}' from the local index")
+                return pages
+
+        # This will search in all content (title, body, etc.)
+        cql = f'text ~ "{query}"'
+        if space_key:
+            cql += f' AND space = "{space_key}"'
+        logger.info(f"Converting simple search term to CQL: {cql}")
+        return self.search(cql, limit=limit)
+
+    def _index_covers(self, space_key: str | None) -> bool:
+        """Return whether every page of a space was synced into the index."""
+        if not space_key:
+            return False
+        snapshot = self.space_snapshots.get(space_key)
+        return snapshot is not None and snapshot.complete
+
+    def _convert_excerpts(self, excerpts: list[tuple[str, str]]) -> list[str]:
+        """
+        Convert search excerpts to markdown.
+
+        Plain-text excerpts take the preprocessor's fast path. Large result
+        sets are converted on a thread pool so that user lookups for mentions
+        in different excerpts overlap.
+
+        Args:
+            excerpts: List of (excerpt HTML, space key) tuples
+
+        Returns:
+            The markdown of each excerpt, in the same order
+        """
+
+        def convert(item: tuple[str, str]) -> str:
+            excerpt, space_key = item
+            _, processed_markdown = self.preprocessor.process_html_content(
+                excerpt, space_key=space_key, output="markdown"
+            )
+            return processed_markdown
+
+        if len(excerpts) < PARALLEL_EXCERPT_THRESHOLD:
+            return [convert(item) for item in excerpts]
+
+        with ThreadPoolExecutor(max_workers=MAX_EXCERPT_WORKERS) as executor:
+            return list(executor.map(convert, excerpts))
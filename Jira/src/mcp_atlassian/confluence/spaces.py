@@ -1,14 +1,32 @@
 """Module for Confluence space operations."""
 
 import logging
-from typing import cast
+import math
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, cast
 
 import requests
 
+from ..models.confluence import ConfluencePage
+from .cache import SpaceSnapshot
 from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Number of CQL results requested per page when syncing a space snapshot
+SNAPSHOT_PAGE_SIZE = 50
+
+# Extra minutes queried before the watermark, as CQL dates have minute precision
+WATERMARK_MARGIN_MINUTES = 2
+
+# Seconds between listings of all page IDs to drop deleted pages from a snapshot
+RECONCILE_INTERVAL = 3600
+
+# Maximum number of most recently modified pages kept in a space snapshot
+SNAPSHOT_MAX_PAGES = 500
+
 
 class SpacesMixin(ConfluenceClient):
     """Mixin for Confluence space operations."""
@@ -28,6 +46,31 @@ class SpacesMixin(ConfluenceClient):
         # Cast the return value to the expected type
         return cast(dict[str, object], spaces)
 
+    def get_space(self, space_key: str) -> dict[str, object] | None:
+        """
+        Get a space by key from the cached space index.
+
+        Args:
+            space_key: The key of the space
+
+        Returns:
+            Space information as returned by the space list, or None if the
+            space does not exist
+        """
+        return self.space_index.get(space_key)
+
+    def space_exists(self, space_key: str) -> bool:
+        """
+        Check whether a space exists using the cached space index.
+
+        Args:
+            space_key: The key of the space
+
+        Returns:
+            True if the space exists, False otherwise
+        """
+        return space_key in self.space_index
+
     def get_user_contributed_spaces(self, limit: int = 250) -> dict:
         """
         Get spaces the current user has contributed to.
@@ -98,3 +141,183 @@ class SpacesMixin(ConfluenceClient):
             logger.error(f"Unexpected error fetching Confluence spaces: {str(e)}")
             logger.debug("Full exception details for Confluence spaces:", exc_info=True)
             return {}
+
+    def get_space_snapshot(self, space_key: str) -> SpaceSnapshot | None:
+        """
+        Get the snapshot of a space if it has been synced at least once.
+
+        Args:
+            space_key: The key of the space
+
+        Returns:
+            The space snapshot, or None if the space has not been synced yet
+        """
+        snapshot = self.space_snapshots.get(space_key)
+        return snapshot if snapshot is not None and snapshot.synced_at else None
+
+    def sync_space_snapshot_in_background(self, space_key: str) -> None:
+        """
+        Start syncing the snapshot of a space on a background thread.
+
+        Nothing is started while a sync of the space is already running.
+
+        Args:
+            space_key: The key of the space
+        """
+        snapshot = self.space_snapshots.get(space_key)
+        if snapshot is not None and snapshot.lock.locked():
+            return
+        threading.Thread(
+            target=self.sync_space_snapshot,
+            args=(space_key,),
+            name=f"confluence-space-sync-{space_key}",
+            daemon=True,
+        ).start()
+
+    def sync_space_snapshot(
+        self, space_key: str, max_pages: int = SNAPSHOT_MAX_PAGES
+    ) -> SpaceSnapshot:
+        """
+        Bring the local snapshot of a space up to date.
+
+        The first sync fetches the max_pages most recently modified pages of
+        the space. Later syncs only ask for pages modified since the previous
+        sync, and pages whose version did not change are not converted again.
+        Deleted pages are dropped by an ID-only listing at most once per
+        RECONCILE_INTERVAL.
+
+        Args:
+            space_key: The key of the space
+            max_pages: Maximum number of pages kept in the snapshot
+
+        Returns:
+            The space snapshot; on errors the snapshot from the last successful
+            sync is returned
+        """
+        snapshot = self.space_snapshots.get(space_key)
+        if snapshot is None:
+            snapshot = SpaceSnapshot(space_key)
+            self.space_snapshots.set(space_key, snapshot)
+        with snapshot.lock:
+            started = time.time()
+            space_cql = f'space = "{space_key}" AND type = page'
+            cql = space_cql
+            if snapshot.synced_at:
+                # Relative dates avoid any dependence on the user's time zone
+                minutes = math.ceil((started - snapshot.synced_at) / 60)
+                minutes += WATERMARK_MARGIN_MINUTES
+                cql += f' AND lastmodified >= now("-{minutes}m")'
+
+            try:
+                # Newest first: pages modified while paging move to the front,
+                # so shifting results can only repeat pages, never skip them
+                updated = fetched = 0
+                truncated = False
+                for result in self._iter_cql_results(
+                    f"{cql} ORDER BY lastmodified DESC",
+                    expand="content.body.storage,content.version",
+                ):
+                    # Older pages would fall out of the snapshot anyway
+                    if fetched == max_pages:
+                        truncated = True
+                        break
+                    fetched += 1
+                    updated += self._update_snapshot_page(snapshot, result)
+
+                if started - snapshot.reconciled_at >= RECONCILE_INTERVAL:
+                    if snapshot.synced_at:
+                        dropped = snapshot.retain(
+                            {
+                                str(result["content"]["id"])
+                                for result in self._iter_cql_results(space_cql)
+                            }
+                        )
+                        if self.search_index is not None:
+                            for page_id in dropped:
+                                self.search_index.remove(page_id)
+                    snapshot.reconciled_at = started
+
+                trimmed = snapshot.trim(max_pages)
+                snapshot.complete = (
+                    snapshot.complete or not snapshot.synced_at
+                ) and not (truncated or trimmed)
+                snapshot.synced_at = started
+                logger.debug(
+                    f"Synced space {space_key}: {updated} updated, "
+                    f"{len(snapshot.pages)} pages"
+                )
+            except KeyError as e:
+                logger.error(f"Missing key in space {space_key} pages: {str(e)}")
+            except requests.RequestException as e:
+                logger.error(f"Network error when syncing space {space_key}: {str(e)}")
+            except (ValueError, TypeError) as e:
+                logger.error(f"Error processing pages of space {space_key}: {str(e)}")
+            except Exception as e:  # noqa: BLE001 - Keep the last good snapshot
+                logger.error(f"Unexpected error syncing space {space_key}: {str(e)}")
+                logger.debug("Full exception details for space sync:", exc_info=True)
+
+        return snapshot
+
+    def _update_snapshot_page(
+        self, snapshot: SpaceSnapshot, result: dict[str, Any]
+    ) -> bool:
+        """
+        Convert a CQL search result into the snapshot unless it is unchanged.
+
+        Args:
+            snapshot: The snapshot to update
+            result: CQL search result with content.body.storage and content.version
+
+        Returns:
+            True if the page was added or updated, False if it was unchanged
+        """
+        content = result["content"]
+        page_id = str(content["id"])
+        version = (content.get("version") or {}).get("number")
+        if version is not None and version == snapshot.version_of(page_id):
+            return False
+
+        _, processed_markdown = self.preprocessor.process_html_content(
+            content["body"]["storage"]["value"],
+            space_key=snapshot.space_key,
+            output="markdown",
+        )
+        content.setdefault(
+            "space", {"key": snapshot.space_key, "name": snapshot.space_key}
+        )
+        page = ConfluencePage.from_api_response(
+            content,
+            base_url=self.config.url,
+            include_body=True,
+            content_override=processed_markdown,
+            content_format="markdown",
+        )
+        snapshot.put(page, result.get("lastModified", ""))
+        self._index_page(page, processed_markdown)
+        return True
+
+    def _iter_cql_results(
+        self, cql: str, expand: str | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all results of a CQL query, page by page.
+
+        Args:
+            cql: Confluence Query Language string
+            expand: Fields to expand in the results
+
+        Yields:
+            Raw CQL search results
+        """
+        start = 0
+        while True:
+            response = self.confluence.cql(
+                cql=cql, start=start, limit=SNAPSHOT_PAGE_SIZE, expand=expand
+            )
+            results = response.get("results", [])
+            yield from results
+
+            # The server may cap the page size below what was requested
+            if not results or len(results) < response.get("limit", SNAPSHOT_PAGE_SIZE):
+                return
+            start += len(results)
@@ -4,6 +4,7 @@ import logging
 
 from atlassian import Jira
 
+from mcp_atlassian.json_codec import configure_json_decoding
 from mcp_atlassian.preprocessing import JiraPreprocessor
 from mcp_atlassian.utils import configure_ssl_verification
 
@@ -53,6 +54,9 @@ class JiraClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Decode responses with the fast JSON codec when available
+        configure_json_decoding(self.jira._session)
+
         # Initialize the text preprocessor for text processing capabilities
         self.preprocessor = JiraPreprocessor(base_url=self.config.url)
 
@@ -577,16 +577,20 @@ class EpicsMixin(UsersMixin):
                 raise Exception(f"Error linking issue to epic: {str(e)}")
             raise
 
-    def get_epic_issues(self, epic_key: str, limit: int = 50) -> list[JiraIssue]:
+    def get_epic_issues(
+        self, epic_key: str, limit: int = 50, *, simplified: bool = False
+    ) -> list[JiraIssue] | list[dict[str, Any]]:
         """
         Get all issues linked to a specific epic.
 
         Args:
             epic_key: The key of the epic (e.g. 'PROJ-123')
             limit: Maximum number of issues to return
+            simplified: Return simplified issue dictionaries instead of models
 
         Returns:
-            List of JiraIssue models representing the issues linked to the epic
+            List of JiraIssue models (or simplified dictionaries) representing
+            the issues linked to the epic
 
         Raises:
             ValueError: If the issue is not an Epic
@@ -627,7 +631,9 @@ class EpicsMixin(UsersMixin):
 
                     # If we have search_issues method available, use it
                     if hasattr(self, "search_issues") and callable(self.search_issues):
-                        issues = self.search_issues(jql, limit=limit)
+                        issues = self.search_issues(
+                            jql, limit=limit, simplified=simplified
+                        )
                         if issues:
                             logger.info(
                                 f"Successfully found {len(issues)} issues for epic {epic_key} using issueFunction"
@@ -647,7 +653,9 @@ class EpicsMixin(UsersMixin):
                     logger.info(
                         f"Trying to get epic issues with parent relationship: {jql}"
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, limit)
+                    issues = self._get_epic_issues_by_jql(
+                        epic_key, jql, limit, simplified=simplified
+                    )
                     if issues:
                         logger.info(
                             f"Successfully found {len(issues)} issues for epic {epic_key} using parent relationship"
@@ -666,7 +674,9 @@ class EpicsMixin(UsersMixin):
                     logger.info(
                         f"Trying to get epic issues with epic link field: {jql}"
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, limit)
+                    issues = self._get_epic_issues_by_jql(
+                        epic_key, jql, limit, simplified=simplified
+                    )
                     if issues:
                         logger.info(
                             f"Successfully found {len(issues)} issues for epic {epic_key} using epic link field {epic_link_field}"
@@ -685,7 +695,9 @@ class EpicsMixin(UsersMixin):
                     logger.info(
                         f"Trying to get epic issues with 'Epic Link' field name: {jql}"
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, limit)
+                    issues = self._get_epic_issues_by_jql(
+                        epic_key, jql, limit, simplified=simplified
+                    )
                     if issues:
                         logger.info(
                             f"Successfully found {len(issues)} issues for epic {epic_key} using 'Epic Link' field name"
@@ -706,7 +718,9 @@ class EpicsMixin(UsersMixin):
                             f"Trying to get epic issues with issue links: {jql}"
                         )
                         try:
-                            issues = self._get_epic_issues_by_jql(epic_key, jql, limit)
+                            issues = self._get_epic_issues_by_jql(
+                                epic_key, jql, limit, simplified=simplified
+                            )
                             if issues:
                                 logger.info(
                                     f"Successfully found {len(issues)} issues for epic {epic_key} using issue links with type '{link_type}'"
@@ -741,7 +755,9 @@ class EpicsMixin(UsersMixin):
                         logger.info(
                             f"Trying to get epic issues with common field ID: {jql}"
                         )
-                        issues = self._get_epic_issues_by_jql(epic_key, jql, limit)
+                        issues = self._get_epic_issues_by_jql(
+                            epic_key, jql, limit, simplified=simplified
+                        )
                         if issues:
                             logger.info(
                                 f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
@@ -928,8 +944,8 @@ class EpicsMixin(UsersMixin):
         return []
 
     def _get_epic_issues_by_jql(
-        self, epic_key: str, jql: str, limit: int
-    ) -> list[JiraIssue]:
+        self, epic_key: str, jql: str, limit: int, *, simplified: bool = False
+    ) -> list[JiraIssue] | list[dict[str, Any]]:
         """
         Helper method to get issues using a JQL query.
 
@@ -937,13 +953,14 @@ class EpicsMixin(UsersMixin):
             epic_key: The key of the epic
             jql: JQL query to execute
             limit: Maximum number of issues to return
+            simplified: Return simplified issue dictionaries instead of models
 
         Returns:
-            List of JiraIssue models
+            List of JiraIssue models (or simplified dictionaries)
         """
         # Try to use search_issues if available
         if hasattr(self, "search_issues") and callable(self.search_issues):
-            issues = self.search_issues(jql, limit=limit)
+            issues = self.search_issues(jql, limit=limit, simplified=simplified)
             if not issues:
                 logger.warning(f"No issues found for epic {epic_key} with query: {jql}")
             return issues
@@ -954,11 +971,16 @@ class EpicsMixin(UsersMixin):
 
             # Create JiraIssue models from raw data
             if "issues" in issues_data:
+                base_url = self.config.url if hasattr(self, "config") else None
                 for issue_data in issues_data["issues"]:
-                    issue = JiraIssue.from_api_response(
-                        issue_data,
-                        base_url=self.config.url if hasattr(self, "config") else None,
-                    )
+                    if simplified:
+                        issue = JiraIssue.simplify_api_response(
+                            issue_data, base_url=base_url
+                        )
+                    else:
+                        issue = JiraIssue.from_api_response(
+                            issue_data, base_url=base_url
+                        )
                     issues.append(issue)
 
             return issues
@@ -276,8 +276,13 @@ class ProjectsMixin(JiraClient):
             return 0
 
     def get_project_issues(
-        self, project_key: str, start: int = 0, limit: int = 50
-    ) -> list[JiraIssue]:
+        self,
+        project_key: str,
+        start: int = 0,
+        limit: int = 50,
+        *,
+        simplified: bool = False,
+    ) -> list[JiraIssue] | list[dict[str, Any]]:
         """
         Get issues for a specific project.
 
@@ -285,9 +290,11 @@ class ProjectsMixin(JiraClient):
             project_key: The project key
             start: Index of the first issue to return
             limit: Maximum number of issues to return
+            simplified: Return simplified issue dictionaries instead of models
 
         Returns:
-            List of JiraIssue models representing the issues
+            List of JiraIssue models (or simplified dictionaries) representing
+            the issues
         """
         try:
             # Use JQL to get issues in the project
@@ -296,13 +303,18 @@ class ProjectsMixin(JiraClient):
             # Use search_issues if available (delegate to SearchMixin)
             if hasattr(self, "search_issues") and callable(self.search_issues):
                 # This assumes search_issues returns JiraIssue objects already
-                return self.search_issues(jql, start=start, limit=limit)
+                return self.search_issues(
+                    jql, start=start, limit=limit, simplified=simplified
+                )
 
             # Fallback implementation if search_issues is not available
             result = self.jira.jql(jql=jql, fields="*all", start=start, limit=limit)
 
             issues = []
             if isinstance(result, dict) and "issues" in result:
+                if simplified:
+                    return JiraSearchResult.simplify_api_response(result)
+
                 # Create a JiraSearchResult and extract the issues
                 search_result = JiraSearchResult.from_api_response(result)
                 issues = search_result.issues
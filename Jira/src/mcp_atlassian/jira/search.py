@@ -1,6 +1,7 @@
 """Module for Jira search operations."""
 
 import logging
+from typing import Any
 
 from ..models.jira import JiraIssue, JiraSearchResult
 from .client import JiraClient
@@ -19,7 +20,9 @@ class SearchMixin(JiraClient):
         start: int = 0,
         limit: int = 50,
         expand: str | None = None,
-    ) -> list[JiraIssue]:
+        *,
+        simplified: bool = False,
+    ) -> list[JiraIssue] | list[dict[str, Any]]:
         """
         Search for issues using JQL (Jira Query Language).
 
@@ -29,9 +32,13 @@ class SearchMixin(JiraClient):
             start: Starting index
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
+            simplified: Return simplified issue dictionaries built directly
+                from the response instead of JiraIssue models, which is much
+                faster when the results are only serialized
 
         Returns:
-            List of JiraIssue models representing the search results
+            List of JiraIssue models (or simplified dictionaries) representing
+            the search results
 
         Raises:
             Exception: If there is an error searching for issues
@@ -41,6 +48,11 @@ class SearchMixin(JiraClient):
                 jql, fields=fields, start=start, limit=limit, expand=expand
             )
 
+            if simplified:
+                return JiraSearchResult.simplify_api_response(
+                    response, base_url=self.config.url
+                )
+
             # Convert the response to a search result model
             search_result = JiraSearchResult.from_api_response(
                 response, base_url=self.config.url
@@ -53,8 +65,13 @@ class SearchMixin(JiraClient):
             raise Exception(f"Error searching issues: {str(e)}") from e
 
     def get_project_issues(
-        self, project_key: str, start: int = 0, limit: int = 50
-    ) -> list[JiraIssue]:
+        self,
+        project_key: str,
+        start: int = 0,
+        limit: int = 50,
+        *,
+        simplified: bool = False,
+    ) -> list[JiraIssue] | list[dict[str, Any]]:
         """
         Get all issues for a project.
 
@@ -62,26 +79,32 @@ class SearchMixin(JiraClient):
             project_key: The project key
             start: Starting index
             limit: Maximum results to return
+            simplified: Return simplified issue dictionaries instead of models
 
         Returns:
-            List of JiraIssue models containing project issues
+            List of JiraIssue models (or simplified dictionaries) containing
+            project issues
 
         Raises:
             Exception: If there is an error getting project issues
         """
         jql = f"project = {project_key} ORDER BY created DESC"
-        return self.search_issues(jql, start=start, limit=limit)
+        return self.search_issues(jql, start=start, limit=limit, simplified=simplified)
 
-    def get_epic_issues(self, epic_key: str, limit: int = 50) -> list[JiraIssue]:
+    def get_epic_issues(
+        self, epic_key: str, limit: int = 50, *, simplified: bool = False
+    ) -> list[JiraIssue] | list[dict[str, Any]]:
         """
         Get all issues linked to a specific epic.
 
         Args:
             epic_key: The key of the epic (e.g. 'PROJ-123')
             limit: Maximum number of issues to return
+            simplified: Return simplified issue dictionaries instead of models
 
         Returns:
-            List of JiraIssue models representing the issues linked to the epic
+            List of JiraIssue models (or simplified dictionaries) representing
+            the issues linked to the epic
 
         Raises:
             ValueError: If the issue is not an Epic
@@ -108,7 +131,7 @@ class SearchMixin(JiraClient):
             # Try with 'issueFunction in issuesScopedToEpic'
             try:
                 jql = f'issueFunction in issuesScopedToEpic("{epic_key}")'
-                return self.search_issues(jql, limit=limit)
+                return self.search_issues(jql, limit=limit, simplified=simplified)
             except Exception as e:
                 # Log exception but continue with fallback
                 logger.warning(
@@ -117,7 +140,7 @@ class SearchMixin(JiraClient):
 
             # Fallback to 'Epic Link' field
             jql = f"'Epic Link' = {epic_key}"
-            return self.search_issues(jql, limit=limit)
+            return self.search_issues(jql, limit=limit, simplified=simplified)
 
         except ValueError:
             # Re-raise ValueError for non-epic issues
@@ -0,0 +1,183 @@
+"""Pluggable JSON codec for Atlassian responses and tool results.
+
+orjson is used when it is installed (``pip install mcp-atlassian[fast]``) and
+the standard library ``json`` module otherwise. The codec can be forced with
+the ``ATLASSIAN_JSON_CODEC`` environment variable (``orjson`` or ``stdlib``).
+Both codecs produce the same documents; orjson falls back to the standard
+library for the few inputs it does not support (e.g. integers beyond 64 bits
+or NaN literals).
+"""
+
+import json
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+from requests import Response
+from requests.sessions import Session
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Response encodings that are byte-compatible with the UTF-8 input orjson expects
+_UTF8_ENCODINGS = frozenset({"utf-8", "utf8", "ascii", "us-ascii"})
+
+
+class StdlibCodec:
+    """JSON codec based on the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def dumps(self, data: Any, *, pretty: bool = False) -> str:
+        """
+        Serialize data to JSON text.
+
+        Args:
+            data: JSON-serializable data
+            pretty: Indent with two spaces instead of emitting minified JSON
+
+        Returns:
+            The JSON text, with non-ASCII characters kept as-is
+        """
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Deserialize JSON text.
+
+        Args:
+            data: JSON text or UTF-8 encoded bytes
+
+        Returns:
+            The decoded data
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(StdlibCodec):
+    """JSON codec based on orjson, falling back to the standard library."""
+
+    name = "orjson"
+
+    def dumps(self, data: Any, *, pretty: bool = False) -> str:
+        """
+        Serialize data to JSON text.
+
+        Args:
+            data: JSON-serializable data
+            pretty: Indent with two spaces instead of emitting minified JSON
+
+        Returns:
+            The JSON text, with non-ASCII characters kept as-is
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option).decode("utf-8")
+        except TypeError:
+            # Unsupported input such as integers beyond 64 bits
+            return super().dumps(data, pretty=pretty)
+
+    def loads(self, data: str | bytes) -> Any:
+        """
+        Deserialize JSON text.
+
+        Args:
+            data: JSON text or UTF-8 encoded bytes
+
+        Returns:
+            The decoded data
+        """
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Let the standard library decide, e.g. for NaN literals
+            return super().loads(data)
+
+
+def get_codec(name: str | None = None) -> StdlibCodec:
+    """
+    Select a JSON codec.
+
+    Args:
+        name: "orjson", "stdlib" or "auto"; defaults to the ATLASSIAN_JSON_CODEC
+            environment variable and then to "auto"
+
+    Returns:
+        The orjson codec if requested or available, otherwise the stdlib codec
+    """
+    name = (name or os.getenv("ATLASSIAN_JSON_CODEC", "auto")).lower()
+    if name == "stdlib":
+        return StdlibCodec()
+    if orjson is None:
+        if name == "orjson":
+            logger.warning("orjson is not installed, using the stdlib JSON codec")
+        return StdlibCodec()
+    return OrjsonCodec()
+
+
+# Process-wide codec used by dumps()/loads() and the response decoder
+codec = get_codec()
+
+
+def set_codec(new_codec: StdlibCodec) -> None:
+    """
+    Replace the process-wide JSON codec.
+
+    Args:
+        new_codec: The codec to use from now on
+    """
+    global codec
+    codec = new_codec
+
+
+def dumps(data: Any, *, pretty: bool = False) -> str:
+    """Serialize data to JSON text with the process-wide codec."""
+    return codec.dumps(data, pretty=pretty)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize JSON text with the process-wide codec."""
+    return codec.loads(data)
+
+
+def _decoder_for(response: Response, original: Callable[..., Any]) -> Callable:
+    """Build a replacement for ``response.json`` that uses the codec."""
+
+    def decode(**kwargs: Any) -> Any:
+        encoding = (response.encoding or "utf-8").lower()
+        if kwargs or codec.name == "stdlib" or encoding not in _UTF8_ENCODINGS:
+            return original(**kwargs)
+        try:
+            return codec.loads(response.content)
+        except ValueError:
+            # Keep the exception type and message requests users expect
+            return original()
+
+    return decode
+
+
+def _install_decoder(response: Response, *args: Any, **kwargs: Any) -> Response:
+    """Response hook replacing ``response.json`` with the codec decoder."""
+    response.json = _decoder_for(response, response.json)
+    return response
+
+
+def configure_json_decoding(session: Session) -> None:
+    """
+    Decode JSON responses of a session with the process-wide codec.
+
+    Args:
+        session: The requests session used by the Atlassian client
+    """
+    hooks = session.hooks.setdefault("response", [])
+    if _install_decoder not in hooks:
+        hooks.append(_install_decoder)
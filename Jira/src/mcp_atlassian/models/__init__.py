@@ -11,6 +11,7 @@ from .base import ApiModel, TimestampMixin
 
 # Confluence models
 from .confluence import (
+    ConfluenceAttachment,
     ConfluenceComment,
     ConfluencePage,
     ConfluenceSearchResult,
@@ -88,6 +89,7 @@ __all__ = [
     "ConfluenceSpace",
     "ConfluencePage",
     "ConfluenceComment",
+    "ConfluenceAttachment",
     "ConfluenceVersion",
     "ConfluenceSearchResult",
 ]
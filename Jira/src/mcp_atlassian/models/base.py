@@ -6,6 +6,7 @@ Jira and Confluence models to ensure consistent behavior and reduce
 code duplication.
 """
 
+import re
 from datetime import datetime
 from typing import Any, TypeVar
 
@@ -16,6 +17,9 @@ from .constants import EMPTY_STRING
 # Type variable for the return type of from_api_response
 T = TypeVar("T", bound="ApiModel")
 
+# Timestamps starting with "YYYY-MM-DDTHH:MM:SS", as sent by the Atlassian APIs
+_ISO_DATETIME_PREFIX_RE = re.compile(r"[1-9]\d{3}-\d\d-\d\dT\d\d:\d\d:\d\d")
+
 
 class ApiModel(BaseModel):
     """
@@ -53,6 +57,35 @@ class ApiModel(BaseModel):
         return self.model_dump(exclude_none=True)
 
 
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse an Atlassian ISO 8601 timestamp like "2024-01-01T10:00:00.000+0000".
+
+    Args:
+        timestamp: The timestamp string
+
+    Returns:
+        The parsed datetime
+
+    Raises:
+        ValueError: If the string is not a valid timestamp
+    """
+    # Convert Z format to +00:00 for compatibility with fromisoformat
+    ts = timestamp.replace("Z", "+00:00")
+
+    # Handle timezone format without colon (+0000 -> +00:00)
+    if "+" in ts and ":" not in ts[-5:]:
+        tz_pos = ts.rfind("+")
+        if tz_pos != -1 and len(ts) >= tz_pos + 5:
+            ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
+    elif "-" in ts and ":" not in ts[-5:]:
+        tz_pos = ts.rfind("-")
+        if tz_pos != -1 and len(ts) >= tz_pos + 5:
+            ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
+
+    return datetime.fromisoformat(ts)
+
+
 class TimestampMixin:
     """
     Mixin for handling Atlassian API timestamp formats.
@@ -73,25 +106,15 @@ class TimestampMixin:
             return EMPTY_STRING
 
         try:
-            # Parse ISO 8601 format like "2024-01-01T10:00:00.000+0000"
-            # Convert Z format to +00:00 for compatibility with fromisoformat
-            ts = timestamp.replace("Z", "+00:00")
-
-            # Handle timezone format without colon (+0000 -> +00:00)
-            if "+" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("+")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-            elif "-" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("-")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-
-            dt = datetime.fromisoformat(ts)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
+            dt = _parse_timestamp(timestamp)
         except (ValueError, TypeError):
             return timestamp or EMPTY_STRING
 
+        # Once parsed, the date and time can be copied instead of formatted
+        if _ISO_DATETIME_PREFIX_RE.match(timestamp):
+            return f"{timestamp[:10]} {timestamp[11:19]}"
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+
     @staticmethod
     def is_valid_timestamp(timestamp: str | None) -> bool:
         """
@@ -107,20 +130,7 @@ class TimestampMixin:
             return False
 
         try:
-            # Convert Z format to +00:00 for compatibility with fromisoformat
-            ts = timestamp.replace("Z", "+00:00")
-
-            # Handle timezone format without colon (+0000 -> +00:00)
-            if "+" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("+")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-            elif "-" in ts and ":" not in ts[-5:]:
-                tz_pos = ts.rfind("-")
-                if tz_pos != -1 and len(ts) >= tz_pos + 5:
-                    ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
-
-            datetime.fromisoformat(ts)
+            _parse_timestamp(timestamp)
             return True
         except (ValueError, TypeError):
             return False
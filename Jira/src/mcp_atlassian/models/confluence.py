@@ -6,6 +6,7 @@ including user information, spaces, pages, and search results.
 
 Key models:
 - ConfluencePage: Complete model for Confluence page content and metadata
+- ConfluenceAttachment: Files attached to pages
 - ConfluenceSpace: Space information and settings
 - ConfluenceUser: User account details
 - ConfluenceSearchResult: Container for Confluence search (CQL) results
@@ -41,6 +42,7 @@ from typing import Any
 
 from pydantic import Field, model_validator
 
+from ..utils import display_names
 from .base import ApiModel, TimestampMixin
 from .constants import (
     CONFLUENCE_DEFAULT_ID,
@@ -97,6 +99,10 @@ class ConfluenceUser(ApiModel):
             # Use the full path to the profile picture
             profile_pic = pic_data.get("path")
 
+        # Remember the name for resolving mentions of this user in content
+        if (account_id := data.get("accountId")) and data.get("displayName"):
+            display_names.set(account_id, data["displayName"])
+
         return cls(
             account_id=data.get("accountId"),
             display_name=data.get("displayName", UNASSIGNED),
@@ -281,6 +287,89 @@ class ConfluenceComment(ApiModel, TimestampMixin):
         return result
 
 
+class ConfluenceAttachment(ApiModel):
+    """
+    Model representing a file attached to a Confluence page.
+    """
+
+    id: str = CONFLUENCE_DEFAULT_ID
+    title: str = EMPTY_STRING
+    media_type: str = "application/octet-stream"
+    file_size: int | None = None
+    comment: str | None = None
+    page_id: str | None = None
+    version: ConfluenceVersion | None = None
+    download_url: str | None = None
+
+    @classmethod
+    def from_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> "ConfluenceAttachment":
+        """
+        Create a ConfluenceAttachment from a Confluence API response.
+
+        Args:
+            data: The attachment data from the Confluence API
+            **kwargs: Additional context parameters, including:
+                - base_url: Base URL for constructing the download URL
+
+        Returns:
+            A ConfluenceAttachment instance
+        """
+        if not data:
+            return cls()
+
+        extensions = data.get("extensions", {})
+        metadata = data.get("metadata", {})
+
+        version = None
+        if version_data := data.get("version"):
+            version = ConfluenceVersion.from_api_response(version_data)
+
+        page_id = None
+        if container := data.get("container"):
+            page_id = str(container.get("id")) if container.get("id") else None
+
+        download_url = None
+        if download := data.get("_links", {}).get("download"):
+            base_url = kwargs.get("base_url", EMPTY_STRING)
+            download_url = f"{base_url.rstrip('/')}{download}"
+
+        file_size = extensions.get("fileSize")
+        return cls(
+            id=str(data.get("id", CONFLUENCE_DEFAULT_ID)),
+            title=data.get("title", EMPTY_STRING),
+            media_type=extensions.get("mediaType")
+            or metadata.get("mediaType")
+            or "application/octet-stream",
+            file_size=int(file_size) if file_size is not None else None,
+            comment=extensions.get("comment") or metadata.get("comment"),
+            page_id=page_id,
+            version=version,
+            download_url=download_url,
+        )
+
+    def to_simplified_dict(self) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response."""
+        result: dict[str, Any] = {
+            "id": self.id,
+            "title": self.title,
+            "media_type": self.media_type,
+            "file_size": self.file_size,
+        }
+
+        if self.comment:
+            result["comment"] = self.comment
+
+        if self.page_id:
+            result["page_id"] = self.page_id
+
+        if self.version:
+            result["version"] = self.version.number
+
+        return result
+
+
 class ConfluencePage(ApiModel, TimestampMixin):
     """
     Model representing a Confluence page.
@@ -449,6 +538,8 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
     results: list[ConfluencePage] = Field(default_factory=list)
     cql_query: str | None = None
     search_duration: int | None = None
+    # Raw excerpt of each result by content ID (not part of the serialized model)
+    excerpts: dict[str, str] = Field(default_factory=dict, exclude=True)
 
     @classmethod
     def from_api_response(
@@ -468,12 +559,16 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
         if not data:
             return cls()
 
-        # Convert search results to ConfluencePage models
+        # Convert search results to ConfluencePage models and collect the
+        # excerpts in the same pass
         results = []
+        excerpts: dict[str, str] = {}
         for item in data.get("results", []):
             # In Confluence search, the content is nested inside the result item
             if content := item.get("content"):
                 results.append(ConfluencePage.from_api_response(content, **kwargs))
+                if (excerpt := item.get("excerpt")) and content.get("id"):
+                    excerpts.setdefault(str(content["id"]), excerpt)
 
         return cls(
             total_size=data.get("totalSize", 0),
@@ -482,6 +577,7 @@ class ConfluenceSearchResult(ApiModel, TimestampMixin):
             results=results,
             cql_query=data.get("cqlQuery"),
             search_duration=data.get("searchDuration"),
+            excerpts=excerpts,
         )
 
     @model_validator(mode="after")
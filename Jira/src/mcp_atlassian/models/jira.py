@@ -32,6 +32,7 @@ Usage examples:
 
 import logging
 import warnings
+from functools import lru_cache
 from typing import Any
 
 from pydantic import Field, model_validator
@@ -50,6 +51,86 @@ from .constants import (
 logger = logging.getLogger(__name__)
 
 
+def _normalize_field_name(name: str) -> str:
+    """Remove spaces and hyphens from a lower-cased field name or pattern."""
+    return name.replace(" ", "").replace("-", "")
+
+
+@lru_cache(maxsize=64)
+def _compile_field_patterns(
+    name_patterns: tuple[str, ...],
+) -> tuple[tuple[str, str], ...]:
+    """
+    Compile name patterns into (lower-cased, normalized) pairs.
+
+    Args:
+        name_patterns: Field name patterns, e.g. ("Epic Link", "epic-link")
+
+    Returns:
+        The lower-cased and normalized form of every pattern
+    """
+    compiled = []
+    for pattern in name_patterns:
+        pattern_lower = pattern.lower()
+        compiled.append((pattern_lower, _normalize_field_name(pattern_lower)))
+    return tuple(compiled)
+
+
+def _field_name_matches(
+    field_name_lower: str, compiled: tuple[tuple[str, str], ...]
+) -> bool:
+    """Check whether a lower-cased field name matches any compiled pattern."""
+    normalized_field_name = _normalize_field_name(field_name_lower)
+    return any(
+        pattern_lower in field_name_lower or normalized in normalized_field_name
+        for pattern_lower, normalized in compiled
+    )
+
+
+def _schema_signature(meta_fields: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    """
+    Build a hashable signature of schema field metadata.
+
+    Every decoded issue carries its own copy of the metadata, so lookups are
+    keyed on its content: the (field ID, field name) pairs in order.
+
+    Args:
+        meta_fields: Field metadata by field ID from the schema
+
+    Returns:
+        The (field ID, field name) pairs of the metadata
+    """
+    return tuple(
+        (field_id, field_meta.get("name") or "")
+        for field_id, field_meta in meta_fields.items()
+        if isinstance(field_meta, dict)
+    )
+
+
+@lru_cache(maxsize=256)
+def _resolve_custom_field_id(
+    name_patterns: tuple[str, ...], schema_signature: tuple[tuple[str, str], ...]
+) -> str | None:
+    """
+    Resolve the ID of the first schema field whose name matches the patterns.
+
+    Results are cached per (pattern set, schema signature), so the field
+    names are only matched once for all issues sharing a schema.
+
+    Args:
+        name_patterns: Field name patterns to match
+        schema_signature: (field ID, field name) pairs from the schema metadata
+
+    Returns:
+        The matching field ID, or None if no field matches
+    """
+    compiled = _compile_field_patterns(name_patterns)
+    for field_id, field_name in schema_signature:
+        if _field_name_matches(str(field_name).lower(), compiled):
+            return field_id
+    return None
+
+
 class JiraUser(ApiModel):
     """
     Model representing a Jira user.
@@ -107,6 +188,31 @@ class JiraUser(ApiModel):
             "avatar_url": self.avatar_url,
         }
 
+    @classmethod
+    def simplify_api_response(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the simplified dictionary directly from a Jira API response.
+
+        Equivalent to ``from_api_response(data).to_simplified_dict()``.
+
+        Args:
+            data: The user data from the Jira API
+
+        Returns:
+            The simplified user dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls.from_api_response(data).to_simplified_dict()
+
+        avatars = data.get("avatarUrls")
+        display_name = str(data.get("displayName", UNASSIGNED))
+        return {
+            "display_name": display_name,
+            "name": display_name,
+            "email": data.get("emailAddress"),
+            "avatar_url": avatars.get("48x48") if isinstance(avatars, dict) else None,
+        }
+
 
 class JiraStatusCategory(ApiModel):
     """
@@ -215,6 +321,31 @@ class JiraStatus(ApiModel):
 
         return result
 
+    @classmethod
+    def simplify_api_response(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the simplified dictionary directly from a Jira API response.
+
+        Equivalent to ``from_api_response(data).to_simplified_dict()``.
+
+        Args:
+            data: The status data from the Jira API
+
+        Returns:
+            The simplified status dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls.from_api_response(data).to_simplified_dict()
+
+        result = {"name": str(data.get("name", UNKNOWN))}
+        if category_data := data.get("statusCategory"):
+            if not isinstance(category_data, dict):
+                category_data = {}
+            result["category"] = str(category_data.get("name", UNKNOWN))
+            result["color"] = str(category_data.get("colorName", EMPTY_STRING))
+
+        return result
+
 
 class JiraIssueType(ApiModel):
     """
@@ -261,6 +392,24 @@ class JiraIssueType(ApiModel):
         """Convert to simplified dictionary for API response."""
         return {"name": self.name, "icon_url": self.icon_url}
 
+    @classmethod
+    def simplify_api_response(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the simplified dictionary directly from a Jira API response.
+
+        Equivalent to ``from_api_response(data).to_simplified_dict()``.
+
+        Args:
+            data: The issue type data from the Jira API
+
+        Returns:
+            The simplified issue type dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls.from_api_response(data).to_simplified_dict()
+
+        return {"name": str(data.get("name", UNKNOWN)), "icon_url": data.get("iconUrl")}
+
 
 class JiraPriority(ApiModel):
     """
@@ -307,6 +456,27 @@ class JiraPriority(ApiModel):
         """Convert to simplified dictionary for API response."""
         return {"name": self.name, "icon_url": self.icon_url}
 
+    @classmethod
+    def simplify_api_response(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the simplified dictionary directly from a Jira API response.
+
+        Equivalent to ``from_api_response(data).to_simplified_dict()``.
+
+        Args:
+            data: The priority data from the Jira API
+
+        Returns:
+            The simplified priority dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls.from_api_response(data).to_simplified_dict()
+
+        return {
+            "name": str(data.get("name", NONE_VALUE)),
+            "icon_url": data.get("iconUrl"),
+        }
+
 
 class JiraComment(ApiModel, TimestampMixin):
     """
@@ -365,6 +535,33 @@ class JiraComment(ApiModel, TimestampMixin):
 
         return result
 
+    @classmethod
+    def simplify_api_response(cls, data: dict[str, Any]) -> dict[str, Any]:
+        """
+        Build the simplified dictionary directly from a Jira API response.
+
+        Equivalent to ``from_api_response(data).to_simplified_dict()``.
+
+        Args:
+            data: The comment data from the Jira API
+
+        Returns:
+            The simplified comment dictionary
+        """
+        if not data or not isinstance(data, dict):
+            return cls.from_api_response(data).to_simplified_dict()
+
+        result = {
+            "body": str(data.get("body", EMPTY_STRING)),
+            "created": cls.format_timestamp(data.get("created", EMPTY_STRING)),
+        }
+
+        if author_data := data.get("author"):
+            author = JiraUser.simplify_api_response(author_data)
+            result["author"] = author["display_name"]
+
+        return result
+
 
 class JiraIssue(ApiModel, TimestampMixin):
     """
@@ -425,6 +622,10 @@ class JiraIssue(ApiModel, TimestampMixin):
         - It works even when custom field IDs change in Jira updates
         - It doesn't require manual configuration or updates when field IDs change
 
+        The patterns are compiled once per pattern set and the schema lookup is
+        cached per schema signature, so parsing many issues that share a schema
+        only matches the field names once.
+
         Args:
             fields: The fields dictionary from Jira API response
             name_patterns: List of name patterns to match against field names
@@ -435,47 +636,27 @@ class JiraIssue(ApiModel, TimestampMixin):
         if not fields or not isinstance(fields, dict):
             return None
 
+        patterns = tuple(name_patterns)
+
         # STRATEGY 1: Try to find a matching name in field metadata
         meta_fields = fields.get("schema", {}).get("fields", {})
-        if isinstance(meta_fields, dict):
-            for field_id, field_meta in meta_fields.items():
-                if not isinstance(field_meta, dict):
-                    continue
-
-                field_name = field_meta.get("name", "").lower()
-                for pattern in name_patterns:
-                    pattern_lower = pattern.lower()
-                    # Try direct match
-                    if pattern_lower in field_name:
-                        return fields.get(field_id)
-                    # Try without spaces or hyphens
-                    normalized_pattern = pattern_lower.replace(" ", "").replace("-", "")
-                    normalized_field_name = field_name.replace(" ", "").replace("-", "")
-                    if normalized_pattern in normalized_field_name:
-                        return fields.get(field_id)
+        if isinstance(meta_fields, dict) and meta_fields:
+            field_id = _resolve_custom_field_id(
+                patterns, _schema_signature(meta_fields)
+            )
+            if field_id is not None:
+                return fields.get(field_id)
 
         # STRATEGY 2: Try to get field names from the fields collection if available
         if hasattr(fields, "names") and callable(getattr(fields, "names", None)):
             try:
                 field_names = fields.names()
                 if isinstance(field_names, dict):
+                    compiled = _compile_field_patterns(patterns)
                     for field_id, field_name in field_names.items():
                         if field_id in fields and fields[field_id] is not None:
-                            field_name_lower = str(field_name).lower()
-                            for pattern in name_patterns:
-                                pattern_lower = pattern.lower()
-                                # Try direct match
-                                if pattern_lower in field_name_lower:
-                                    return fields[field_id]
-                                # Try normalized match
-                                normalized_pattern = pattern_lower.replace(
-                                    " ", ""
-                                ).replace("-", "")
-                                normalized_field_name = field_name_lower.replace(
-                                    " ", ""
-                                ).replace("-", "")
-                                if normalized_pattern in normalized_field_name:
-                                    return fields[field_id]
+                            if _field_name_matches(str(field_name).lower(), compiled):
+                                return fields[field_id]
             except Exception:
                 # Ignore any errors from names() method
                 logger.debug("Error accessing field names method")
@@ -652,6 +833,74 @@ class JiraIssue(ApiModel, TimestampMixin):
             "url": self.url,
         }
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        """
+        Build the simplified dictionary directly from a Jira API response.
+
+        Equivalent to ``from_api_response(data, **kwargs).to_simplified_dict()``
+        but without constructing and validating the intermediate models, which
+        dominates the cost of serializing large search results.
+
+        Args:
+            data: The issue data from the Jira API
+            **kwargs: Additional context parameters, including:
+                - base_url: Base URL for constructing the issue URL
+
+        Returns:
+            The simplified issue dictionary
+        """
+        fields = data.get("fields", {}) if isinstance(data, dict) else None
+        if not data or not isinstance(fields, dict):
+            return cls.from_api_response(data, **kwargs).to_simplified_dict()
+
+        def text(value: Any, default: str | None = EMPTY_STRING) -> str | None:
+            return str(value) if value is not None else default
+
+        def nested(model: type[ApiModel], key: str) -> dict[str, Any] | None:
+            value = fields.get(key)
+            return model.simplify_api_response(value) if value else None
+
+        key = data.get("key")
+        base_url = kwargs.get("base_url")
+
+        components_data = fields.get("components", [])
+        labels_data = fields.get("labels", [])
+        comment_data = fields.get("comment", {})
+        comments_list = (
+            comment_data.get("comments", []) if isinstance(comment_data, dict) else []
+        )
+
+        return {
+            "id": text(data.get("id"), JIRA_DEFAULT_ID),
+            "summary": text(fields.get("summary")),
+            "key": text(key, JIRA_DEFAULT_KEY),
+            "description": text(fields.get("description"), None),
+            "created": cls.format_timestamp(text(fields.get("created"))),
+            "updated": cls.format_timestamp(text(fields.get("updated"))),
+            "status": nested(JiraStatus, "status"),
+            "issue_type": nested(JiraIssueType, "issuetype"),
+            "priority": nested(JiraPriority, "priority"),
+            "assignee": nested(JiraUser, "assignee"),
+            "reporter": nested(JiraUser, "reporter"),
+            "labels": [str(label) for label in labels_data if label is not None]
+            if isinstance(labels_data, list)
+            else [],
+            "components": [
+                c.get("name")
+                for c in components_data
+                if isinstance(c, dict) and "name" in c
+            ]
+            if isinstance(components_data, list)
+            else [],
+            "comments": [JiraComment.simplify_api_response(c) for c in comments_list]
+            if isinstance(comments_list, list)
+            else [],
+            "url": f"{base_url}/browse/{key}" if base_url and key else None,
+        }
+
 
 class JiraProject(ApiModel):
     """
@@ -932,6 +1181,38 @@ class JiraSearchResult(ApiModel):
             issues=issues,
         )
 
+    @classmethod
+    def simplify_api_response(
+        cls, data: dict[str, Any], **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """
+        Build the simplified issue dictionaries directly from a search response.
+
+        Equivalent to converting every issue of ``from_api_response(data)``
+        with ``to_simplified_dict()``, without constructing the models.
+
+        Args:
+            data: The search result data from the Jira API
+            **kwargs: Additional context parameters, including:
+                - base_url: Base URL for constructing issue URLs
+
+        Returns:
+            List of simplified issue dictionaries
+        """
+        if not data:
+            return []
+
+        issues = [
+            JiraIssue.simplify_api_response(issue, **kwargs)
+            for issue in data.get("issues", [])
+        ]
+        if data.get("total", 0) > 0 and not issues:
+            logger.warning(
+                "Search found %d issues but no issue data was returned",
+                data.get("total", 0),
+            )
+        return issues
+
     @model_validator(mode="after")
     def validate_search_result(self) -> "JiraSearchResult":
         """Validate the search result and log warnings if needed."""
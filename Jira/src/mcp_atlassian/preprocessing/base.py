@@ -1,15 +1,221 @@
 """Base preprocessing module."""
 
+import html
 import logging
+import os
 import re
 import warnings
-from typing import Any, Protocol
+from concurrent.futures import ThreadPoolExecutor
+from html.entities import html5
+from typing import Any, Literal, Protocol
 
 from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
 from markdownify import markdownify as md
 
+try:
+    import lxml
+except ImportError:  # pragma: no cover - exercised when lxml is not installed
+    lxml = None
+
+from ..utils import display_names
+from .pool import ConversionPool
+from .store import ConversionStore
+
 logger = logging.getLogger("mcp-atlassian")
 
+# Patterns mirroring markdownify's whitespace normalization of text nodes
+_WHITESPACE_RE = re.compile(r"[\t ]+")
+_NEWLINE_WHITESPACE_RE = re.compile(r"[\t \r\n]*[\r\n][\t \r\n]*")
+_NAMED_ENTITY_RE = re.compile(r"&([a-zA-Z][a-zA-Z0-9]*);")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Users referenced in storage format, a superset of the mentioned users
+_USER_ACCOUNT_ID_RE = re.compile(r"<ri:user\b[^>]*?\bri:account-id=\"([^\"]+)\"")
+
+# CDATA sections, e.g. code macro bodies, which lxml's HTML parser drops
+_CDATA_RE = re.compile(r"<!\[CDATA\[([\s\S]*?)\]\]>")
+
+# Converts parsed documents directly, without serializing and re-parsing them
+_MARKDOWN_CONVERTER = MarkdownConverter()
+
+# Formats process_html_content can produce; the other one is left empty
+ContentOutput = Literal["both", "html", "markdown"]
+
+# Smaller inputs convert faster than a conversion store round trip
+MIN_STORED_LENGTH = 1024
+
+# Upper bound for concurrent user lookups when resolving mentions
+MAX_MENTION_WORKERS = 8
+
+
+def get_markdown_parser(name: str | None = None) -> str:
+    """
+    Select the parser BeautifulSoup uses when only Markdown is needed.
+
+    lxml parses faster than the pure-Python html.parser and yields the same
+    Markdown, but cannot reproduce the input markup (it wraps documents in
+    <html><body> and has no CDATA sections), so HTML output always uses
+    html.parser.
+
+    Args:
+        name: "lxml", "html.parser" or "auto"; defaults to the
+            CONFLUENCE_HTML_PARSER environment variable and then to "auto"
+
+    Returns:
+        "lxml" if requested or available, otherwise "html.parser"
+    """
+    name = (name or os.getenv("CONFLUENCE_HTML_PARSER", "auto")).lower()
+    if name == "html.parser":
+        return name
+    if lxml is None:
+        if name == "lxml":
+            logger.warning("lxml is not installed, using html.parser")
+        return "html.parser"
+    return "lxml"
+
+
+def _convert_plain_text(text: str) -> tuple[str, str] | None:
+    """
+    Convert markup-free text without parsing it as HTML.
+
+    Produces the same (html, markdown) pair as parsing the text with
+    BeautifulSoup and converting it with markdownify, which is most of the
+    cost for tiny snippets such as CQL search excerpts.
+
+    Args:
+        text: The text to convert
+
+    Returns:
+        Tuple of (processed_html, processed_markdown), or None if the text
+        contains markup, unusual character references or only whitespace and
+        needs the full conversion
+    """
+    if not isinstance(text, str) or "<" in text or not text.strip():
+        return None
+    if "&" in text:
+        entities = _NAMED_ENTITY_RE.findall(text)
+        if text.count("&") != len(entities) or any(
+            f"{name};" not in html5 for name in entities
+        ):
+            return None
+        text = html.unescape(text)
+
+    processed_html = (
+        text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    )
+    markdown = _WHITESPACE_RE.sub(" ", _NEWLINE_WHITESPACE_RE.sub("\n", text))
+    markdown = markdown.replace("*", r"\*").replace("_", r"\_")
+    return processed_html, markdown
+
+
+def _escape_cdata(match: re.Match) -> str:
+    """Replace a CDATA section with its content as escaped text."""
+    return html.escape(match.group(1), quote=False)
+
+
+def _parse_html(
+    html_content: str, output: ContentOutput, markdown_parser: str
+) -> BeautifulSoup:
+    """Parse HTML with the parser suited to the requested output."""
+    if output == "markdown" and markdown_parser == "lxml":
+        return BeautifulSoup(_CDATA_RE.sub(_escape_cdata, html_content), "lxml")
+    return BeautifulSoup(html_content, "html.parser")
+
+
+def _render_soup(soup: BeautifulSoup, output: ContentOutput) -> tuple[str, str]:
+    """Convert a parsed document to the requested formats."""
+    processed_html = "" if output == "markdown" else str(soup)
+    processed_markdown = (
+        "" if output == "html" else _MARKDOWN_CONVERTER.convert_soup(soup)
+    )
+    return processed_html, processed_markdown
+
+
+def _find_user_mentions(soup: BeautifulSoup) -> list[tuple[Tag, str]]:
+    """
+    Find the user mentions in a parsed document.
+
+    Args:
+        soup: BeautifulSoup object containing HTML
+
+    Returns:
+        List of (mention element, account ID) tuples
+    """
+    mentions: list[tuple[Tag, str]] = []
+
+    # Find all ac:link elements that might contain user mentions
+    user_mentions = soup.find_all("ac:link")
+
+    for user_element in user_mentions:
+        user_ref = user_element.find("ri:user")
+        if user_ref and user_ref.get("ri:account-id"):
+            # Case 1: Direct user reference without link-body
+            account_id = user_ref.get("ri:account-id")
+            if isinstance(account_id, str):
+                mentions.append((user_element, account_id))
+                continue
+
+        # Case 2: User reference with link-body containing @
+        link_body = user_element.find("ac:link-body")
+        if link_body and "@" in link_body.get_text(strip=True):
+            user_ref = user_element.find("ri:user")
+            if user_ref and user_ref.get("ri:account-id"):
+                account_id = user_ref.get("ri:account-id")
+                if isinstance(account_id, str):
+                    mentions.append((user_element, account_id))
+    return mentions
+
+
+def _replace_user_mentions(
+    mentions: list[tuple[Tag, str]], names: dict[str, str]
+) -> bool:
+    """
+    Replace user mentions with the users' display names.
+
+    Args:
+        mentions: (mention element, account ID) tuples from _find_user_mentions
+        names: Display names by account ID
+
+    Returns:
+        True if every mention was replaced with the user's display name,
+        False if the account ID was used as a fallback for any of them
+    """
+    resolved = True
+    for user_element, account_id in mentions:
+        if display_name := names.get(account_id):
+            user_element.replace_with(f"@{display_name}")
+        else:
+            # Fallback: just use the account ID
+            user_element.replace_with(f"@user_{account_id}")
+            resolved = False
+    return resolved
+
+
+def _convert_storage_html(
+    html_content: str,
+    output: ContentOutput,
+    markdown_parser: str,
+    names: dict[str, str],
+) -> tuple[str, str, bool]:
+    """
+    Convert storage-format HTML with already resolved user names.
+
+    This is the conversion pool task for process_html_content.
+
+    Args:
+        html_content: The HTML content to process
+        output: The formats to produce, see process_html_content
+        markdown_parser: Parser for Markdown-only conversions
+        names: Display names by account ID of the mentioned users
+
+    Returns:
+        Tuple of (processed_html, processed_markdown, mentions_resolved)
+    """
+    soup = _parse_html(html_content, output, markdown_parser)
+    mentions_resolved = _replace_user_mentions(_find_user_mentions(soup), names)
+    return (*_render_soup(soup, output), mentions_resolved)
+
 
 class ConfluenceClient(Protocol):
     """Protocol for Confluence client."""
@@ -23,7 +229,12 @@ class BasePreprocessor:
     """Base class for text preprocessing operations."""
 
     def __init__(
-        self, base_url: str = "", confluence_client: ConfluenceClient | None = None
+        self,
+        base_url: str = "",
+        confluence_client: ConfluenceClient | None = None,
+        conversion_store: ConversionStore | None = None,
+        markdown_parser: str | None = None,
+        conversion_pool: ConversionPool | None = None,
     ) -> None:
         """
         Initialize the base text preprocessor.
@@ -31,12 +242,28 @@ class BasePreprocessor:
         Args:
             base_url: Base URL for API server
             confluence_client: Optional Confluence client for user lookups
+            conversion_store: Optional persistent store for converted HTML
+            markdown_parser: Parser for Markdown-only conversions, see
+                get_markdown_parser
+            conversion_pool: Optional process pool for converting large inputs
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
         self.confluence_client = confluence_client
+        self.conversion_store = conversion_store
+        self.markdown_parser = get_markdown_parser(markdown_parser)
+        self.conversion_pool = conversion_pool
+
+    def _offload(self, content: str) -> bool:
+        """Return whether content is large enough for the conversion pool."""
+        pool = self.conversion_pool
+        return pool is not None and len(content) >= pool.min_length
 
     def process_html_content(
-        self, html_content: str, space_key: str = ""
+        self,
+        html_content: str,
+        space_key: str = "",
+        *,
+        output: ContentOutput = "both",
     ) -> tuple[str, str]:
         """
         Process HTML content to replace user refs and page links.
@@ -44,20 +271,51 @@ class BasePreprocessor:
         Args:
             html_content: The HTML content to process
             space_key: Optional space key for context
+            output: "html" or "markdown" to produce only that format; the
+                other element of the result is then an empty string
 
         Returns:
             Tuple of (processed_html, processed_markdown)
         """
-        try:
-            # Parse the HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
+        # Plain-text snippets (e.g. search excerpts) don't need an HTML parse
+        if (converted := _convert_plain_text(html_content)) is not None:
+            processed_html, processed_markdown = converted
+            return (
+                "" if output == "markdown" else processed_html,
+                "" if output == "html" else processed_markdown,
+            )
 
-            # Process user mentions
-            self._process_user_mentions_in_soup(soup)
+        # Large pages may have been converted before, possibly by another process
+        store_key = None
+        if self.conversion_store and len(html_content) >= MIN_STORED_LENGTH:
+            context = self.base_url if output == "both" else f"{self.base_url}|{output}"
+            store_key = self.conversion_store.key(html_content, context)
+            if (stored := self.conversion_store.get(store_key)) is not None:
+                return stored
 
-            # Convert to string and markdown
-            processed_html = str(soup)
-            processed_markdown = md(processed_html)
+        try:
+            if self._offload(html_content):
+                # Resolve the users in this process, where the client lives
+                names = self._resolve_display_names(
+                    set(_USER_ACCOUNT_ID_RE.findall(html_content))
+                )
+                processed_html, processed_markdown, mentions_resolved = (
+                    self.conversion_pool.run(
+                        _convert_storage_html,
+                        html_content,
+                        output,
+                        self.markdown_parser,
+                        names,
+                    )
+                )
+            else:
+                soup = _parse_html(html_content, output, self.markdown_parser)
+                mentions_resolved = self._process_user_mentions_in_soup(soup)
+                processed_html, processed_markdown = _render_soup(soup, output)
+
+            # Don't persist fallback mentions from failed user lookups
+            if store_key is not None and mentions_resolved:
+                self.conversion_store.put(store_key, processed_html, processed_markdown)
 
             return processed_html, processed_markdown
 
@@ -65,75 +323,83 @@ class BasePreprocessor:
             logger.error(f"Error in process_html_content: {str(e)}")
             raise
 
-    def _process_user_mentions_in_soup(self, soup: BeautifulSoup) -> None:
+    def _process_user_mentions_in_soup(self, soup: BeautifulSoup) -> bool:
         """
         Process user mentions in BeautifulSoup object.
 
+        Mentions are collected first so that every mentioned user is looked up
+        only once, concurrently, before the mentions are replaced.
+
         Args:
             soup: BeautifulSoup object containing HTML
+
+        Returns:
+            True if every mention was replaced with the user's display name,
+            False if a fallback was used for any of them
         """
-        # Find all ac:link elements that might contain user mentions
-        user_mentions = soup.find_all("ac:link")
+        mentions = _find_user_mentions(soup)
+        names = self._resolve_display_names({account_id for _, account_id in mentions})
+        return _replace_user_mentions(mentions, names)
 
-        for user_element in user_mentions:
-            user_ref = user_element.find("ri:user")
-            if user_ref and user_ref.get("ri:account-id"):
-                # Case 1: Direct user reference without link-body
-                account_id = user_ref.get("ri:account-id")
-                if isinstance(account_id, str):
-                    self._replace_user_mention(user_element, account_id)
-                    continue
-
-            # Case 2: User reference with link-body containing @
-            link_body = user_element.find("ac:link-body")
-            if link_body and "@" in link_body.get_text(strip=True):
-                user_ref = user_element.find("ri:user")
-                if user_ref and user_ref.get("ri:account-id"):
-                    account_id = user_ref.get("ri:account-id")
-                    if isinstance(account_id, str):
-                        self._replace_user_mention(user_element, account_id)
-
-    def _replace_user_mention(self, user_element: Tag, account_id: str) -> None:
+    def _resolve_display_names(self, account_ids: set[str]) -> dict[str, str]:
         """
-        Replace a user mention with the user's display name.
+        Look up the display names of users, using the shared name cache.
 
         Args:
-            user_element: The HTML element containing the user mention
-            account_id: The user's account ID
+            account_ids: The account IDs to resolve
+
+        Returns:
+            Dictionary of account ID to display name for the users that could
+            be resolved
         """
-        try:
-            # Only attempt to get user details if we have a valid confluence client
-            if self.confluence_client is not None:
-                user_details = self.confluence_client.get_user_details_by_accountid(
-                    account_id
-                )
-                display_name = user_details.get("displayName", "")
-                if display_name:
-                    new_text = f"@{display_name}"
-                    user_element.replace_with(new_text)
-                    return
-            # If we don't have a confluence client or couldn't get user details,
-            # use fallback
-            self._use_fallback_user_mention(user_element, account_id)
-        except Exception as e:
-            logger.warning(f"Error processing user mention: {str(e)}")
-            self._use_fallback_user_mention(user_element, account_id)
+        names = {}
+        missing = []
+        for account_id in account_ids:
+            if name := display_names.get(account_id):
+                names[account_id] = name
+            else:
+                missing.append(account_id)
+
+        if not missing or self.confluence_client is None:
+            return names
+
+        if len(missing) == 1:
+            lookups = map(self._fetch_display_name, missing)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(len(missing), MAX_MENTION_WORKERS)
+            ) as executor:
+                lookups = list(executor.map(self._fetch_display_name, missing))
+
+        for account_id, name in zip(missing, lookups, strict=True):
+            if name:
+                display_names.set(account_id, name)
+                names[account_id] = name
+        return names
 
-    def _use_fallback_user_mention(self, user_element: Tag, account_id: str) -> None:
+    def _fetch_display_name(self, account_id: str) -> str:
         """
-        Replace user mention with a fallback when the API call fails.
+        Fetch the display name of a user from Confluence.
 
         Args:
-            user_element: The HTML element containing the user mention
             account_id: The user's account ID
+
+        Returns:
+            The display name, or an empty string if the lookup failed
         """
-        # Fallback: just use the account ID
-        new_text = f"@user_{account_id}"
-        user_element.replace_with(new_text)
+        try:
+            user_details = self.confluence_client.get_user_details_by_accountid(
+                account_id
+            )
+            return user_details.get("displayName", "")
+        except Exception as e:  # noqa: BLE001 - Mentions fall back to the account ID
+            logger.warning(f"Error processing user mention: {str(e)}")
+            return ""
 
     def _convert_html_to_markdown(self, text: str) -> str:
         """Convert HTML content to markdown if needed."""
-        if re.search(r"<[^>]+>", text):
+        # The substring check skips the pattern scan for plain text
+        if "<" in text and _HTML_TAG_RE.search(text):
             try:
                 with warnings.catch_warnings():
                     warnings.filterwarnings("ignore", category=UserWarning)
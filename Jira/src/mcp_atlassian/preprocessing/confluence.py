@@ -1,8 +1,11 @@
 """Confluence-specific text preprocessing module."""
 
+import atexit
+import hashlib
 import logging
 import shutil
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -14,10 +17,83 @@ from md2conf.converter import (
     markdown_to_html,
 )
 
+from ..utils import TTLCache
 from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Number of Markdown bodies whose storage format is memoized per preprocessor
+STORAGE_CACHE_SIZE = 64
+
+# Options shared by all conversions; converters keep per-document state
+_CONVERTER_OPTIONS = ConfluenceConverterOptions(
+    ignore_invalid_url=True, heading_anchors=True, render_mermaid=False
+)
+
+_scratch_dir: Path | None = None
+_scratch_dir_lock = threading.Lock()
+
+
+def _get_scratch_dir() -> Path:
+    """
+    Return the directory md2conf resolves relative links and images against.
+
+    The directory is created once per process, stays empty and is removed
+    when the process exits.
+    """
+    global _scratch_dir
+    with _scratch_dir_lock:
+        if _scratch_dir is None or not _scratch_dir.is_dir():
+            _scratch_dir = Path(tempfile.mkdtemp(prefix="mcp-atlassian-"))
+            atexit.register(shutil.rmtree, _scratch_dir, ignore_errors=True)
+        return _scratch_dir
+
+
+def _markdown_to_storage(markdown_content: str) -> tuple[str, bool]:
+    """
+    Convert Markdown content to Confluence storage format (XHTML)
+
+    This is the conversion pool task for markdown_to_confluence_storage.
+
+    Args:
+        markdown_content: Markdown text to convert
+
+    Returns:
+        Tuple of the Confluence storage format (XHTML) string and whether the
+        conversion succeeded, as opposed to falling back to wrapped HTML
+    """
+    # First convert markdown to HTML
+    html_content = markdown_to_html(markdown_content)
+
+    try:
+        # Parse the HTML into an element tree
+        root = elements_from_string(html_content)
+
+        # Create a converter
+        scratch_dir = _get_scratch_dir()
+        converter = ConfluenceStorageFormatConverter(
+            options=_CONVERTER_OPTIONS,
+            path=scratch_dir / "page.md",
+            root_dir=scratch_dir,
+            page_metadata={},
+        )
+
+        # Transform the HTML to Confluence storage format
+        converter.visit(root)
+
+        # Convert the element tree back to a string
+        storage_format = elements_to_string(root)
+
+        return str(storage_format), True
+
+    except Exception as e:
+        logger.error(f"Error converting markdown to Confluence storage format: {e}")
+        logger.exception(e)
+
+        # Fall back to wrapping the HTML, which doesn't rely on the HTML macro
+        # This creates a proper Confluence storage format document
+        return f"<p>{html_content}</p>", False
+
 
 class ConfluencePreprocessor(BasePreprocessor):
     """Handles text preprocessing for Confluence content."""
@@ -32,6 +108,9 @@ class ConfluencePreprocessor(BasePreprocessor):
         """
         super().__init__(base_url=base_url, **kwargs)
 
+        # Storage format by Markdown hash; agents often resend the same body
+        self.storage_cache = TTLCache(ttl=float("inf"), maxsize=STORAGE_CACHE_SIZE)
+
     def markdown_to_confluence_storage(self, markdown_content: str) -> str:
         """
         Convert Markdown content to Confluence storage format (XHTML)
@@ -42,52 +121,20 @@ class ConfluencePreprocessor(BasePreprocessor):
         Returns:
             Confluence storage format (XHTML) string
         """
-        try:
-            # First convert markdown to HTML
-            html_content = markdown_to_html(markdown_content)
-
-            # Create a temporary directory for any potential attachments
-            temp_dir = tempfile.mkdtemp()
-
-            try:
-                # Parse the HTML into an element tree
-                root = elements_from_string(html_content)
-
-                # Create converter options
-                options = ConfluenceConverterOptions(
-                    ignore_invalid_url=True, heading_anchors=True, render_mermaid=False
-                )
-
-                # Create a converter
-                converter = ConfluenceStorageFormatConverter(
-                    options=options,
-                    path=Path(temp_dir) / "temp.md",
-                    root_dir=Path(temp_dir),
-                    page_metadata={},
-                )
-
-                # Transform the HTML to Confluence storage format
-                converter.visit(root)
-
-                # Convert the element tree back to a string
-                storage_format = elements_to_string(root)
-
-                return str(storage_format)
-            finally:
-                # Clean up the temporary directory
-                shutil.rmtree(temp_dir, ignore_errors=True)
-
-        except Exception as e:
-            logger.error(f"Error converting markdown to Confluence storage format: {e}")
-            logger.exception(e)
-
-            # Fall back to a simpler method if the conversion fails
-            html_content = markdown_to_html(markdown_content)
-
-            # Use a different approach that doesn't rely on the HTML macro
-            # This creates a proper Confluence storage format document
-            storage_format = f"""<p>{html_content}</p>"""
-
-            return str(storage_format)
+        key = hashlib.sha256(markdown_content.encode("utf-8", "surrogatepass")).digest()
+        if (storage_format := self.storage_cache.get(key)) is not None:
+            return storage_format
+
+        if self._offload(markdown_content):
+            storage_format, converted = self.conversion_pool.run(
+                _markdown_to_storage, markdown_content
+            )
+        else:
+            storage_format, converted = _markdown_to_storage(markdown_content)
+
+        # Only cache successful conversions so that a fallback is retried
+        if converted:
+            self.storage_cache.set(key, storage_format)
+        return storage_format
 
     # Confluence-specific methods can be added here
@@ -8,6 +8,136 @@ from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# User mentions and smart links, resolved before the markup is converted
+_MENTION_RE = re.compile(r"\[~accountid:(.*?)\]")
+_SMART_LINK_RE = re.compile(r"\[(.*?)\|(.*?)\|smart-link\]")
+_ISSUE_URL_RE = re.compile(r"browse/([A-Z]+-\d+)")
+_CONFLUENCE_PAGE_URL_RE = re.compile(r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)")
+_ISSUE_KEY_PREFIX_RE = re.compile(r"^[A-Z]+-\d+\s+")
+
+# Code and noformat blocks, whose content is never converted, and quote
+# markers. Every branch starts with a literal so the regex engine can skip
+# ahead to candidate positions; the trailing empty groups name the branch.
+_JIRA_BLOCK_RE = re.compile(
+    r"""
+    \{code(?::(?P<code_params>[^}]*))?\}
+    (?P<code_text>[^{]*(?:\{(?!code\})[^{]*)*)\{code\}(?P<code>)
+    | \{noformat(?::[^}]*)?\}
+    (?P<noformat_text>[^{]*(?:\{(?!noformat\})[^{]*)*)\{noformat\}(?P<noformat>)
+    | \{quote\}(?P<quote>)
+    """,
+    re.VERBOSE,
+)
+
+# Block markup is matched together with the line break before it. Text
+# effects must not start or end next to a word character, so identifiers
+# like snake_case_name or C++ are left alone.
+_JIRA_MARKUP_RE = re.compile(
+    r"""
+    \nh(?P<header_level>[1-6])\.[ \t]*(?P<header>)
+    | \nbq\.[ \t]*(?P<block_quote_text>[^\n]*)(?P<block_quote>)
+    | \n(?P<list_bullets>[#*+-]+)[ ](?P<list>)
+    | \n(?P<table_header_row>[ \t]*\|\|[^\n]*)(?P<table_header>)
+    | \{\{(?P<monospace_text>.+?)\}\}(?P<monospace>)
+    | \[[^\]\n]*\]\([^)\s]*\)(?P<markdown_link>)
+    | \[~[^\]\n]+\](?P<mention>)
+    | \[(?P<link_text>[^|\]\n]*)\|(?P<link_url>[^\]\n]+)\](?P<link>)
+    | \[(?P<autolink_url>(?:https?|ftp|file|mailto):[^\]\s|]+)\](?P<autolink>)
+    | !(?P<image_src>[^|\s!]+)(?:\|(?P<image_params>[^\n!]*))?!(?P<image>)
+    | \{color:(?P<color_value>[^}\n]+)\}(?P<color>)
+    | \{color\}(?P<color_end>)
+    | \*(?<![\w*]\*)(?P<strong_text>[^*\s](?:[^*\n]*?[^*\s])?)\*(?![\w*])(?P<strong>)
+    | _(?<![\w_]_)(?P<emphasis_text>[^_\s](?:[^_\n]*?[^_\s])?)_(?![\w_])(?P<emphasis>)
+    | \?\?(?P<citation_text>[^?\n]+?)\?\?(?P<citation>)
+    | \+(?<![\w+]\+)(?P<inserted_text>[^+\s](?:[^+\n]*?[^+\s])?)\+(?![\w+])
+      (?P<inserted>)
+    | \^(?P<superscript_text>[^^\s](?:[^^\n]*?[^^\s])?)\^(?P<superscript>)
+    | ~(?P<subscript_text>[^~\s](?:[^~\n]*?[^~\s])?)~(?P<subscript>)
+    """,
+    re.VERBOSE,
+)
+_JIRA_IMAGE_ALT_RE = re.compile(r"alt=([^,]+)")
+
+# Markdown/HTML wrapped around the converted content of text effects
+_JIRA_INLINE_WRAPPERS = {
+    "strong": ("**", "**"),
+    "emphasis": ("*", "*"),
+    "citation": ("<cite>", "</cite>"),
+    "inserted": ("<ins>", "</ins>"),
+    "superscript": ("<sup>", "</sup>"),
+    "subscript": ("<sub>", "</sub>"),
+}
+
+# Fenced code blocks, whose content is copied verbatim
+_MARKDOWN_CODE_BLOCK_RE = re.compile(
+    r"```(?P<code_language>\w*)\n(?P<code_text>[\s\S][^`]*(?:`(?!``)[^`]*)*)```"
+)
+
+# All other Markdown syntax, converted in one scan. As for Jira markup, every
+# branch starts with a literal and block syntax is matched together with the
+# line break before it. A line followed by an underline or a table separator
+# is matched as a whole to look ahead.
+_MARKDOWN_MARKUP_RE = re.compile(
+    r"""
+    \n(?P<underlined_text>[^\n]*)\n
+    (?:(?P<setext_rule>[=-]+)(?![^\n])|\|[-|\t\r\f\v ]+\|[^\n]*)(?P<underlined>)
+    | \n(?P<header_level>\#+)(?P<header>)
+    | \n(?P<bullet_indent>[ \t]*)-[ ](?P<bullet>)
+    | \n(?P<number_indent>[ \t]+)1\.[ ](?P<number>)
+    | `(?P<monospace_text>[^`]+)`(?P<monospace>)
+    | \*(?P<star_delimiter>\**)(?=\S)(?P<star_text>[^\n]*?\S)
+      \*(?P=star_delimiter)(?P<star>)
+    | _(?<!\w_)(?P<underscore_delimiter>_*)(?=\S)(?P<underscore_text>[^\n]*?\S)
+      _(?P=underscore_delimiter)(?!\w)(?P<underscore>)
+    | !\[(?P<image_alt>[^\]\n]*)\]\((?P<image_url>[^)\s]+)\)(?P<image>)
+    | \[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\)(?P<link>)
+    | <(?P<tag_name>cite|del|ins|sup|sub)>(?P<tag_text>.*?)</(?P=tag_name)>(?P<tag>)
+    | <span[ ]style="color:(?P<color_value>\#[^"]+)">(?P<color_text>[\s\S]*?)</span>
+      (?P<color>)
+    | <(?P<angle_text>[^>]+)>(?P<angle>)
+    | ~~(?P<strikethrough_text>.*?)~~(?P<strikethrough>)
+    """,
+    re.VERBOSE,
+)
+
+# Jira markup replacing the HTML formatting tags
+_MARKDOWN_TAG_MARKERS = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
+
+
+def _at_line_start(text: str, position: int) -> bool:
+    """Check whether a position in text is at the beginning of a line."""
+    return position == 0 or text[position - 1] == "\n"
+
+
+def _strip_newline(text: str) -> str:
+    """Remove one line break at each end, as written around block content."""
+    text = text.removeprefix("\r\n").removeprefix("\n")
+    return text.removesuffix("\n").removesuffix("\r")
+
+
+def _quote_lines(text: str) -> str:
+    """Prefix every line of text with a Markdown quote marker."""
+    return "> " + text.replace("\n", "\n> ")
+
+
+def _code_language(params: str) -> str:
+    """
+    Extract the language from {code} macro parameters.
+
+    Args:
+        params: Parameters after the colon, e.g. 'java' or 'title=A|language=sql'
+
+    Returns:
+        The language, or an empty string if none is given
+    """
+    for param in params.split("|"):
+        key, separator, value = param.partition("=")
+        if not separator:
+            return key.strip()
+        if key.strip() == "language":
+            return value.strip()
+    return ""
+
 
 class JiraPreprocessor(BasePreprocessor):
     """Handles text preprocessing for Jira content."""
@@ -33,8 +163,7 @@ class JiraPreprocessor(BasePreprocessor):
             return ""
 
         # Process user mentions
-        mention_pattern = r"\[~accountid:(.*?)\]"
-        text = self._process_mentions(text, mention_pattern)
+        text = self._process_mentions(text, _MENTION_RE)
 
         # Process Jira smart links
         text = self._process_smart_links(text)
@@ -47,64 +176,64 @@ class JiraPreprocessor(BasePreprocessor):
 
         return text.strip()
 
-    def _process_mentions(self, text: str, pattern: str) -> str:
+    def _process_mentions(self, text: str, pattern: re.Pattern) -> str:
         """
         Process user mentions in text.
 
         Args:
             text: The text containing mentions
-            pattern: Regular expression pattern to match mentions
+            pattern: Compiled pattern matching mentions, with the account ID as
+                first group
 
         Returns:
             Text with mentions replaced with display names
         """
-        mentions = re.findall(pattern, text)
-        for account_id in mentions:
-            try:
-                # Note: This is a placeholder - actual user fetching should be injected
-                display_name = f"User:{account_id}"
-                text = text.replace(f"[~accountid:{account_id}]", display_name)
-            except Exception as e:
-                logger.error(f"Error processing mention for {account_id}: {str(e)}")
-        return text
+
+        def replace_mention(match: re.Match) -> str:
+            # Note: This is a placeholder - actual user fetching should be injected
+            return f"User:{match.group(1)}"
+
+        return pattern.sub(replace_mention, text)
 
     def _process_smart_links(self, text: str) -> str:
         """Process Jira/Confluence smart links."""
         # Pattern matches: [text|url|smart-link]
-        link_pattern = r"\[(.*?)\|(.*?)\|smart-link\]"
-        matches = re.finditer(link_pattern, text)
-
-        for match in matches:
-            full_match = match.group(0)
-            link_text = match.group(1)
-            link_url = match.group(2)
-
-            # Extract issue key if it's a Jira issue link
-            issue_key_match = re.search(r"browse/([A-Z]+-\d+)", link_url)
-            # Check if it's a Confluence wiki link
-            confluence_match = re.search(
-                r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)", link_url
-            )
+        return _SMART_LINK_RE.sub(self._convert_smart_link, text)
 
-            if issue_key_match:
-                issue_key = issue_key_match.group(1)
-                clean_url = f"{self.base_url}/browse/{issue_key}"
-                text = text.replace(full_match, f"[{issue_key}]({clean_url})")
-            elif confluence_match:
-                url_title = confluence_match.group(1)
-                readable_title = url_title.replace("+", " ")
-                readable_title = re.sub(r"^[A-Z]+-\d+\s+", "", readable_title)
-                text = text.replace(full_match, f"[{readable_title}]({link_url})")
-            else:
-                clean_url = link_url.split("?")[0]
-                text = text.replace(full_match, f"[{link_text}]({clean_url})")
+    def _convert_smart_link(self, match: re.Match) -> str:
+        """
+        Convert one smart link to a Markdown link.
+
+        Args:
+            match: Match of the smart link pattern
+
+        Returns:
+            The Markdown link
+        """
+        link_text = match.group(1)
+        link_url = match.group(2)
+
+        # Extract issue key if it's a Jira issue link
+        if issue_key_match := _ISSUE_URL_RE.search(link_url):
+            issue_key = issue_key_match.group(1)
+            return f"[{issue_key}]({self.base_url}/browse/{issue_key})"
 
-        return text
+        # Check if it's a Confluence wiki link
+        if confluence_match := _CONFLUENCE_PAGE_URL_RE.search(link_url):
+            readable_title = confluence_match.group(1).replace("+", " ")
+            readable_title = _ISSUE_KEY_PREFIX_RE.sub("", readable_title)
+            return f"[{readable_title}]({link_url})"
+
+        return f"[{link_text}]({link_url.split('?')[0]})"
 
     def jira_to_markdown(self, input_text: str) -> str:
         """
         Convert Jira markup to Markdown format.
 
+        The text is converted in a single pass: code and noformat blocks are
+        copied verbatim and all other markup is converted by one combined
+        pattern, so converted output is never matched again.
+
         Args:
             input_text: Text in Jira markup format
 
@@ -114,126 +243,118 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
-        # Block quotes
-        output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
-
-        # Text formatting (bold, italic)
-        output = re.sub(
-            r"([*_])(.*?)\1",
-            lambda match: ("**" if match.group(1) == "*" else "*")
-            + match.group(2)
-            + ("**" if match.group(1) == "*" else "*"),
-            output,
-        )
-
-        # Multi-level numbered list
-        output = re.sub(
-            r"^((?:#|-|\+|\*)+) (.*)$",
-            lambda match: self._convert_jira_list_to_markdown(match),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Headers
-        output = re.sub(
-            r"^h([0-6])\.(.*)$",
-            lambda match: "#" * int(match.group(1)) + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Inline code
-        output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
-
-        # Citation
-        output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
-
-        # Inserted text
-        output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
-
-        # Superscript
-        output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
-
-        # Subscript
-        output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
-
-        # Strikethrough
-        output = re.sub(r"-([^-]*)-", r"-\1-", output)
-
-        # Code blocks with optional language specification
-        output = re.sub(
-            r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
-            r"```\1\n\2\n```",
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # No format
-        output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
-
-        # Quote blocks
-        output = re.sub(
-            r"\{quote\}([\s\S]*)\{quote\}",
-            lambda match: "\n".join(
-                [f"> {line}" for line in match.group(1).split("\n")]
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Images with alt text
-        output = re.sub(
-            r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!",
-            r"![\3](\1)",
-            output,
-        )
-
-        # Images with other parameters (ignore them)
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
-
-        # Images without parameters
-        output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
-
-        # Links
-        output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
-        output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
-
-        # Colored text
-        output = re.sub(
-            r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
-            r"<span style=\"color:\1\">\2</span>",
-            output,
-            flags=re.MULTILINE,
-        )
+        parts = []
+        quoted = False
+        position = 0
+        for match in _JIRA_BLOCK_RE.finditer(input_text):
+            if match.start() > position:
+                parts.append(
+                    self._render_jira_text(
+                        input_text[position : match.start()],
+                        quoted=quoted,
+                        at_line_start=_at_line_start(input_text, position),
+                    )
+                )
+            position = match.end()
+
+            if match.lastgroup == "quote":
+                quoted = not quoted
+                continue
+
+            if match.lastgroup == "code":
+                language = _code_language(match.group("code_params") or "")
+                content = match.group("code_text")
+            else:
+                language = ""
+                content = match.group("noformat_text")
+            block = f"```{language}\n{_strip_newline(content)}\n```"
+            parts.append(_quote_lines(block) if quoted else block)
+
+        if position < len(input_text):
+            parts.append(
+                self._render_jira_text(
+                    input_text[position:],
+                    quoted=quoted,
+                    at_line_start=_at_line_start(input_text, position),
+                )
+            )
 
-        # Convert Jira table headers (||) to markdown table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        return "".join(parts)
 
-            if "||" in line:
-                # Replace Jira table headers
-                lines[i] = lines[i].replace("||", "|")
+    def _render_jira_text(self, text: str, *, quoted: bool, at_line_start: bool) -> str:
+        """
+        Convert Jira markup outside of code blocks to Markdown.
 
-                # Add a separator line for markdown tables
-                header_cells = lines[i].count("|") - 1
-                if header_cells > 0:
-                    separator_line = "|" + "---|" * header_cells
-                    lines.insert(i + 1, separator_line)
-                    i += 1  # Skip the newly inserted line in next iteration
+        Args:
+            text: The text between code blocks
+            quoted: Whether the text is inside a {quote} block
+            at_line_start: Whether the text starts at the beginning of a line
 
-            i += 1
+        Returns:
+            The converted text
+        """
+        if at_line_start:
+            # Block markup is matched after a line break, also on the first line
+            output = _JIRA_MARKUP_RE.sub(self._render_jira_token, "\n" + text)[1:]
+        else:
+            output = _JIRA_MARKUP_RE.sub(self._render_jira_token, text)
+        return _quote_lines(output) if quoted else output
+
+    def _render_jira_token(self, match: re.Match) -> str:
+        """
+        Convert one Jira markup token to Markdown.
 
-        # Rejoin the lines
-        output = "\n".join(lines)
+        Args:
+            match: Match of the combined markup pattern
 
-        return output
+        Returns:
+            The Markdown for the token
+        """
+        kind = match.lastgroup
+        if kind in _JIRA_INLINE_WRAPPERS:
+            opening, closing = _JIRA_INLINE_WRAPPERS[kind]
+            inner = _JIRA_MARKUP_RE.sub(
+                self._render_jira_token, match.group(f"{kind}_text")
+            )
+            return f"{opening}{inner}{closing}"
+        if kind == "header":
+            return f"\n{'#' * int(match.group('header_level'))} "
+        if kind == "list":
+            return f"\n{self._convert_jira_list_to_markdown(match)} "
+        if kind == "block_quote":
+            text = match.group("block_quote_text")
+            return f"\n> {_JIRA_MARKUP_RE.sub(self._render_jira_token, text)}\n"
+        if kind == "table_header":
+            # Markdown tables need a separator line below the header row
+            row = match.group("table_header_row").replace("||", "|")
+            row = _JIRA_MARKUP_RE.sub(self._render_jira_token, row)
+            cells = row.count("|") - 1
+            return f"\n{row}\n|{'---|' * cells}" if cells > 0 else f"\n{row}"
+        if kind == "monospace":
+            return f"`{match.group('monospace_text')}`"
+        if kind == "link":
+            return f"[{match.group('link_text')}]({match.group('link_url')})"
+        if kind == "autolink":
+            return f"<{match.group('autolink_url')}>"
+        if kind == "image":
+            alt_match = _JIRA_IMAGE_ALT_RE.search(match.group("image_params") or "")
+            alt = alt_match.group(1) if alt_match else ""
+            return f"![{alt}]({match.group('image_src')})"
+        if kind == "color":
+            return f'<span style="color:{match.group("color_value")}">'
+        if kind == "color_end":
+            return "</span>"
+        # Markdown links and mentions are kept as they are
+        return match.group(0)
 
     def markdown_to_jira(self, input_text: str) -> str:
         """
         Convert Markdown syntax to Jira markup syntax.
 
+        The text is converted in a single pass: fenced code blocks and inline
+        code are copied verbatim and all other syntax is converted by one
+        combined pattern, so converted output is never matched again.
+
         Args:
             input_text: Text in Markdown format
 
@@ -243,154 +364,121 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
-        # Save code blocks to prevent recursive processing
-        code_blocks = []
-        inline_codes = []
-
-        # Extract code blocks
-        def save_code_block(match: re.Match) -> str:
-            """
-            Process and save a code block.
-
-            Args:
-                match: Regex match object containing the code block
-
-            Returns:
-                Jira-formatted code block
-            """
-            syntax = match.group(1) or ""
-            content = match.group(2)
-            code = "{code"
-            if syntax:
-                code += ":" + syntax
-            code += "}" + content + "{code}"
-            code_blocks.append(code)
-            return str(code)  # Ensure we return a string
-
-        # Extract inline code
-        def save_inline_code(match: re.Match) -> str:
-            """
-            Process and save inline code.
-
-            Args:
-                match: Regex match object containing the inline code
-
-            Returns:
-                Jira-formatted inline code
-            """
-            content = match.group(1)
-            code = "{{" + content + "}}"
-            inline_codes.append(code)
-            return str(code)  # Ensure we return a string
-
-        # Save code sections temporarily
-        output = re.sub(r"```(\w*)\n([\s\S]+?)```", save_code_block, input_text)
-        output = re.sub(r"`([^`]+)`", save_inline_code, output)
-
-        # Headers with = or - underlines
-        output = re.sub(
-            r"^(.*?)\n([=-])+$",
-            lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Headers with # prefix
-        output = re.sub(
-            r"^([#]+)(.*?)$",
-            lambda match: f"h{len(match.group(1))}." + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Bold and italic
-        output = re.sub(
-            r"([*_]+)(.*?)\1",
-            lambda match: ("_" if len(match.group(1)) == 1 else "*")
-            + match.group(2)
-            + ("_" if len(match.group(1)) == 1 else "*"),
-            output,
-        )
-
-        # Multi-level bulleted list
-        output = re.sub(
-            r"^(\s*)- (.*)$",
-            lambda match: (
-                "* " + match.group(2)
-                if not match.group(1)
-                else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Multi-level numbered list
-        output = re.sub(
-            r"^(\s+)1\. (.*)$",
-            lambda match: "#" * (int(len(match.group(1)) / 4) + 2)
-            + " "
-            + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # HTML formatting tags to Jira markup
-        tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
-
-        for tag, replacement in tag_map.items():
-            output = re.sub(
-                rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output
+        parts = []
+        position = 0
+        for match in _MARKDOWN_CODE_BLOCK_RE.finditer(input_text):
+            if match.start() > position:
+                parts.append(
+                    self._render_markdown_text(
+                        input_text[position : match.start()],
+                        at_line_start=_at_line_start(input_text, position),
+                    )
+                )
+            position = match.end()
+
+            language = match.group("code_language")
+            parts.append(f"{{code:{language}}}" if language else "{code}")
+            parts.append(match.group("code_text") + "{code}")
+
+        if position < len(input_text):
+            parts.append(
+                self._render_markdown_text(
+                    input_text[position:],
+                    at_line_start=_at_line_start(input_text, position),
+                )
             )
 
-        # Colored text
-        output = re.sub(
-            r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>",
-            r"{color:\1}\2{color}",
-            output,
-            flags=re.MULTILINE,
-        )
+        return "".join(parts)
 
-        # Strikethrough
-        output = re.sub(r"~~(.*?)~~", r"-\1-", output)
+    def _render_markdown_text(self, text: str, *, at_line_start: bool) -> str:
+        """
+        Convert Markdown outside of fenced code blocks to Jira markup.
 
-        # Images without alt text
-        output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
+        Args:
+            text: The text between code blocks
+            at_line_start: Whether the text starts at the beginning of a line
 
-        # Images with alt text
-        output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
+        Returns:
+            The converted text
+        """
+        if at_line_start:
+            # Block syntax is matched after a line break, also on the first line
+            return _MARKDOWN_MARKUP_RE.sub(self._render_markdown_token, "\n" + text)[1:]
+        return _MARKDOWN_MARKUP_RE.sub(self._render_markdown_token, text)
 
-        # Links
-        output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
-        output = re.sub(r"<([^>]+)>", r"[\1]", output)
+    def _render_markdown_token(self, match: re.Match) -> str:
+        """
+        Convert one Markdown token to Jira markup.
 
-        # Convert markdown tables to Jira table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
-                # Convert header row to Jira format
-                lines[i] = lines[i].replace("|", "||")
-                # Remove the separator line
-                lines.pop(i + 1)
-            i += 1
+        Args:
+            match: Match of the combined Markdown pattern
 
-        # Rejoin the lines
-        output = "\n".join(lines)
+        Returns:
+            The Jira markup for the token
+        """
+        kind = match.lastgroup
+        if kind == "underlined":
+            text = match.group("underlined_text")
+            rule = match.group("setext_rule")
+            if rule is None:
+                # Table header row: the separator line below it is dropped
+                row = self._render_markdown_text(text, at_line_start=True)
+                return "\n" + row.replace("|", "||")
+            if not text.strip():
+                return match.group(0)
+            level = 1 if rule[-1] == "=" else 2
+            inner = _MARKDOWN_MARKUP_RE.sub(self._render_markdown_token, text)
+            return f"\nh{level}. {inner}"
+        if kind == "header":
+            return f"\nh{len(match.group('header_level'))}."
+        if kind == "bullet":
+            indent = len(match.group("bullet_indent"))
+            return f"\n{'  ' * (indent // 2)}* "
+        if kind == "number":
+            indent = len(match.group("number_indent"))
+            return f"\n{'#' * (indent // 4 + 2)} "
+        if kind == "monospace":
+            return f"{{{{{match.group('monospace_text')}}}}}"
+        if kind == "image":
+            alt = match.group("image_alt")
+            if not alt:
+                return f"!{match.group('image_url')}!"
+            alt = _MARKDOWN_MARKUP_RE.sub(self._render_markdown_token, alt)
+            return f"!{match.group('image_url')}|alt={alt}!"
+        if kind == "link":
+            text = _MARKDOWN_MARKUP_RE.sub(
+                self._render_markdown_token, match.group("link_text")
+            )
+            return f"[{text}|{match.group('link_url')}]"
+        if kind == "angle":
+            return f"[{match.group('angle_text')}]"
 
-        return output
+        inner = _MARKDOWN_MARKUP_RE.sub(
+            self._render_markdown_token, match.group(f"{kind}_text")
+        )
+        if kind == "star":
+            marker = "*" if match.group("star_delimiter") else "_"
+        elif kind == "underscore":
+            marker = "*" if match.group("underscore_delimiter") else "_"
+        elif kind == "tag":
+            marker = _MARKDOWN_TAG_MARKERS[match.group("tag_name")]
+        elif kind == "color":
+            return f"{{color:{match.group('color_value')}}}{inner}{{color}}"
+        else:
+            marker = "-"
+        return f"{marker}{inner}{marker}"
 
     def _convert_jira_list_to_markdown(self, match: re.Match) -> str:
         """
-        Helper method to convert Jira lists to Markdown format.
+        Helper method to convert Jira list bullets to a Markdown list marker.
 
         Args:
-            match: Regex match object containing the Jira list markup
+            match: Regex match object containing the Jira list bullets
 
         Returns:
-            Markdown-formatted list item
+            Indented Markdown list marker
         """
-        jira_bullets = match.group(1)
-        content = match.group(2)
+        jira_bullets = match.group("list_bullets")
 
         # Calculate indentation level based on number of symbols
         indent_level = len(jira_bullets) - 1
@@ -400,4 +488,4 @@ class JiraPreprocessor(BasePreprocessor):
         last_char = jira_bullets[-1]
         prefix = "1." if last_char == "#" else "-"
 
-        return f"{indent}{prefix} {content}"
+        return f"{indent}{prefix}"
@@ -0,0 +1,120 @@
+"""Process pool for CPU-bound document conversions.
+
+Converting large documents between storage format and Markdown holds the GIL
+for the whole conversion, so a few large pages stall every other request the
+server handles. Conversions of large inputs can instead run in worker
+processes. Task functions must be module-level functions taking and
+returning picklable values.
+
+The pool is disabled unless ``CONFLUENCE_CONVERSION_WORKERS`` is set to a
+positive number of worker processes; inputs shorter than
+``CONFLUENCE_CONVERSION_PROCESS_MIN_KB`` (default 64) are converted inline,
+where they finish faster than a round trip to a worker.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, TypeVar
+
+logger = logging.getLogger("mcp-atlassian")
+
+T = TypeVar("T")
+
+# Default size from which a conversion is sent to a worker process
+DEFAULT_MIN_LENGTH = 64 * 1024
+
+
+def _warm_up() -> int:
+    """Import the conversion libraries in a worker process."""
+    # Imported here so that starting a worker pays for it, not the first task
+    from . import confluence  # noqa: F401
+
+    return os.getpid()
+
+
+class ConversionPool:
+    """Pool of worker processes running conversions of large inputs."""
+
+    def __init__(self, max_workers: int, min_length: int = DEFAULT_MIN_LENGTH) -> None:
+        """
+        Create a conversion pool; worker processes start on first use or warm().
+
+        Args:
+            max_workers: Number of worker processes
+            min_length: Input length from which conversions use the pool
+        """
+        self.max_workers = max_workers
+        self.min_length = min_length
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ConversionPool | None":
+        """
+        Create a pool from environment variables.
+
+        Returns:
+            The configured pool, or None if CONFLUENCE_CONVERSION_WORKERS is not
+            set to a positive number
+        """
+        try:
+            max_workers = int(os.getenv("CONFLUENCE_CONVERSION_WORKERS", "0"))
+            min_kb = int(os.getenv("CONFLUENCE_CONVERSION_PROCESS_MIN_KB", "64"))
+        except ValueError as e:
+            logger.warning(f"Invalid conversion pool setting: {str(e)}")
+            return None
+        if max_workers <= 0:
+            return None
+        return cls(max_workers, min_length=min_kb * 1024)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Return the executor, starting it if needed."""
+        with self._lock:
+            if self._executor is None:
+                # Spawned workers don't inherit the server's threads and locks
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def warm(self) -> None:
+        """Start every worker process and import the conversion libraries."""
+        executor = self._get_executor()
+        wait([executor.submit(_warm_up) for _ in range(self.max_workers)])
+        logger.debug(f"Started {self.max_workers} conversion worker processes")
+
+    def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a conversion in a worker process.
+
+        Args:
+            func: Module-level function to call
+            *args: Picklable arguments for func
+
+        Returns:
+            The result of func; if the pool broke, e.g. because a worker was
+            killed, func is run inline and the pool is restarted on next use
+        """
+        executor = self._get_executor()
+        try:
+            return executor.submit(func, *args).result()
+        except BrokenProcessPool as e:
+            logger.warning(f"Conversion pool failed, converting inline: {str(e)}")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            return func(*args)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,111 @@
+"""Splitting of storage-format pages into sections at their headings.
+
+Large pages can be read a few sections at a time. Sections are found with a
+lightweight scan of the tags instead of an HTML parse, so each section can
+then be parsed and converted on its own.
+"""
+
+import html
+import re
+from typing import NamedTuple
+
+# Tags, plus CDATA sections and comments whose content is skipped
+_TAG_RE = re.compile(
+    r"<!\[CDATA\[[\s\S]*?\]\]>|<!--[\s\S]*?-->"
+    r"|<(?P<closing>/?)(?P<name>[a-zA-Z][\w:.-]*)"
+    r"(?:\"[^\"]*\"|'[^']*'|[^'\">])*?(?P<self_closing>/?)>"
+)
+_HEADING_RE = re.compile(r"h[1-6]", re.IGNORECASE)
+_MARKUP_RE = re.compile(r"<[^>]*>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Elements without content or end tag
+_VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+# Page layout containers, whose headings still start top-level sections
+_LAYOUT_ELEMENTS = frozenset({"ac:layout", "ac:layout-section", "ac:layout-cell"})
+
+
+class StorageSection(NamedTuple):
+    """A section of a storage-format page, starting at a heading."""
+
+    index: int
+    level: int  # Heading level, 0 for content before the first heading
+    title: str
+    start: int
+    end: int
+
+
+def _heading_title(html_content: str, start: int, name: str) -> str:
+    """Return the text of the heading element starting at start."""
+    end_match = re.compile(rf"</{name}\s*>", re.IGNORECASE).search(html_content, start)
+    inner = html_content[start : end_match.start() if end_match else start]
+    inner = inner[inner.find(">") + 1 :]
+    text = html.unescape(_MARKUP_RE.sub("", inner))
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def split_storage_sections(html_content: str) -> list[StorageSection]:
+    """
+    Split storage-format HTML at its top-level headings.
+
+    Headings nested in other elements such as tables, panels or expand
+    macros stay within their section; headings in page layout cells start
+    sections like top-level ones. Content before the first heading is
+    section 0 unless it is blank.
+
+    Args:
+        html_content: The storage-format HTML
+
+    Returns:
+        The sections in page order, covering the whole content
+    """
+    # (start, level, title) of each section
+    starts: list[tuple[int, int, str]] = [(0, 0, "")]
+    depth = 0
+    for match in _TAG_RE.finditer(html_content):
+        name = match.group("name")
+        if name is None:
+            continue
+        name = name.lower()
+        if match.group("self_closing") or name in _VOID_ELEMENTS:
+            continue
+        if name in _LAYOUT_ELEMENTS:
+            continue
+        if match.group("closing"):
+            depth = max(depth - 1, 0)
+            continue
+        if depth == 0 and _HEADING_RE.fullmatch(name):
+            title = _heading_title(html_content, match.start(), name)
+            starts.append((match.start(), int(name[1]), title))
+        depth += 1
+
+    # The content before the first heading is often empty
+    if len(starts) > 1 and not html_content[: starts[1][0]].strip():
+        starts.pop(0)
+        starts[0] = (0, *starts[0][1:])
+
+    ends = [start for start, _, _ in starts[1:]] + [len(html_content)]
+    return [
+        StorageSection(index, level, title, start, end)
+        for index, ((start, level, title), end) in enumerate(
+            zip(starts, ends, strict=True)
+        )
+    ]
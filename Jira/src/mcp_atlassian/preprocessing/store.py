@@ -0,0 +1,197 @@
+"""Persistent store for converted Confluence content.
+
+Converting large storage-format pages to markdown is expensive, so converted
+content can be kept in a SQLite database shared by server processes and
+restarts. Entries are addressed by a hash of the input HTML and evicted in
+least-recently-used order once the store exceeds its size cap.
+
+The store is disabled unless ``CONFLUENCE_CONVERSION_STORE`` points to a
+database file; ``CONFLUENCE_CONVERSION_STORE_MAX_MB`` sets the size cap.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+logger = logging.getLogger("mcp-atlassian")
+
+# Bump when the conversion output changes so stale entries are never served
+STORE_FORMAT = 1
+
+# Skip eviction bookkeeping for writes until the store grows by this much
+_EVICTION_SLACK = 0.1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    key TEXT PRIMARY KEY,
+    html TEXT NOT NULL,
+    markdown TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS conversions_last_used ON conversions (last_used);
+"""
+
+
+def _converter_version() -> str:
+    """Return the markdownify version the conversion output depends on."""
+    try:
+        return version("markdownify")
+    except PackageNotFoundError:  # pragma: no cover - markdownify is required
+        return "unknown"
+
+
+class ConversionStore:
+    """SQLite-backed store mapping storage HTML to its (html, markdown) conversion."""
+
+    def __init__(self, path: str | Path, max_bytes: int = 200 * 1024 * 1024) -> None:
+        """
+        Open (and create if needed) a conversion store.
+
+        Args:
+            path: Path of the SQLite database file
+            max_bytes: Size cap of the stored content before old entries are evicted
+        """
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self._salt = f"{STORE_FORMAT}:{_converter_version()}"
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=5, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._size = self._total_size()
+
+    @classmethod
+    def from_env(cls) -> "ConversionStore | None":
+        """
+        Create a store from environment variables.
+
+        Returns:
+            The configured store, or None if CONFLUENCE_CONVERSION_STORE is not
+            set or the database cannot be opened
+        """
+        path = os.getenv("CONFLUENCE_CONVERSION_STORE")
+        if not path:
+            return None
+
+        max_mb = int(os.getenv("CONFLUENCE_CONVERSION_STORE_MAX_MB", "200"))
+        try:
+            return cls(path, max_bytes=max_mb * 1024 * 1024)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open conversion store at {path}: {str(e)}")
+            return None
+
+    def key(self, html_content: str, context: str = "") -> str:
+        """
+        Compute the content address of an input.
+
+        Args:
+            html_content: The storage-format HTML
+            context: Anything else the conversion depends on, e.g. the base URL
+
+        Returns:
+            Hex digest identifying the input
+        """
+        digest = hashlib.sha256()
+        for part in (self._salt, context, html_content):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[str, str] | None:
+        """
+        Look up a conversion and mark it as recently used.
+
+        Args:
+            key: Content address from key()
+
+        Returns:
+            Tuple of (processed_html, processed_markdown), or None on a miss
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT html, markdown FROM conversions WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    self._connection.execute(
+                        "UPDATE conversions SET last_used = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Conversion store lookup failed: {str(e)}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, processed_html: str, processed_markdown: str) -> None:
+        """
+        Store a conversion, evicting least recently used entries over the cap.
+
+        Args:
+            key: Content address from key()
+            processed_html: The processed HTML
+            processed_markdown: The converted markdown
+        """
+        size = len(processed_html.encode()) + len(processed_markdown.encode())
+        if size > self.max_bytes:
+            return
+
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO conversions "
+                    "(key, html, markdown, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                    (key, processed_html, processed_markdown, size, time.time()),
+                )
+                self._size += size
+                if self._size > self.max_bytes * (1 + _EVICTION_SLACK):
+                    self._evict()
+        except sqlite3.Error as e:
+            logger.warning(f"Conversion store write failed: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove all stored conversions."""
+        with self._lock:
+            self._connection.execute("DELETE FROM conversions")
+            self._size = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _total_size(self) -> int:
+        row = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM conversions"
+        ).fetchone()
+        return row[0]
+
+    def _evict(self) -> None:
+        # Other processes write to the same database, so recount first
+        self._size = self._total_size()
+        excess = self._size - self.max_bytes
+        if excess <= 0:
+            return
+
+        # Delete the least recently used entries covering the excess
+        self._connection.execute(
+            """
+            DELETE FROM conversions WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, size, SUM(size) OVER (ORDER BY last_used, key) AS freed
+                    FROM conversions
+                ) WHERE freed - size < ?
+            )
+            """,
+            (excess,),
+        )
+        self._size = self._total_size()
@@ -1,15 +1,18 @@
+import asyncio
 import json
 import logging
 import os
 from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urlparse
 
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
 from mcp.types import Resource, TextContent, Tool
 
+from .compact import OutputOptions, read_continuation
 from .confluence import ConfluenceFetcher
 from .jira import JiraFetcher
 from .utils import is_atlassian_cloud_url
@@ -24,6 +27,7 @@ class AppContext:
 
     confluence: ConfluenceFetcher | None = None
     jira: JiraFetcher | None = None
+    output: OutputOptions = field(default_factory=OutputOptions)
 
 
 def get_available_services() -> dict[str, bool | None]:
@@ -77,12 +81,18 @@ async def server_lifespan(server: Server) -> AsyncIterator[AppContext]:
     """Initialize and clean up application resources."""
     # Get available services
     services = get_available_services()
+    conversion_pool = None
 
     try:
         # Initialize services
         confluence = ConfluenceFetcher() if services["confluence"] else None
         jira = JiraFetcher() if services["jira"] else None
 
+        # Start the conversion workers before the first request needs them
+        if confluence and confluence.preprocessor.conversion_pool:
+            conversion_pool = confluence.preprocessor.conversion_pool
+            await asyncio.to_thread(conversion_pool.warm)
+
         # Log the startup information
         logger.info("Starting MCP Atlassian server")
         if confluence:
@@ -93,15 +103,65 @@ async def server_lifespan(server: Server) -> AsyncIterator[AppContext]:
             logger.info(f"Jira URL: {jira_url}")
 
         # Provide context to the application
-        yield AppContext(confluence=confluence, jira=jira)
+        yield AppContext(
+            confluence=confluence, jira=jira, output=OutputOptions.from_env()
+        )
     finally:
         # Cleanup resources if needed
-        pass
+        if conversion_pool is not None:
+            conversion_pool.shutdown()
 
 
 # Create server instance
 app = Server("mcp-atlassian", lifespan=server_lifespan)
 
+# Read tools whose results honour the per-call output options
+READ_TOOLS = frozenset(
+    {
+        "confluence_search",
+        "confluence_get_page",
+        "confluence_get_page_children",
+        "confluence_get_page_ancestors",
+        "confluence_get_page_tree",
+        "confluence_get_comments",
+        "confluence_get_attachments",
+        "jira_get_issue",
+        "jira_search",
+        "jira_get_project_issues",
+        "jira_get_worklog",
+        "jira_get_epic_issues",
+        "jira_get_transitions",
+    }
+)
+
+# Number of recently modified pages included in a confluence://SPACE resource
+SPACE_RESOURCE_PAGES = 20
+
+# Per-call output options accepted by the read tools
+OUTPUT_OPTION_PROPERTIES = {
+    "compact": {
+        "type": "boolean",
+        "description": "Return minified JSON without empty values, with repeated "
+        "users/statuses moved into a 'refs' lookup table. Defaults to the "
+        "ATLASSIAN_COMPACT_OUTPUT setting.",
+    },
+    "max_text_length": {
+        "type": "integer",
+        "description": "Maximum number of characters per description/body/content "
+        "field. Longer texts are cut and a '<field>_continuation' handle is added; "
+        "fetch the rest with atlassian_get_continuation.",
+        "minimum": 1,
+    },
+    "truncation": {
+        "type": "string",
+        "description": "How texts over max_text_length are shortened: 'head' "
+        "keeps the beginning, 'summary' keeps the beginning and end plus the "
+        "headings and code fences in between; the continuation holds the "
+        "omitted part. Defaults to the ATLASSIAN_TEXT_TRUNCATION setting.",
+        "enum": ["head", "summary"],
+    },
+}
+
 
 # Implement server handlers
 @app.list_resources()
@@ -115,7 +175,9 @@ async def list_resources() -> list[Resource]:
     if ctx and ctx.confluence:
         try:
             # Get spaces the user has contributed to
-            spaces = ctx.confluence.get_user_contributed_spaces(limit=250)
+            spaces = await asyncio.to_thread(
+                ctx.confluence.get_user_contributed_spaces, limit=250
+            )
 
             # Add spaces to resources
             resources.extend(
@@ -141,11 +203,13 @@ async def list_resources() -> list[Resource]:
     if ctx and ctx.jira:
         try:
             # Get current user's account ID
-            account_id = ctx.jira.get_current_user_account_id()
+            account_id = await asyncio.to_thread(ctx.jira.get_current_user_account_id)
 
             # Use JQL to find issues the user is assigned to or reported
             jql = f"assignee = {account_id} OR reporter = {account_id} ORDER BY updated DESC"
-            issues = ctx.jira.jira.jql(jql, limit=250, fields=["project"])
+            issues = await asyncio.to_thread(
+                ctx.jira.jira.jql, jql, limit=250, fields=["project"]
+            )
 
             # Extract and deduplicate projects
             projects = {}
@@ -180,7 +244,7 @@ async def list_resources() -> list[Resource]:
 
 
 @app.read_resource()
-async def read_resource(uri: str) -> tuple[str, str]:
+async def read_resource(uri: str) -> tuple[str, str] | list[ReadResourceContents]:
     """Read content from Confluence based on the resource URI."""
     parsed_uri = urlparse(uri)
 
@@ -199,13 +263,27 @@ async def read_resource(uri: str) -> tuple[str, str]:
         if len(parts) == 1:
             space_key = parts[0]
 
-            # Use CQL to find recently updated pages in this space
-            cql = f'space = "{space_key}" AND contributor = currentUser() ORDER BY lastmodified DESC'
-            pages = ctx.confluence.search(cql=cql, limit=20)
+            if ctx.confluence.get_space_snapshot(space_key) is not None:
+                # Serve the most recently modified pages from the space
+                # snapshot, which only needs a delta query once synced
+                snapshot = await asyncio.to_thread(
+                    ctx.confluence.sync_space_snapshot, space_key
+                )
+                pages = snapshot.recent(SPACE_RESOURCE_PAGES)
+            else:
+                # Sync the space in the background and answer this read with
+                # the recently updated pages the user contributed to
+                ctx.confluence.sync_space_snapshot_in_background(space_key)
+                cql = f'space = "{space_key}" AND contributor = currentUser() ORDER BY lastmodified DESC'
+                pages = await asyncio.to_thread(
+                    ctx.confluence.search, cql, limit=SPACE_RESOURCE_PAGES
+                )
 
             if not pages:
-                # Fallback to regular space pages if no user-contributed pages found
-                pages = ctx.confluence.get_space_pages(space_key, limit=10)
+                # Fallback to regular space pages if no pages were found
+                pages = await asyncio.to_thread(
+                    ctx.confluence.get_space_pages, space_key, limit=10
+                )
 
             content = []
             for page in pages:
@@ -221,13 +299,29 @@ async def read_resource(uri: str) -> tuple[str, str]:
         elif len(parts) >= 3 and parts[1] == "pages":
             space_key = parts[0]
             title = parts[2]
-            page = ctx.confluence.get_page_by_title(space_key, title)
+            page = await asyncio.to_thread(
+                ctx.confluence.get_page_by_title, space_key, title
+            )
 
             if not page:
                 raise ValueError(f"Page not found: {title}")
 
             return page.page_content, "text/markdown"
 
+        # Handle attachment content
+        elif len(parts) == 2 and parts[0] == "attachments":
+            attachment = await asyncio.to_thread(
+                ctx.confluence.get_attachment, parts[1]
+            )
+
+            if not attachment:
+                error_msg = f"Attachment not found: {parts[1]}"
+                raise ValueError(error_msg)
+
+            # Bounded by the configured attachment size cap
+            data = await asyncio.to_thread(ctx.confluence.read_attachment, attachment)
+            return [ReadResourceContents(content=data, mime_type=attachment.media_type)]
+
     # Handle Jira resources
     elif uri.startswith("jira://"):
         if not ctx or not ctx.jira:
@@ -239,15 +333,17 @@ async def read_resource(uri: str) -> tuple[str, str]:
             project_key = parts[0]
 
             # Get current user's account ID
-            account_id = ctx.jira.get_current_user_account_id()
+            account_id = await asyncio.to_thread(ctx.jira.get_current_user_account_id)
 
             # Use JQL to find issues in this project that the user is involved with
             jql = f"project = {project_key} AND (assignee = {account_id} OR reporter = {account_id}) ORDER BY updated DESC"
-            issues = ctx.jira.search_issues(jql=jql, limit=20)
+            issues = await asyncio.to_thread(ctx.jira.search_issues, jql=jql, limit=20)
 
             if not issues:
                 # Fallback to recent issues if no user-related issues found
-                issues = ctx.jira.get_project_issues(project_key, limit=10)
+                issues = await asyncio.to_thread(
+                    ctx.jira.get_project_issues, project_key, limit=10
+                )
 
             content = []
             for issue in issues:
@@ -272,7 +368,7 @@ async def read_resource(uri: str) -> tuple[str, str]:
         # Handle specific issue
         elif len(parts) >= 2:
             issue_key = parts[1] if len(parts) > 1 else parts[0]
-            issue = ctx.jira.get_issue(issue_key)
+            issue = await asyncio.to_thread(ctx.jira.get_issue, issue_key)
 
             if not issue:
                 raise ValueError(f"Issue not found: {issue_key}")
@@ -329,6 +425,12 @@ async def list_tools() -> list[Tool]:
                                 "minimum": 1,
                                 "maximum": 50,
                             },
+                            "space_key": {
+                                "type": "string",
+                                "description": "Optional space to restrict a simple text "
+                                "search to (e.g. 'DEV'). Spaces that were fully synced "
+                                "are searched locally without a remote query.",
+                            },
                         },
                         "required": ["query"],
                     },
@@ -355,6 +457,27 @@ async def list_tools() -> list[Tool]:
                                 "description": "Whether to convert page to markdown (true) or keep it in raw HTML format (false). Raw HTML can reveal macros (like dates) not visible in markdown, but CAUTION: using HTML significantly increases token usage in AI responses.",
                                 "default": True,
                             },
+                            "outline": {
+                                "type": "boolean",
+                                "description": "Return the page's sections (index, "
+                                "heading, level and size) instead of its content. "
+                                "Use this to read large pages a few sections at a "
+                                "time with section_start/section_end.",
+                                "default": False,
+                            },
+                            "section_start": {
+                                "type": "integer",
+                                "description": "Index of the first section to "
+                                "return; sections start at the page's top-level "
+                                "headings",
+                                "minimum": 0,
+                            },
+                            "section_end": {
+                                "type": "integer",
+                                "description": "Index of the last section to "
+                                "return (inclusive); defaults to section_start",
+                                "minimum": 0,
+                            },
                         },
                         "required": ["page_id"],
                     },
@@ -404,6 +527,40 @@ async def list_tools() -> list[Tool]:
                         "required": ["page_id"],
                     },
                 ),
+                Tool(
+                    name="confluence_get_page_tree",
+                    description="Get a Confluence page and its descendants (children, "
+                    "grandchildren, ...) in one call, optionally with their content",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "page_id": {
+                                "type": "string",
+                                "description": "The ID of the root page of the tree",
+                            },
+                            "max_depth": {
+                                "type": "number",
+                                "description": "How many levels below the root page to include (0-10)",
+                                "default": 3,
+                                "minimum": 0,
+                                "maximum": 10,
+                            },
+                            "max_pages": {
+                                "type": "number",
+                                "description": "Maximum number of pages to return, including the root page (1-200)",
+                                "default": 50,
+                                "minimum": 1,
+                                "maximum": 200,
+                            },
+                            "include_content": {
+                                "type": "boolean",
+                                "description": "Whether to include the page content as markdown",
+                                "default": True,
+                            },
+                        },
+                        "required": ["page_id"],
+                    },
+                ),
                 Tool(
                     name="confluence_get_comments",
                     description="Get comments for a specific Confluence page",
@@ -420,6 +577,33 @@ async def list_tools() -> list[Tool]:
                         "required": ["page_id"],
                     },
                 ),
+                Tool(
+                    name="confluence_get_attachments",
+                    description="List the files attached to a Confluence page. "
+                    "The content of an attachment can be read from its "
+                    "'resource' URI (confluence://attachments/{attachment_id})",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "page_id": {
+                                "type": "string",
+                                "description": "Confluence page ID (numeric ID, can be parsed from URL, "
+                                "e.g. from 'https://example.atlassian.net/wiki/spaces/TEAM/pages/123456789/Page+Title' "
+                                "-> '123456789')",
+                            },
+                            "filename": {
+                                "type": "string",
+                                "description": "Optional file name to filter by",
+                            },
+                            "media_type": {
+                                "type": "string",
+                                "description": "Optional media type to filter by, "
+                                "e.g. 'application/pdf'",
+                            },
+                        },
+                        "required": ["page_id"],
+                    },
+                ),
                 Tool(
                     name="confluence_create_page",
                     description="Create a new Confluence page",
@@ -478,6 +662,14 @@ async def list_tools() -> list[Tool]:
                                 "description": "Optional comment for this version",
                                 "default": "",
                             },
+                            "mode": {
+                                "type": "string",
+                                "enum": ["replace", "append", "prepend"],
+                                "description": "Whether the content replaces the "
+                                "page content or is added after or before it; "
+                                "appending avoids resending large pages",
+                                "default": "replace",
+                            },
                         },
                         "required": ["page_id", "title", "content"],
                     },
@@ -845,6 +1037,35 @@ async def list_tools() -> list[Tool]:
             ]
         )
 
+    # Continuations are shared by all tools that truncate long texts
+    if ctx and (ctx.confluence or ctx.jira):
+        tools.append(
+            Tool(
+                name="atlassian_get_continuation",
+                description="Fetch the rest of a text field that was cut by max_text_length",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "handle": {
+                            "type": "string",
+                            "description": "The '<field>_continuation' handle from a previous tool result",
+                        },
+                        "max_length": {
+                            "type": "integer",
+                            "description": "Maximum number of characters to return. "
+                            "If more text remains, a new continuation handle is returned.",
+                            "minimum": 1,
+                        },
+                    },
+                    "required": ["handle"],
+                },
+            )
+        )
+
+    for tool in tools:
+        if tool.name in READ_TOOLS:
+            tool.inputSchema["properties"].update(OUTPUT_OPTION_PROPERTIES)
+
     return tools
 
 
@@ -853,6 +1074,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
     """Handle tool calls for Confluence and Jira operations."""
     ctx = app.request_context.lifespan_context
     try:
+        arguments = dict(arguments or {})
+        output = ctx.output.with_arguments(arguments)
+
         # Helper functions for formatting results
         def format_comment(comment: Any) -> dict:
             if hasattr(comment, "to_simplified_dict"):
@@ -871,18 +1095,24 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
             query = arguments.get("query", "")
             limit = min(int(arguments.get("limit", 10)), 50)
+            space_key = arguments.get("space_key")
 
             # Check if the query is a simple search term or already a CQL query
             if query and not any(
                 x in query
                 for x in ["=", "~", ">", "<", " AND ", " OR ", "currentUser()"]
             ):
-                # Convert simple search term to CQL text search
-                # This will search in all content (title, body, etc.)
-                query = f'text ~ "{query}"'
-                logger.info(f"Converting simple search term to CQL: {query}")
-
-            pages = ctx.confluence.search(query, limit=limit)
+                # Answer from the local index if possible, else CQL text search
+                pages = await asyncio.to_thread(
+                    ctx.confluence.search_text,
+                    query,
+                    limit=limit,
+                    space_key=space_key,
+                )
+            else:
+                pages = await asyncio.to_thread(
+                    ctx.confluence.search, query, limit=limit
+                )
 
             # Format results using the to_simplified_dict method
             search_results = [page.to_simplified_dict() for page in pages]
@@ -890,7 +1120,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(search_results, indent=2, ensure_ascii=False),
+                    text=output.dumps(search_results),
                 )
             ]
 
@@ -901,9 +1131,43 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             page_id = arguments.get("page_id")
             include_metadata = arguments.get("include_metadata", True)
             convert_to_markdown = arguments.get("convert_to_markdown", True)
-
-            page = ctx.confluence.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
+            section_start = arguments.get("section_start")
+
+            # Large pages can be listed and read section by section
+            if arguments.get("outline") or section_start is not None:
+                page, sections = await asyncio.to_thread(
+                    ctx.confluence.get_page_sections,
+                    page_id,
+                    section_start,
+                    arguments.get("section_end"),
+                    convert_to_markdown=convert_to_markdown,
+                )
+                result = {
+                    "section_count": len(sections),
+                    "sections": [
+                        {
+                            "index": section.index,
+                            "level": section.level,
+                            "title": section.title,
+                            "size": section.size,
+                            **(
+                                {"content": section.content}
+                                if section.content is not None
+                                else {}
+                            ),
+                        }
+                        for section in sections
+                        if section_start is None or section.content is not None
+                    ],
+                }
+                if include_metadata:
+                    result = {"metadata": page.to_simplified_dict(), **result}
+                return [TextContent(type="text", text=output.dumps(result))]
+
+            page = await asyncio.to_thread(
+                ctx.confluence.get_page_content,
+                page_id,
+                convert_to_markdown=convert_to_markdown,
             )
 
             if include_metadata:
@@ -916,11 +1180,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 # For backward compatibility, keep returning content directly
                 result = {"content": page.content}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "confluence_get_page_children":
             if not ctx or not ctx.confluence:
@@ -936,8 +1196,12 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 expand = f"{expand},body.storage"
 
             # Get the child pages
-            pages = ctx.confluence.get_page_children(
-                page_id=parent_id, expand=expand, limit=limit, convert_to_markdown=True
+            pages = await asyncio.to_thread(
+                ctx.confluence.get_page_children,
+                page_id=parent_id,
+                expand=expand,
+                limit=limit,
+                convert_to_markdown=True,
             )
 
             # Format results using the to_simplified_dict method
@@ -947,15 +1211,13 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=output.dumps(
                         {
                             "parent_id": parent_id,
                             "total": len(child_pages),
                             "limit": limit,
                             "results": child_pages,
-                        },
-                        indent=2,
-                        ensure_ascii=False,
+                        }
                     ),
                 )
             ]
@@ -967,7 +1229,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             page_id = arguments.get("page_id")
 
             # Get the ancestor pages
-            ancestors = ctx.confluence.get_page_ancestors(page_id)
+            ancestors = await asyncio.to_thread(
+                ctx.confluence.get_page_ancestors, page_id
+            )
 
             # Format results
             ancestor_pages = [page.to_simplified_dict() for page in ancestors]
@@ -975,7 +1239,58 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(ancestor_pages, indent=2, ensure_ascii=False),
+                    text=output.dumps(ancestor_pages),
+                )
+            ]
+
+        elif name == "confluence_get_page_tree":
+            if not ctx or not ctx.confluence:
+                raise ValueError("Confluence is not configured.")
+
+            page_id = arguments.get("page_id")
+            max_depth = min(int(arguments.get("max_depth", 3)), 10)
+            max_pages = min(int(arguments.get("max_pages", 50)), 200)
+            include_content = arguments.get("include_content", True)
+
+            meta = app.request_context.meta
+            progress_token = meta.progressToken if meta else None
+
+            # Crawl in a worker thread and report each page as soon as it is ready
+            nodes = ctx.confluence.iter_page_tree(
+                page_id,
+                max_depth=max_depth,
+                max_pages=max_pages,
+                include_content=include_content,
+            )
+            pages = []
+            while (node := await asyncio.to_thread(next, nodes, None)) is not None:
+                pages.append(
+                    {
+                        **node.page.to_simplified_dict(),
+                        "depth": node.depth,
+                        "parent_id": node.parent_id,
+                    }
+                )
+                if progress_token is not None:
+                    await app.request_context.session.send_progress_notification(
+                        progress_token, len(pages), max_pages
+                    )
+
+            # Pages arrive in completion order; report them level by level
+            pages.sort(key=lambda page: page["depth"])
+
+            return [
+                TextContent(
+                    type="text",
+                    text=output.dumps(
+                        {
+                            "root_id": page_id,
+                            "total": len(pages),
+                            "max_depth": max_depth,
+                            "max_pages": max_pages,
+                            "results": pages,
+                        }
+                    ),
                 )
             ]
 
@@ -984,7 +1299,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 raise ValueError("Confluence is not configured.")
 
             page_id = arguments.get("page_id")
-            comments = ctx.confluence.get_page_comments(page_id)
+            comments = await asyncio.to_thread(
+                ctx.confluence.get_page_comments, page_id
+            )
 
             # Format comments using their to_simplified_dict method if available
             formatted_comments = [format_comment(comment) for comment in comments]
@@ -992,7 +1309,33 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(formatted_comments, indent=2, ensure_ascii=False),
+                    text=output.dumps(formatted_comments),
+                )
+            ]
+
+        elif name == "confluence_get_attachments":
+            if not ctx or not ctx.confluence:
+                raise ValueError("Confluence is not configured.")
+
+            attachments = await asyncio.to_thread(
+                ctx.confluence.get_page_attachments,
+                arguments.get("page_id"),
+                filename=arguments.get("filename"),
+                media_type=arguments.get("media_type"),
+            )
+
+            formatted_attachments = [
+                {
+                    **attachment.to_simplified_dict(),
+                    "resource": f"confluence://attachments/{attachment.id}",
+                }
+                for attachment in attachments
+            ]
+
+            return [
+                TextContent(
+                    type="text",
+                    text=output.dumps(formatted_attachments),
                 )
             ]
 
@@ -1007,7 +1350,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             parent_id = arguments.get("parent_id")
 
             # Create the page (with automatic markdown conversion)
-            page = ctx.confluence.create_page(
+            page = await asyncio.to_thread(
+                ctx.confluence.create_page,
                 space_key=space_key,
                 title=title,
                 body=content,
@@ -1021,7 +1365,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=f"Page created successfully:\n{json.dumps(result, indent=2, ensure_ascii=False)}",
+                    text=f"Page created successfully:\n{output.dumps(result)}",
                 )
             ]
 
@@ -1034,6 +1378,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             content = arguments.get("content")
             is_minor_edit = arguments.get("is_minor_edit", False)
             version_comment = arguments.get("version_comment", "")
+            mode = arguments.get("mode", "replace")
 
             if not page_id or not title or not content:
                 raise ValueError(
@@ -1041,13 +1386,15 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 )
 
             # Update the page (with automatic markdown conversion)
-            updated_page = ctx.confluence.update_page(
+            updated_page = await asyncio.to_thread(
+                ctx.confluence.update_page,
                 page_id=page_id,
                 title=title,
                 body=content,
                 is_minor_edit=is_minor_edit,
                 version_comment=version_comment,
                 is_markdown=True,
+                mode=mode,
             )
 
             # Format results
@@ -1066,7 +1413,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
             try:
                 # Delete the page
-                result = ctx.confluence.delete_page(page_id=page_id)
+                result = await asyncio.to_thread(
+                    ctx.confluence.delete_page, page_id=page_id
+                )
 
                 # Format results - our fixed implementation now correctly returns True on success
                 if result:
@@ -1085,7 +1434,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(response, indent=2, ensure_ascii=False),
+                        text=output.dumps(response),
                     )
                 ]
             except Exception as e:
@@ -1094,14 +1443,12 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(
+                        text=output.dumps(
                             {
                                 "success": False,
                                 "message": f"Error deleting page {page_id}",
                                 "error": str(e),
-                            },
-                            indent=2,
-                            ensure_ascii=False,
+                            }
                         ),
                     )
                 ]
@@ -1115,17 +1462,16 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             expand = arguments.get("expand")
             comment_limit = arguments.get("comment_limit")
 
-            issue = ctx.jira.get_issue(
-                issue_key, expand=expand, comment_limit=comment_limit
+            issue = await asyncio.to_thread(
+                ctx.jira.get_issue,
+                issue_key,
+                expand=expand,
+                comment_limit=comment_limit,
             )
 
             result = {"content": issue.to_simplified_dict()}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "jira_search":
             if not ctx or not ctx.jira:
@@ -1135,15 +1481,15 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             fields = arguments.get("fields", "*all")
             limit = min(int(arguments.get("limit", 10)), 50)
 
-            issues = ctx.jira.search_issues(jql, fields=fields, limit=limit)
-
-            # Format results using the to_simplified_dict method
-            search_results = [issue.to_simplified_dict() for issue in issues]
+            # Build the simplified results directly, skipping the models
+            search_results = await asyncio.to_thread(
+                ctx.jira.search_issues, jql, fields=fields, limit=limit, simplified=True
+            )
 
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(search_results, indent=2, ensure_ascii=False),
+                    text=output.dumps(search_results),
                 )
             ]
 
@@ -1154,15 +1500,14 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             project_key = arguments.get("project_key")
             limit = min(int(arguments.get("limit", 10)), 50)
 
-            issues = ctx.jira.get_project_issues(project_key, limit=limit)
-
-            # Format results
-            project_issues = [issue.to_simplified_dict() for issue in issues]
+            project_issues = await asyncio.to_thread(
+                ctx.jira.get_project_issues, project_key, limit=limit, simplified=True
+            )
 
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(project_issues, indent=2, ensure_ascii=False),
+                    text=output.dumps(project_issues),
                 )
             ]
 
@@ -1188,7 +1533,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                     raise ValueError("Invalid JSON in additional_fields")
 
             # Create the issue
-            issue = ctx.jira.create_issue(
+            issue = await asyncio.to_thread(
+                ctx.jira.create_issue,
                 project_key=project_key,
                 summary=summary,
                 issue_type=issue_type,
@@ -1202,7 +1548,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=f"Issue created successfully:\n{json.dumps(result, indent=2, ensure_ascii=False)}",
+                    text=f"Issue created successfully:\n{output.dumps(result)}",
                 )
             ]
 
@@ -1232,8 +1578,11 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             try:
                 # Update the issue - directly pass fields to JiraFetcher.update_issue
                 # instead of using fields as a parameter name
-                issue = ctx.jira.update_issue(
-                    issue_key=issue_key, **fields, **additional_fields
+                issue = await asyncio.to_thread(
+                    ctx.jira.update_issue,
+                    issue_key=issue_key,
+                    **fields,
+                    **additional_fields,
                 )
 
                 result = issue.to_simplified_dict()
@@ -1241,7 +1590,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 return [
                     TextContent(
                         type="text",
-                        text=f"Issue updated successfully:\n{json.dumps(result, indent=2, ensure_ascii=False)}",
+                        text=f"Issue updated successfully:\n{output.dumps(result)}",
                     )
                 ]
             except Exception as e:
@@ -1259,15 +1608,11 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             issue_key = arguments.get("issue_key")
 
             # Delete the issue
-            deleted = ctx.jira.delete_issue(issue_key)
+            deleted = await asyncio.to_thread(ctx.jira.delete_issue, issue_key)
 
             result = {"message": f"Issue {issue_key} has been deleted successfully."}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "jira_add_comment":
             if not ctx or not ctx.jira:
@@ -1277,13 +1622,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             comment = arguments.get("comment")
 
             # Add the comment
-            result = ctx.jira.add_comment(issue_key, comment)
+            result = await asyncio.to_thread(ctx.jira.add_comment, issue_key, comment)
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "jira_add_worklog":
             if not ctx or not ctx.jira:
@@ -1296,7 +1637,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             started = arguments.get("started")
 
             # Add the worklog
-            worklog = ctx.jira.add_worklog(
+            worklog = await asyncio.to_thread(
+                ctx.jira.add_worklog,
                 issue_key=issue_key,
                 time_spent=time_spent,
                 comment=comment,
@@ -1305,11 +1647,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
             result = {"message": "Worklog added successfully", "worklog": worklog}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "jira_get_worklog":
             if not ctx or not ctx.jira:
@@ -1318,15 +1656,11 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             issue_key = arguments.get("issue_key")
 
             # Get worklogs
-            worklogs = ctx.jira.get_worklogs(issue_key)
+            worklogs = await asyncio.to_thread(ctx.jira.get_worklogs, issue_key)
 
             result = {"worklogs": worklogs}
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "jira_link_to_epic":
             if not ctx or not ctx.jira:
@@ -1336,18 +1670,16 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             epic_key = arguments.get("epic_key")
 
             # Link the issue to the epic
-            issue = ctx.jira.link_issue_to_epic(issue_key, epic_key)
+            issue = await asyncio.to_thread(
+                ctx.jira.link_issue_to_epic, issue_key, epic_key
+            )
 
             result = {
                 "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
                 "issue": issue.to_simplified_dict(),
             }
 
-            return [
-                TextContent(
-                    type="text", text=json.dumps(result, indent=2, ensure_ascii=False)
-                )
-            ]
+            return [TextContent(type="text", text=output.dumps(result))]
 
         elif name == "jira_get_epic_issues":
             if not ctx or not ctx.jira:
@@ -1356,16 +1688,15 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             epic_key = arguments.get("epic_key")
             limit = min(int(arguments.get("limit", 10)), 50)
 
-            # Get issues linked to the epic
-            issues = ctx.jira.get_epic_issues(epic_key, limit=limit)
-
-            # Format results
-            epic_issues = [issue.to_simplified_dict() for issue in issues]
+            # Get issues linked to the epic as simplified results
+            epic_issues = await asyncio.to_thread(
+                ctx.jira.get_epic_issues, epic_key, limit=limit, simplified=True
+            )
 
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(epic_issues, indent=2, ensure_ascii=False),
+                    text=output.dumps(epic_issues),
                 )
             ]
 
@@ -1376,7 +1707,9 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             issue_key = arguments.get("issue_key")
 
             # Get available transitions
-            transitions = ctx.jira.get_available_transitions(issue_key)
+            transitions = await asyncio.to_thread(
+                ctx.jira.get_available_transitions, issue_key
+            )
 
             # Format transitions
             formatted_transitions = []
@@ -1392,9 +1725,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
             return [
                 TextContent(
                     type="text",
-                    text=json.dumps(
-                        formatted_transitions, indent=2, ensure_ascii=False
-                    ),
+                    text=output.dumps(formatted_transitions),
                 )
             ]
 
@@ -1431,7 +1762,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
 
             try:
                 # Transition the issue
-                issue = ctx.jira.transition_issue(
+                issue = await asyncio.to_thread(
+                    ctx.jira.transition_issue,
                     issue_key=issue_key,
                     transition_id=transition_id,
                     fields=fields,
@@ -1446,7 +1778,7 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                 return [
                     TextContent(
                         type="text",
-                        text=json.dumps(result, indent=2, ensure_ascii=False),
+                        text=output.dumps(result),
                     )
                 ]
             except Exception as e:
@@ -1469,6 +1801,15 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
                     )
                 ]
 
+        elif name == "atlassian_get_continuation":
+            handle = arguments.get("handle")
+            if not handle:
+                raise ValueError("Missing required parameter: handle is required.")
+
+            chunk = read_continuation(handle, max_length=arguments.get("max_length"))
+
+            return [TextContent(type="text", text=output.dumps(chunk))]
+
         raise ValueError(f"Unknown tool: {name}")
 
     except Exception as e:
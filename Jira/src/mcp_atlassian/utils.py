@@ -2,6 +2,10 @@
 
 import logging
 import ssl
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 from urllib.parse import urlparse
 
@@ -117,3 +121,92 @@ def configure_ssl_verification(
         adapter = SSLIgnoreAdapter()
         session.mount(f"https://{domain}", adapter)
         session.mount(f"http://{domain}", adapter)
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed time-to-live.
+
+    The least recently used entry is evicted once the cache holds ``maxsize``
+    entries. A ``ttl`` of zero or less disables caching entirely.
+
+    Example:
+        cache = TTLCache(ttl=300)
+        cache.set(("DEV", "Home"), "123456")
+        cache.get(("DEV", "Home"))  # "123456" for the next five minutes
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it was set
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for key if it is present and not expired.
+
+        Args:
+            key: The cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for key, evicting the least recently used entry if full.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key from the cache.
+
+        Args:
+            key: The cache key
+            default: Value returned if key is not cached
+
+        Returns:
+            The removed value (even if expired) or default
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Process-wide accountId -> displayName cache, filled by user parsing and by
+# mention resolution so that each user is looked up at most once per hour
+display_names = TTLCache(ttl=3600, maxsize=4096)
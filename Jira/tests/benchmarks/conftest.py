@@ -0,0 +1,95 @@
+"""Configuration and fixtures for the replay benchmarks."""
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.confluence import ConfluenceFetcher
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.server import AppContext
+from tests.benchmarks.replay import ReplayServer, format_report
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+BENCHMARK_RESULTS_KEY = pytest.StashKey[dict]()
+
+
+def pytest_configure(config):
+    """Add benchmark marker."""
+    config.addinivalue_line(
+        "markers", "benchmark: mark test as a (slow) performance benchmark"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless explicitly requested."""
+    if not config.getoption("--benchmark", default=False):
+        skip_benchmark = pytest.mark.skip(reason="Need --benchmark option to run")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope="session")
+def replay_server():
+    """Start a local stand-in Atlassian server replaying recorded responses."""
+    server = ReplayServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def app_context(replay_server):
+    """Create an AppContext whose fetchers talk to the replay server."""
+    with patch.dict(
+        os.environ,
+        {
+            "JIRA_URL": replay_server.url,
+            "JIRA_PERSONAL_TOKEN": "benchmark-token",
+            "CONFLUENCE_URL": replay_server.url,
+            "CONFLUENCE_PERSONAL_TOKEN": "benchmark-token",
+        },
+    ):
+        yield AppContext(confluence=ConfluenceFetcher(), jira=JiraFetcher())
+
+
+@pytest.fixture(scope="session")
+def benchmark_settings(request):
+    """Return the benchmark settings from the command line."""
+    config = request.config
+    baseline_path = Path(config.getoption("--benchmark-baseline") or DEFAULT_BASELINE)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+    return {
+        "calls": config.getoption("--benchmark-calls", default=50),
+        "concurrency": config.getoption("--benchmark-concurrency", default=4),
+        "threshold": config.getoption("--benchmark-threshold", default=0.2),
+        "baseline": baseline,
+    }
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the collected benchmark results and optionally save them."""
+    results = config.stash.get(BENCHMARK_RESULTS_KEY, None)
+    if not results:
+        return
+
+    terminalreporter.write_sep("=", "replay benchmark results")
+    terminalreporter.write_line(format_report(list(results.values())))
+
+    if save_path := config.getoption("--benchmark-save", default=None):
+        Path(save_path).write_text(
+            json.dumps(
+                {tool: result.to_dict() for tool, result in results.items()},
+                indent=2,
+                sort_keys=True,
+            )
+            + "\n"
+        )
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """Collect benchmark results for the terminal summary."""
+    return request.config.stash.setdefault(BENCHMARK_RESULTS_KEY, {})
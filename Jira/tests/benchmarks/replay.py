@@ -0,0 +1,419 @@
+"""
+Recorded-traffic replay harness for benchmarking MCP tool calls.
+
+A local stand-in HTTP server answers Jira and Confluence REST requests with the
+recorded payloads from ``tests/fixtures``. Tool calls are then driven through
+``server.call_tool`` at a configurable concurrency and the per-tool latency
+percentiles, HTTP requests per tool call and peak RSS are collected.
+"""
+
+import asyncio
+import copy
+import json
+import re
+import resource
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+from mcp_atlassian import server
+from tests.fixtures.confluence_mocks import (
+    MOCK_ATTACHMENTS_RESPONSE,
+    MOCK_COMMENTS_RESPONSE,
+    MOCK_CQL_SEARCH_RESPONSE,
+    MOCK_PAGE_RESPONSE,
+    MOCK_PAGES_FROM_SPACE_RESPONSE,
+    MOCK_SPACES_RESPONSE,
+)
+from tests.fixtures.jira_mocks import (
+    MOCK_JIRA_COMMENTS,
+    MOCK_JIRA_ISSUE_RESPONSE,
+    MOCK_JIRA_JQL_RESPONSE,
+)
+
+MOCK_EPIC_RESPONSE = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+MOCK_EPIC_RESPONSE["fields"]["issuetype"] = {"id": "10000", "name": "Epic"}
+
+MOCK_ANCESTORS_RESPONSE = {
+    **MOCK_PAGE_RESPONSE,
+    "ancestors": [
+        {"id": "111", "type": "page", "title": "Root Page"},
+        {"id": "222", "type": "page", "title": "Parent Page"},
+    ],
+}
+
+MOCK_TRANSITIONS_RESPONSE = {
+    "transitions": [
+        {"id": "11", "name": "To Do", "to": {"id": "10000", "name": "To Do"}},
+        {"id": "21", "name": "In Progress", "to": {"id": "3", "name": "In Progress"}},
+        {"id": "31", "name": "Done", "to": {"id": "10001", "name": "Done"}},
+    ]
+}
+
+MOCK_WORKLOG_RESPONSE = {
+    "startAt": 0,
+    "maxResults": 1,
+    "total": 1,
+    "worklogs": [
+        {
+            "id": "100028",
+            "author": {"accountId": "user123", "displayName": "John Doe"},
+            "comment": "Investigated the root cause",
+            "created": "2024-01-01T10:00:00.000+0000",
+            "updated": "2024-01-01T10:00:00.000+0000",
+            "started": "2024-01-01T09:00:00.000+0000",
+            "timeSpent": "1h 30m",
+            "timeSpentSeconds": 5400,
+        }
+    ],
+}
+
+MOCK_USER_RESPONSE = {
+    "accountId": "user123",
+    "displayName": "Test User",
+    "accountStatus": "active",
+}
+
+
+def build_search_page(size: int = 50) -> dict[str, Any]:
+    """Build a JQL search response with `size` full issues, like `fields=*all`."""
+    page = copy.deepcopy(MOCK_JIRA_JQL_RESPONSE)
+    page["issues"] = []
+    for index in range(size):
+        issue = copy.deepcopy(MOCK_JIRA_ISSUE_RESPONSE)
+        issue["key"] = f"PROJ-{index}"
+        issue["id"] = str(10000 + index)
+        page["issues"].append(issue)
+    page["maxResults"] = page["total"] = size
+    return page
+
+
+# Ordered (method, path pattern, payload) routes matched against the request path
+# including its query string. The first match wins, so the more specific
+# sub-resources are listed before the bare issue and content routes.
+ROUTES: list[tuple[str, re.Pattern[str], Any]] = [
+    ("GET", re.compile(r"^/rest/api/2/search(\?|$)"), MOCK_JIRA_JQL_RESPONSE),
+    ("GET", re.compile(r"^/rest/api/2/issue/[^/?]+/comment(\?|$)"), MOCK_JIRA_COMMENTS),
+    (
+        "GET",
+        re.compile(r"^/rest/api/2/issue/[^/?]+/worklog(\?|$)"),
+        MOCK_WORKLOG_RESPONSE,
+    ),
+    (
+        "GET",
+        re.compile(r"^/rest/api/2/issue/[^/?]+/transitions(\?|$)"),
+        MOCK_TRANSITIONS_RESPONSE,
+    ),
+    ("GET", re.compile(r"^/rest/api/2/issue/EPIC-[^/?]+(\?|$)"), MOCK_EPIC_RESPONSE),
+    ("GET", re.compile(r"^/rest/api/2/issue/[^/?]+(\?|$)"), MOCK_JIRA_ISSUE_RESPONSE),
+    ("GET", re.compile(r"^/rest/api/2/field(\?|$)"), []),
+    ("GET", re.compile(r"^/rest/api/2/myself(\?|$)"), MOCK_USER_RESPONSE),
+    ("GET", re.compile(r"^/rest/api/search(\?|$)"), MOCK_CQL_SEARCH_RESPONSE),
+    ("GET", re.compile(r"^/rest/api/space(\?|$)"), MOCK_SPACES_RESPONSE),
+    (
+        "GET",
+        re.compile(r"^/rest/api/content/[^/?]+/child/comment(\?|$)"),
+        MOCK_COMMENTS_RESPONSE,
+    ),
+    (
+        "GET",
+        re.compile(r"^/rest/api/content/[^/?]+/child/attachment(\?|$)"),
+        MOCK_ATTACHMENTS_RESPONSE,
+    ),
+    (
+        "GET",
+        re.compile(r"^/rest/api/content/[^/?]+/child/page(\?|$)"),
+        {"results": MOCK_PAGES_FROM_SPACE_RESPONSE},
+    ),
+    (
+        "GET",
+        re.compile(r"^/rest/api/content/[^/?]+\?expand=ancestors"),
+        MOCK_ANCESTORS_RESPONSE,
+    ),
+    ("GET", re.compile(r"^/rest/api/content/[^/?]+(\?|$)"), MOCK_PAGE_RESPONSE),
+    ("GET", re.compile(r"^/rest/api/user(\?|$)"), MOCK_USER_RESPONSE),
+]
+
+# Default arguments for every read-only tool driven by the benchmark
+TOOL_SCENARIOS: dict[str, dict[str, Any]] = {
+    "confluence_search": {"query": "meeting notes", "limit": 10},
+    "confluence_get_page": {"page_id": "987654321"},
+    "confluence_get_page_children": {"parent_id": "987654321", "limit": 25},
+    "confluence_get_page_ancestors": {"page_id": "987654321"},
+    "confluence_get_page_tree": {"page_id": "987654321", "max_depth": 1},
+    "confluence_get_comments": {"page_id": "987654321"},
+    "confluence_get_attachments": {"page_id": "987654321"},
+    "jira_get_issue": {"issue_key": "PROJ-123", "comment_limit": 10},
+    "jira_search": {"jql": "project = PROJ", "limit": 50},
+    "jira_get_project_issues": {"project_key": "PROJ", "limit": 50},
+    "jira_get_epic_issues": {"epic_key": "EPIC-1", "limit": 50},
+    "jira_get_worklog": {"issue_key": "PROJ-123"},
+    "jira_get_transitions": {"issue_key": "PROJ-123"},
+}
+
+
+class ReplayServer:
+    """Threaded HTTP server replaying recorded Atlassian payloads.
+
+    The server counts every request it answers so that the harness can report
+    the number of upstream requests issued per tool call.
+    """
+
+    def __init__(
+        self, routes: list[tuple[str, re.Pattern[str], Any]] | None = None
+    ) -> None:
+        """
+        Initialize the replay server.
+
+        Args:
+            routes: Ordered (method, path pattern, payload) routes to serve
+        """
+        self.routes = routes if routes is not None else ROUTES
+        self.request_count = 0
+        self.unmatched: list[str] = []
+        self._lock = threading.Lock()
+        self._encoded = [
+            (method, pattern, json.dumps(payload).encode("utf-8"))
+            for method, pattern, payload in self.routes
+        ]
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        """Start serving requests in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release the listening socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_count(self) -> int:
+        """Reset the request counter and return its previous value."""
+        with self._lock:
+            count, self.request_count = self.request_count, 0
+        return count
+
+    def _record(self, method: str, path: str) -> bytes | None:
+        """Count a request and return the recorded body, or None if unmatched."""
+        with self._lock:
+            self.request_count += 1
+        for route_method, pattern, body in self._encoded:
+            if route_method == method and pattern.match(path):
+                return body
+        with self._lock:
+            self.unmatched.append(f"{method} {path}")
+        return None
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; avoid Nagle stalls
+            disable_nagle_algorithm = True
+
+            def _respond(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                body = replay._record(method, self.path)
+                status = 200 if body is not None else 404
+                payload = body if body is not None else b'{"message": "not found"}'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                self._respond("GET")
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                self._respond("POST")
+
+            def do_PUT(self) -> None:  # noqa: N802 - http.server naming
+                self._respond("PUT")
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                return
+
+        return Handler
+
+
+@dataclass
+class ToolBenchmark:
+    """Benchmark statistics for a single tool."""
+
+    tool: str
+    calls: int
+    concurrency: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    requests_per_call: float
+    peak_rss_mb: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dictionary for JSON reports."""
+        return asdict(self)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Return the nearest-rank percentile of the samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def peak_rss_mb() -> float:
+    """Return the peak resident set size of this process in megabytes."""
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if maxrss > 1 << 32 else 1024
+    return maxrss / divisor
+
+
+def _invoke_tool(
+    app_context: server.AppContext, name: str, arguments: dict[str, Any]
+) -> tuple[float, bool]:
+    """Run one tool call on a private event loop and time it."""
+
+    async def run() -> list[Any]:
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            return list(await server.call_tool(name, dict(arguments)))
+        finally:
+            request_ctx.reset(token)
+
+    started = time.perf_counter()
+    contents = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+    failed = any(
+        getattr(content, "text", "").startswith("Error") for content in contents
+    )
+    return elapsed, failed
+
+
+def benchmark_tool(
+    app_context: server.AppContext,
+    replay: ReplayServer,
+    name: str,
+    arguments: dict[str, Any],
+    *,
+    calls: int = 50,
+    concurrency: int = 4,
+    invoke: Callable[
+        [server.AppContext, str, dict[str, Any]], tuple[float, bool]
+    ] = _invoke_tool,
+) -> ToolBenchmark:
+    """
+    Drive a tool repeatedly through call_tool and collect statistics.
+
+    Args:
+        app_context: Application context holding the configured fetchers
+        replay: The replay server the fetchers are pointed at
+        name: Tool name
+        arguments: Tool arguments
+        calls: Number of tool calls to issue
+        concurrency: Number of tool calls in flight at once
+
+    Returns:
+        ToolBenchmark with latency percentiles, request counts and peak RSS
+    """
+    # Warm up caches and connection pools outside of the measured window
+    invoke(app_context, name, arguments)
+    replay.reset_count()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(
+            executor.map(lambda _: invoke(app_context, name, arguments), range(calls))
+        )
+
+    requests = replay.reset_count()
+    latencies = [elapsed * 1000 for elapsed, _ in results]
+    return ToolBenchmark(
+        tool=name,
+        calls=calls,
+        concurrency=concurrency,
+        errors=sum(1 for _, failed in results if failed),
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        requests_per_call=round(requests / calls, 3),
+        peak_rss_mb=round(peak_rss_mb(), 1),
+    )
+
+
+def find_regressions(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+    metrics: tuple[str, ...] = ("p95_ms", "requests_per_call", "peak_rss_mb"),
+) -> list[str]:
+    """
+    Compare benchmark results against a baseline.
+
+    Args:
+        results: Current results keyed by tool name
+        baseline: Baseline results keyed by tool name
+        threshold: Allowed relative increase (0.2 means 20%)
+        metrics: Metrics to compare; metrics missing from the baseline are skipped
+
+    Returns:
+        Human-readable descriptions of every metric that regressed
+    """
+    regressions = []
+    for tool, current in sorted(results.items()):
+        previous = baseline.get(tool)
+        if not previous:
+            continue
+        for metric in metrics:
+            if metric not in previous or metric not in current:
+                continue
+            before, after = float(previous[metric]), float(current[metric])
+            if after > before * (1 + threshold) and after - before > 1e-9:
+                regressions.append(
+                    f"{tool}.{metric}: {before} -> {after} "
+                    f"(+{(after / before - 1) * 100 if before else float('inf'):.1f}%)"
+                )
+    return regressions
+
+
+def format_report(results: list[ToolBenchmark]) -> str:
+    """Render benchmark results as a fixed-width table."""
+    header = (
+        f"{'tool':<30} {'calls':>6} {'conc':>5} {'err':>4} {'p50 ms':>9} "
+        f"{'p95 ms':>9} {'p99 ms':>9} {'req/call':>9} {'rss MB':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.tool:<30} {r.calls:>6} {r.concurrency:>5} {r.errors:>4} "
+            f"{r.p50_ms:>9.2f} {r.p95_ms:>9.2f} {r.p99_ms:>9.2f} "
+            f"{r.requests_per_call:>9.2f} {r.peak_rss_mb:>8.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,32 @@
+"""Replay benchmarks driving every read-only tool through call_tool."""
+
+import pytest
+
+from tests.benchmarks.replay import TOOL_SCENARIOS, benchmark_tool, find_regressions
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize("tool", sorted(TOOL_SCENARIOS))
+def test_call_tool_benchmark(
+    tool, app_context, replay_server, benchmark_settings, benchmark_results
+):
+    """Benchmark a tool and fail when it regresses against the baseline."""
+    result = benchmark_tool(
+        app_context,
+        replay_server,
+        tool,
+        TOOL_SCENARIOS[tool],
+        calls=benchmark_settings["calls"],
+        concurrency=benchmark_settings["concurrency"],
+    )
+    benchmark_results[tool] = result
+
+    assert result.errors == 0, f"{tool} returned errors against the replay server"
+
+    regressions = find_regressions(
+        {tool: result.to_dict()},
+        benchmark_settings["baseline"],
+        benchmark_settings["threshold"],
+    )
+    assert not regressions, "Benchmark regression:\n" + "\n".join(regressions)
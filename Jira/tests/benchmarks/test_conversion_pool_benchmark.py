@@ -0,0 +1,48 @@
+"""Benchmark of converting a batch of large pages in worker processes."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.preprocessing.pool import ConversionPool
+from tests.benchmarks.test_html_conversion_benchmark import build_page
+
+pytestmark = pytest.mark.benchmark
+
+BASE_URL = "https://example.atlassian.net"
+WORKERS = 4
+
+
+def _convert_batch(preprocessor: ConfluencePreprocessor, pages: list[str]) -> float:
+    """Convert pages concurrently, as large comment threads are, and time it."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = list(executor.map(preprocessor.process_html_content, pages))
+    elapsed = time.perf_counter() - start
+    assert all(markdown for _, markdown in results)
+    return elapsed
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < WORKERS, reason="needs several CPUs")
+def test_conversion_pool_benchmark():
+    """Worker processes must convert a batch faster than GIL-bound threads."""
+    pages = [build_page(sections=100)] * (WORKERS * 2)
+    pool = ConversionPool(max_workers=WORKERS)
+    pool.warm()
+    try:
+        inline = _convert_batch(ConfluencePreprocessor(base_url=BASE_URL), pages)
+        pooled = _convert_batch(
+            ConfluencePreprocessor(base_url=BASE_URL, conversion_pool=pool), pages
+        )
+    finally:
+        pool.shutdown()
+
+    print(
+        f"{len(pages)} pages of {len(pages[0]) // 1000} KB: threads "
+        f"{inline * 1e3:.0f} ms, {WORKERS} processes {pooled * 1e3:.0f} ms "
+        f"({inline / pooled:.1f}x)"
+    )
+    assert pooled < inline
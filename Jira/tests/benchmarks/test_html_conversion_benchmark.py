@@ -0,0 +1,124 @@
+"""Micro-benchmarks of the Confluence storage format to Markdown conversion."""
+
+import tracemalloc
+
+import pytest
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+from mcp_atlassian.preprocessing import base
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.preprocessing.sections import split_storage_sections
+from tests.benchmarks.timing import best_of, report
+
+pytestmark = pytest.mark.benchmark
+
+# One section of a realistic page: headings, prose, a code macro and a table
+PAGE_SECTION = """<h2>Payment retries</h2>
+<p>When the checkout service receives a payment confirmation it writes the order \
+to the ledger and publishes an event for the <strong>fulfilment pipeline</strong>. \
+See <a href="https://status.example.com/incidents/4821">INC-4821</a> and \
+<ac:link><ri:page ri:content-title="Payments runbook" /></ac:link> for details.</p>
+<ul><li>Generate the idempotency key once per order</li>\
+<li>Pass the key to the provider on <em>every</em> retry</li></ul>
+<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python\
+</ac:parameter><ac:plain-text-body><![CDATA[def charge(order, provider):
+    key = order.idempotency_key or new_key(order.id)
+    return provider.charge(order.total, idempotency_key=key)]]>\
+</ac:plain-text-body></ac:structured-macro>
+<table><tbody><tr><th>Environment</th><th>Timeout</th></tr>
+<tr><td>staging</td><td>30s</td></tr><tr><td>production</td><td>30s</td></tr>\
+</tbody></table>
+"""
+
+
+def build_page(sections: int = 20) -> str:
+    """Build the storage format of a page with the given number of sections."""
+    return PAGE_SECTION * sections
+
+
+def _legacy_process_html_content(html_content: str) -> tuple[str, str]:
+    """The previous conversion: serialize the parsed tree and parse it again."""
+    soup = BeautifulSoup(html_content, "html.parser")
+    processed_html = str(soup)
+    return processed_html, md(processed_html)
+
+
+# Timing noise allowed on the end-to-end path, whose gain is only about 10%
+NOISE_MARGIN = 1.1
+
+
+def test_process_html_content_benchmark():
+    """Converting the parsed tree must not be slower than re-parsing the HTML."""
+    html_content = build_page()
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    converted = preprocessor.process_html_content(html_content)
+    assert converted == _legacy_process_html_content(html_content)
+
+    legacy = best_of(lambda: _legacy_process_html_content(html_content))
+    current = best_of(lambda: preprocessor.process_html_content(html_content))
+    report(f"process_html_content {len(html_content) // 1000} KB", legacy, current)
+    assert current < legacy * NOISE_MARGIN
+
+
+@pytest.mark.skipif(base.lxml is None, reason="lxml not installed")
+def test_process_html_content_markdown_only_benchmark():
+    """Markdown-only conversion with lxml must beat the full conversion."""
+    html_content = build_page()
+    preprocessor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", markdown_parser="lxml"
+    )
+
+    _, markdown = _legacy_process_html_content(html_content)
+    assert preprocessor.process_html_content(html_content, output="markdown") == (
+        "",
+        markdown,
+    )
+
+    legacy = best_of(lambda: _legacy_process_html_content(html_content))
+    current = best_of(
+        lambda: preprocessor.process_html_content(html_content, output="markdown")
+    )
+    report(
+        f"process_html_content markdown only {len(html_content) // 1000} KB",
+        legacy,
+        current,
+    )
+    assert current < legacy
+
+
+def _peak_memory(func) -> int:
+    """Return the peak memory allocated while calling func."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_section_conversion_memory_benchmark():
+    """Converting one section must need a fraction of the whole page's memory."""
+    html_content = build_page(sections=200)
+    preprocessor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    sections = split_storage_sections(html_content)
+    assert len(sections) == 200
+
+    def convert_page():
+        preprocessor.process_html_content(html_content, output="markdown")
+
+    def convert_sections():
+        for section in sections[100:102]:
+            preprocessor.process_html_content(
+                html_content[section.start : section.end], output="markdown"
+            )
+
+    page = _peak_memory(convert_page)
+    section = _peak_memory(convert_sections)
+    print(
+        f"peak memory for {len(html_content) // 1000} KB page: whole page "
+        f"{page / 1e6:.1f} MB, two sections {section / 1e6:.2f} MB "
+        f"({page / section:.0f}x)"
+    )
+    assert section * 10 < page
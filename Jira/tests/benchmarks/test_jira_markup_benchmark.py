@@ -0,0 +1,263 @@
+"""Micro-benchmarks of the Jira markup converters on large issue descriptions."""
+
+import re
+
+import pytest
+
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+from tests.benchmarks.timing import best_of
+
+pytestmark = pytest.mark.benchmark
+
+# One section of a realistic description: mostly prose with some markup
+DESCRIPTION_SECTION = """h2. Background
+When the checkout service receives a payment confirmation it writes the order to \
+the ledger and publishes an event for the fulfilment pipeline. Under load the \
+*ledger writes* time out and the retry logic resubmits the payment, which produces \
+duplicate charges for a small share of customers. The incident review found that \
+the idempotency key is generated per attempt instead of per order, see \
+[INC-4821|https://status.example.com/incidents/4821] for the timeline.
+
+h3. Proposed change
+* Generate the idempotency key once per order and store it with the cart
+* Pass the key through to the payment provider on every retry
+** Keep the existing timeout of 30 seconds
+* Add a dashboard panel for retried payments
+
+The retry policy lives in {{payments/retry.py}} and is configured per environment. \
+Nothing else in the _checkout_ flow needs to change.
+
+{code:python}
+def charge(order, provider):
+    key = order.idempotency_key or new_key(order.id)
+    return provider.charge(order.total, idempotency_key=key)
+{code}
+
+||Environment||Timeout||Retries||
+|staging|30s|3|
+|production|30s|5|
+
+"""
+
+
+# The same section written in Markdown, as sent by clients creating issues
+MARKDOWN_SECTION = """## Background
+When the checkout service receives a payment confirmation it writes the order to \
+the ledger and publishes an event for the fulfilment pipeline. Under load the \
+**ledger writes** time out and the retry logic resubmits the payment, which produces \
+duplicate charges for a small share of customers. The incident review found that \
+the idempotency key is generated per attempt instead of per order, see \
+[INC-4821](https://status.example.com/incidents/4821) for the timeline.
+
+### Proposed change
+- Generate the idempotency key once per order and store it with the cart
+- Pass the key through to the payment provider on every retry
+  - Keep the existing timeout of 30 seconds
+- Add a dashboard panel for retried payments
+
+The retry policy lives in `payments/retry.py` and is configured per environment. \
+Nothing else in the *checkout* flow needs to change.
+
+```python
+def charge(order, provider):
+    key = order.idempotency_key or new_key(order.id)
+    return provider.charge(order.total, idempotency_key=key)
+```
+
+| Environment | Timeout | Retries |
+|-------------|---------|---------|
+| staging | 30s | 3 |
+| production | 30s | 5 |
+
+"""
+
+
+def build_description(size: int = 100_000, section: str = DESCRIPTION_SECTION) -> str:
+    """Build a description of roughly size characters."""
+    return section * (size // len(section))
+
+
+def _chained_regex_jira_to_markdown(output: str) -> str:
+    """The previous converter: one re.sub pass over the whole text per construct."""
+    output = re.sub(r"^bq\.(.*?)$", r"> \1\n", output, flags=re.MULTILINE)
+    output = re.sub(
+        r"([*_])(.*?)\1",
+        lambda m: (
+            ("**" if m.group(1) == "*" else "*")
+            + m.group(2)
+            + ("**" if m.group(1) == "*" else "*")
+        ),
+        output,
+    )
+    output = re.sub(
+        r"^((?:#|-|\+|\*)+) (.*)$",
+        lambda m: (
+            " " * ((len(m.group(1)) - 1) * 2)
+            + ("1." if m.group(1)[-1] == "#" else "-")
+            + f" {m.group(2)}"
+        ),
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(
+        r"^h([0-6])\.(.*)$",
+        lambda m: "#" * int(m.group(1)) + m.group(2),
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
+    output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
+    output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
+    output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
+    output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
+    output = re.sub(r"-([^-]*)-", r"-\1-", output)
+    output = re.sub(
+        r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
+        r"```\1\n\2\n```",
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
+    output = re.sub(
+        r"\{quote\}([\s\S]*)\{quote\}",
+        lambda m: "\n".join(f"> {line}" for line in m.group(1).split("\n")),
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(
+        r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!", r"![\3](\1)", output
+    )
+    output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
+    output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
+    output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
+    output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
+    output = re.sub(
+        r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
+        r"<span style=\"color:\1\">\2</span>",
+        output,
+        flags=re.MULTILINE,
+    )
+    lines = output.split("\n")
+    i = 0
+    while i < len(lines):
+        if "||" in lines[i]:
+            lines[i] = lines[i].replace("||", "|")
+            header_cells = lines[i].count("|") - 1
+            if header_cells > 0:
+                lines.insert(i + 1, "|" + "---|" * header_cells)
+                i += 1
+        i += 1
+    return "\n".join(lines)
+
+
+def _chained_regex_markdown_to_jira(input_text: str) -> str:
+    """The previous converter: one re.sub pass over the whole text per construct."""
+    output = re.sub(
+        r"```(\w*)\n([\s\S]+?)```",
+        lambda m: (
+            "{code"
+            + (":" + m.group(1) if m.group(1) else "")
+            + "}"
+            + m.group(2)
+            + "{code}"
+        ),
+        input_text,
+    )
+    output = re.sub(r"`([^`]+)`", r"{{\1}}", output)
+    output = re.sub(
+        r"^(.*?)\n([=-])+$",
+        lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(
+        r"^([#]+)(.*?)$",
+        lambda match: f"h{len(match.group(1))}." + match.group(2),
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(
+        r"([*_]+)(.*?)\1",
+        lambda match: (
+            ("_" if len(match.group(1)) == 1 else "*")
+            + match.group(2)
+            + ("_" if len(match.group(1)) == 1 else "*")
+        ),
+        output,
+    )
+    output = re.sub(
+        r"^(\s*)- (.*)$",
+        lambda match: (
+            "* " + match.group(2)
+            if not match.group(1)
+            else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
+        ),
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(
+        r"^(\s+)1\. (.*)$",
+        lambda match: "#" * (int(len(match.group(1)) / 4) + 2) + " " + match.group(2),
+        output,
+        flags=re.MULTILINE,
+    )
+    tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
+    for tag, replacement in tag_map.items():
+        output = re.sub(
+            rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output
+        )
+    output = re.sub(
+        r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>",
+        r"{color:\1}\2{color}",
+        output,
+        flags=re.MULTILINE,
+    )
+    output = re.sub(r"~~(.*?)~~", r"-\1-", output)
+    output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
+    output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
+    output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
+    output = re.sub(r"<([^>]+)>", r"[\1]", output)
+    lines = output.split("\n")
+    i = 0
+    while i < len(lines):
+        if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
+            lines[i] = lines[i].replace("|", "||")
+            lines.pop(i + 1)
+        i += 1
+    return "\n".join(lines)
+
+
+def test_jira_to_markdown_benchmark():
+    """The single-pass converter must beat the chained regex passes."""
+    text = build_description()
+    preprocessor = JiraPreprocessor()
+
+    # Every heading and code block survives the conversion
+    converted = preprocessor.jira_to_markdown(text)
+    assert converted.count("```python\n") == text.count("{code:python}")
+    assert converted.count("## Background") == text.count("h2. Background")
+
+    chained = best_of(lambda: _chained_regex_jira_to_markdown(text))
+    single = best_of(lambda: preprocessor.jira_to_markdown(text))
+    print(
+        f"jira_to_markdown {len(text) // 1000} KB: chained {chained * 1e3:.2f} ms, "
+        f"single pass {single * 1e3:.2f} ms ({chained / single:.1f}x)"
+    )
+    assert single < chained
+
+
+def test_markdown_to_jira_benchmark():
+    """The single-pass converter must beat the chained regex passes."""
+    text = build_description(section=MARKDOWN_SECTION)
+    preprocessor = JiraPreprocessor()
+
+    converted = preprocessor.markdown_to_jira(text)
+    assert converted == _chained_regex_markdown_to_jira(text)
+
+    chained = best_of(lambda: _chained_regex_markdown_to_jira(text))
+    single = best_of(lambda: preprocessor.markdown_to_jira(text))
+    print(
+        f"markdown_to_jira {len(text) // 1000} KB: chained {chained * 1e3:.2f} ms, "
+        f"single pass {single * 1e3:.2f} ms ({chained / single:.1f}x)"
+    )
+    assert single < chained
@@ -0,0 +1,45 @@
+"""Micro-benchmark comparing the JSON codecs on the fixture payloads."""
+
+import pytest
+
+from mcp_atlassian import json_codec
+from mcp_atlassian.json_codec import OrjsonCodec, StdlibCodec
+from tests.benchmarks.replay import build_search_page
+from tests.benchmarks.timing import best_of
+from tests.fixtures.confluence_mocks import MOCK_PAGE_RESPONSE
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(json_codec.orjson is None, reason="orjson is not installed"),
+]
+
+PAYLOADS = {
+    "jira_search_50": build_search_page(),
+    "confluence_page": MOCK_PAGE_RESPONSE,
+}
+
+
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+def test_json_codec_benchmark(payload):
+    """orjson must decode and encode the fixture payloads faster than stdlib."""
+    data = PAYLOADS[payload]
+    raw = StdlibCodec().dumps(data).encode()
+    stdlib, fast = StdlibCodec(), OrjsonCodec()
+
+    timings = {}
+    for codec in (stdlib, fast):
+        timings[codec.name] = {
+            "loads": best_of(lambda codec=codec: codec.loads(raw), number=50),
+            "dumps": best_of(
+                lambda codec=codec: codec.dumps(data, pretty=True), number=50
+            ),
+        }
+
+    for operation in ("loads", "dumps"):
+        slow, quick = timings["stdlib"][operation], timings["orjson"][operation]
+        speedup = slow / quick
+        print(
+            f"{payload} {operation}: stdlib {slow * 1e6:.1f} us, "
+            f"orjson {quick * 1e6:.1f} us ({speedup:.1f}x)"
+        )
+        assert speedup > 1.0, f"orjson {operation} is not faster on {payload}"
@@ -0,0 +1,35 @@
+"""Micro-benchmark comparing search result models with the simplified fast path."""
+
+import pytest
+
+from mcp_atlassian.models.jira import JiraSearchResult
+from tests.benchmarks.replay import build_search_page
+from tests.benchmarks.timing import best_of
+
+pytestmark = pytest.mark.benchmark
+
+BASE_URL = "https://example.atlassian.net"
+
+
+def _via_models(page: dict) -> list[dict]:
+    result = JiraSearchResult.from_api_response(page, base_url=BASE_URL)
+    return [issue.to_simplified_dict() for issue in result.issues]
+
+
+def _direct(page: dict) -> list[dict]:
+    return JiraSearchResult.simplify_api_response(page, base_url=BASE_URL)
+
+
+def test_search_result_simplify_benchmark():
+    """The fast path must be faster and produce identical tool output."""
+    page = build_search_page(50)
+
+    assert _direct(page) == _via_models(page)
+
+    models = best_of(lambda: _via_models(page), number=20)
+    direct = best_of(lambda: _direct(page), number=20)
+    print(
+        f"jira_search_50 simplified: models {models * 1e3:.2f} ms, "
+        f"direct {direct * 1e3:.2f} ms ({models / direct:.1f}x)"
+    )
+    assert direct < models
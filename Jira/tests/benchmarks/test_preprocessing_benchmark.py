@@ -0,0 +1,134 @@
+"""Micro-benchmarks of the text preprocessing helpers on realistic payloads."""
+
+import re
+from datetime import datetime
+
+import pytest
+
+from mcp_atlassian.models.base import TimestampMixin
+from mcp_atlassian.preprocessing.jira import _MENTION_RE, JiraPreprocessor
+from tests.benchmarks.timing import best_of, report
+
+pytestmark = pytest.mark.benchmark
+
+BASE_URL = "https://example.atlassian.net"
+
+# One comment of a busy issue: mentions, smart links and plain prose
+COMMENT = f"""[~accountid:5b10ac8d82e05b22cc7d4ef5] can you take a look at the \
+failing checkout tests? They started after \
+[PROJ-123|{BASE_URL}/browse/PROJ-123|smart-link] was merged. The runbook in \
+[Payments runbook|{BASE_URL}/wiki/spaces/PAY/pages/98765/\
+PROJ-7+Payments+Runbook?focusedCommentId=1|smart-link] describes the retry settings; \
+[~accountid:5b10a2844c20165700ede21g] confirmed the staging values match. See also \
+[the dashboard|https://grafana.example.com/d/payments?orgId=1|smart-link] for the \
+error rate over the last week.
+
+"""
+
+TIMESTAMPS = [
+    "2024-01-01T12:34:56.789+0000",
+    "2024-03-15T08:00:00.000-0500",
+    "2024-06-30T23:59:59Z",
+]
+
+
+def build_comments(count: int = 200) -> str:
+    """Build the text of count comments."""
+    return COMMENT * count
+
+
+def _legacy_process_mentions(text: str, pattern: str) -> str:
+    """The previous implementation: one str.replace over the text per mention."""
+    for account_id in re.findall(pattern, text):
+        text = text.replace(f"[~accountid:{account_id}]", f"User:{account_id}")
+    return text
+
+
+def _legacy_process_smart_links(text: str, base_url: str) -> str:
+    """The previous implementation: one str.replace over the text per link."""
+    for match in re.finditer(r"\[(.*?)\|(.*?)\|smart-link\]", text):
+        full_match, link_text, link_url = match.group(0, 1, 2)
+        issue_key_match = re.search(r"browse/([A-Z]+-\d+)", link_url)
+        confluence_match = re.search(
+            r"wiki/spaces/.+?/pages/\d+/(.+?)(?:\?|$)", link_url
+        )
+        if issue_key_match:
+            issue_key = issue_key_match.group(1)
+            clean_url = f"{base_url}/browse/{issue_key}"
+            text = text.replace(full_match, f"[{issue_key}]({clean_url})")
+        elif confluence_match:
+            readable_title = confluence_match.group(1).replace("+", " ")
+            readable_title = re.sub(r"^[A-Z]+-\d+\s+", "", readable_title)
+            text = text.replace(full_match, f"[{readable_title}]({link_url})")
+        else:
+            clean_url = link_url.split("?")[0]
+            text = text.replace(full_match, f"[{link_text}]({clean_url})")
+    return text
+
+
+def _legacy_format_timestamp(timestamp: str) -> str:
+    """The previous implementation, formatting the parsed datetime."""
+    ts = timestamp.replace("Z", "+00:00")
+    if "+" in ts and ":" not in ts[-5:]:
+        tz_pos = ts.rfind("+")
+        ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
+    elif "-" in ts and ":" not in ts[-5:]:
+        tz_pos = ts.rfind("-")
+        ts = ts[: tz_pos + 3] + ":" + ts[tz_pos + 3 :]
+    return datetime.fromisoformat(ts).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def test_process_mentions_benchmark():
+    """Mentions must be replaced in one pass instead of one per mention."""
+    text = build_comments()
+    preprocessor = JiraPreprocessor(base_url=BASE_URL)
+    pattern = r"\[~accountid:(.*?)\]"
+
+    converted = preprocessor._process_mentions(text, _MENTION_RE)
+    assert converted == _legacy_process_mentions(text, pattern)
+
+    legacy = best_of(lambda: _legacy_process_mentions(text, pattern))
+    current = best_of(lambda: preprocessor._process_mentions(text, _MENTION_RE))
+    report(f"_process_mentions {len(text) // 1000} KB", legacy, current)
+    assert current < legacy
+
+
+def test_process_smart_links_benchmark():
+    """Smart links must be converted in one pass instead of one per link."""
+    text = build_comments()
+    preprocessor = JiraPreprocessor(base_url=BASE_URL)
+
+    converted = preprocessor._process_smart_links(text)
+    assert converted == _legacy_process_smart_links(text, BASE_URL)
+
+    legacy = best_of(lambda: _legacy_process_smart_links(text, BASE_URL))
+    current = best_of(lambda: preprocessor._process_smart_links(text))
+    report(f"_process_smart_links {len(text) // 1000} KB", legacy, current)
+    assert current < legacy
+
+
+def test_convert_html_to_markdown_benchmark():
+    """Plain text without tags must skip the pattern scan."""
+    text = build_comments()
+    preprocessor = JiraPreprocessor(base_url=BASE_URL)
+
+    assert preprocessor._convert_html_to_markdown(text) == text
+
+    legacy = best_of(lambda: re.search(r"<[^>]+>", text), number=100)
+    current = best_of(lambda: preprocessor._convert_html_to_markdown(text), number=100)
+    report(f"_convert_html_to_markdown {len(text) // 1000} KB", legacy, current)
+    assert current < legacy
+
+
+def test_format_timestamp_benchmark():
+    """Formatting must copy the validated date and time instead of strftime."""
+    timestamps = TIMESTAMPS * 100
+
+    for timestamp in TIMESTAMPS:
+        expected = _legacy_format_timestamp(timestamp)
+        assert TimestampMixin.format_timestamp(timestamp) == expected
+
+    legacy = best_of(lambda: [_legacy_format_timestamp(t) for t in timestamps])
+    current = best_of(lambda: [TimestampMixin.format_timestamp(t) for t in timestamps])
+    report(f"format_timestamp x{len(timestamps)}", legacy, current)
+    assert current < legacy
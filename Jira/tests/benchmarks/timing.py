@@ -0,0 +1,28 @@
+"""Timing helpers shared by the micro-benchmarks."""
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+
+def best_of(func: Callable[[], Any], number: int = 5, repeat: int = 5) -> float:
+    """
+    Time a function and return the best time per call.
+
+    Args:
+        func: Function to time, called without arguments
+        number: Calls per timing run
+        repeat: Number of timing runs
+
+    Returns:
+        Seconds per call in the fastest run
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(name: str, legacy: float, current: float) -> None:
+    """Print the legacy and current timings of a benchmark with the speedup."""
+    print(
+        f"{name}: legacy {legacy * 1e3:.3f} ms, current {current * 1e3:.3f} ms "
+        f"({legacy / current:.1f}x)"
+    )
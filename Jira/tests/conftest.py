@@ -13,6 +13,40 @@ def pytest_addoption(parser):
         default=False,
         help="Run tests that use real API data (requires env vars)",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the replay benchmarks in tests/benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-calls",
+        type=int,
+        default=50,
+        help="Number of tool calls issued per tool in the replay benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-concurrency",
+        type=int,
+        default=4,
+        help="Number of tool calls kept in flight in the replay benchmarks",
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        default=None,
+        help="Baseline JSON to compare against (default: benchmarks/baseline.json)",
+    )
+    parser.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression against the baseline (0.2 = 20%%)",
+    )
+    parser.addoption(
+        "--benchmark-save",
+        default=None,
+        help="Write the benchmark results to this JSON file",
+    )
 
 
 @pytest.fixture
@@ -414,3 +414,42 @@ MOCK_PAGES_FROM_SPACE_RESPONSE = [
         },
     },
 ]
+
+MOCK_ATTACHMENTS_RESPONSE = {
+    "results": [
+        {
+            "id": "att123456789",
+            "type": "attachment",
+            "status": "current",
+            "title": "architecture-diagram.png",
+            "metadata": {
+                "comment": "System overview",
+                "mediaType": "image/png",
+            },
+            "extensions": {
+                "mediaType": "image/png",
+                "fileSize": 52348,
+                "comment": "System overview",
+            },
+            "version": {"number": 2, "when": "2024-01-01T09:00:00.000Z"},
+            "container": {
+                "id": "987654321",
+                "type": "page",
+                "title": "Example Meeting Notes",
+            },
+            "_links": {
+                "webui": "/pages/viewpageattachments.action?pageId=987654321&preview=%2F987654321%2Fatt123456789%2Farchitecture-diagram.png",
+                "download": "/download/attachments/987654321/architecture-diagram.png?version=2&modificationDate=1704099600000&api=v2",
+                "self": "https://example.atlassian.net/wiki/rest/api/content/att123456789",
+            },
+        }
+    ],
+    "start": 0,
+    "limit": 50,
+    "size": 1,
+    "_links": {
+        "base": "https://example.atlassian.net/wiki",
+        "context": "/wiki",
+        "self": "https://example.atlassian.net/wiki/rest/api/content/987654321/child/attachment",
+    },
+}
@@ -1,7 +1,20 @@
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+
 import pytest
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
 
+from mcp_atlassian.models.confluence import ConfluenceUser
+from mcp_atlassian.preprocessing import base
+from mcp_atlassian.preprocessing import confluence as confluence_preprocessing
+from mcp_atlassian.preprocessing.base import _convert_plain_text, get_markdown_parser
 from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
-from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+from mcp_atlassian.preprocessing.jira import _MENTION_RE, JiraPreprocessor
+from mcp_atlassian.preprocessing.pool import ConversionPool
+from mcp_atlassian.preprocessing.sections import split_storage_sections
+from mcp_atlassian.preprocessing.store import ConversionStore
+from mcp_atlassian.utils import display_names
 from tests.fixtures.confluence_mocks import MOCK_COMMENTS_RESPONSE, MOCK_PAGE_RESPONSE
 from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
 
@@ -16,6 +29,14 @@ class MockConfluenceClient:
         }
 
 
+@pytest.fixture(autouse=True)
+def clear_display_names():
+    """Start every test without display names cached by earlier tests."""
+    display_names.clear()
+    yield
+    display_names.clear()
+
+
 @pytest.fixture
 def preprocessor_with_jira():
     return JiraPreprocessor(base_url="https://example.atlassian.net")
@@ -129,10 +150,9 @@ def test_clean_jira_text_smart_links(preprocessor_with_jira):
     confluence_url = (
         f"{base_url}/wiki/spaces/PROJ/pages/987654321/Example+Meeting+Notes"
     )
-    processed_url = f"{base_url}/wiki/spaces/PROJ/pages/987654321/ExampleMeetingNotes"
     text = f"[Meeting Notes|{confluence_url}|smart-link]"
     cleaned = preprocessor_with_jira.clean_jira_text(text)
-    assert cleaned == f"[Example Meeting Notes]({processed_url})"
+    assert cleaned == f"[Example Meeting Notes]({confluence_url})"
 
 
 def test_clean_jira_text_html_content(preprocessor_with_jira):
@@ -154,6 +174,51 @@ def test_clean_jira_text_combined(preprocessor_with_jira):
     assert f"[PROJ-123]({base_url}/browse/PROJ-123)" in cleaned
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Meeting notes for the @@@hl@@@sprint@@@endhl@@@ review",
+        "Use *bold* and snake_case names &hellip; 100% done",
+        "a &amp; b &lt;tag&gt; caf&eacute;&nbsp;x > y",
+        "line one\r\n  line two\t\twith   spaces\n\n",
+        "# heading-like 1. list-like - [link] `code` \\ ~tilde~",
+    ],
+)
+def test_process_html_content_plain_text_fast_path(preprocessor_with_confluence, text):
+    """Test that plain text skips the HTML parse but converts identically."""
+    soup_html = str(BeautifulSoup(text, "html.parser"))
+
+    assert _convert_plain_text(text) == (soup_html, md(soup_html))
+    assert preprocessor_with_confluence.process_html_content(text) == (
+        soup_html,
+        md(soup_html),
+    )
+
+
+@pytest.mark.parametrize(
+    "text", ["<p>markup</p>", "&amp without semicolon", "&#39;quoted&#39;", "  \n"]
+)
+def test_plain_text_fast_path_falls_back(text):
+    """Test that markup and unusual references use the full conversion."""
+    assert _convert_plain_text(text) is None
+
+
+def test_process_html_content_plain_text_output_modes(preprocessor_with_confluence):
+    """Test that the plain-text fast path only returns the requested format."""
+    text = "Release 1.2 * notes"
+    processed_html, processed_markdown = (
+        preprocessor_with_confluence.process_html_content(text)
+    )
+
+    assert preprocessor_with_confluence.process_html_content(text, output="html") == (
+        processed_html,
+        "",
+    )
+    assert preprocessor_with_confluence.process_html_content(
+        text, output="markdown"
+    ) == ("", processed_markdown)
+
+
 def test_process_html_content_error_handling(preprocessor_with_confluence):
     """Test error handling in process_html_content."""
     with pytest.raises(Exception):
@@ -170,7 +235,7 @@ def test_clean_jira_text_with_invalid_html(preprocessor_with_jira):
 def test_process_mentions_error_handling(preprocessor_with_jira):
     """Test error handling in _process_mentions."""
     text = "[~accountid:invalid]"
-    processed = preprocessor_with_jira._process_mentions(text, r"\[~accountid:(.*?)\]")
+    processed = preprocessor_with_jira._process_mentions(text, _MENTION_RE)
     assert "User:invalid" in processed
 
 
@@ -227,6 +292,51 @@ For more information, see [our website|https://example.com].
     assert "[our website](https://example.com)" in converted
 
 
+def test_jira_to_markdown_protects_code_blocks(preprocessor_with_jira):
+    """Test that markup inside code and noformat blocks is left alone."""
+    converted = preprocessor_with_jira.jira_to_markdown(
+        "{code:java}\nint x = a^b^ + c-d-;\n*not bold* [a|b]\n{code}\n"
+        "{noformat}\nh1. raw ~text~\n{noformat}"
+    )
+    assert converted == (
+        "```java\nint x = a^b^ + c-d-;\n*not bold* [a|b]\n```\n```\nh1. raw ~text~\n```"
+    )
+
+    converted = preprocessor_with_jira.jira_to_markdown(
+        "{code:title=Query.sql|language=sql}\nselect 1\n{code}"
+    )
+    assert converted == "```sql\nselect 1\n```"
+
+
+def test_jira_to_markdown_does_not_reconvert_output(preprocessor_with_jira):
+    """Test that identifiers and converted links are not treated as markup."""
+    assert (
+        preprocessor_with_jira.jira_to_markdown("Use snake_case_name in C++ and a+b+c")
+        == "Use snake_case_name in C++ and a+b+c"
+    )
+    assert (
+        preprocessor_with_jira.jira_to_markdown(
+            "[Page|https://example.com/Some+Page+Title] and [Done](https://x/A+B+C)"
+        )
+        == "[Page](https://example.com/Some+Page+Title) and [Done](https://x/A+B+C)"
+    )
+
+
+def test_jira_to_markdown_blocks_and_effects(preprocessor_with_jira):
+    """Test block markup and nested text effects."""
+    converted = preprocessor_with_jira.jira_to_markdown(
+        "||Name||*Value*||\n|a|b|\n* one with *bold _and italic_*\n## nested\n"
+        "{quote}\nquoted *text*\n{quote}\nx^2^ H~2~O ??Source?? +new+ "
+        "{color:red}red{color} !a.png|alt=Chart! [http://example.com]"
+    )
+    assert converted == (
+        "|Name|**Value**|\n|---|---|\n|a|b|\n- one with **bold *and italic***\n"
+        "  1. nested\n> \n> quoted **text**\n> \nx<sup>2</sup> H<sub>2</sub>O "
+        '<cite>Source</cite> <ins>new</ins> <span style="color:red">red</span> '
+        "![Chart](a.png) <http://example.com>"
+    )
+
+
 def test_markdown_to_jira(preprocessor_with_jira):
     """Test conversion of Markdown to Jira markup."""
     # Test headers
@@ -284,6 +394,125 @@ For more information, see [our website](https://example.com).
     assert "[our website|https://example.com]" in converted
 
 
+# Outputs recorded from the previous converter, which chained one re.sub per
+# construct; the single-pass converter must produce the same Jira markup
+MARKDOWN_TO_JIRA_GOLDEN = [
+    ("# Heading 1", "h1. Heading 1"),
+    ("### Heading 3 with **bold**", "h3. Heading 3 with *bold*"),
+    ("Title\n=====\n\nSubtitle\n--------\ntext", "h1. Title\n\nh2. Subtitle\ntext"),
+    (
+        "Plain paragraph with no markup at all.",
+        "Plain paragraph with no markup at all.",
+    ),
+    (
+        "**bold** and *italic* and __strong__ and _em_",
+        "*bold* and _italic_ and *strong* and _em_",
+    ),
+    (
+        "Mixed **bold text** in a sentence, then *italic text* after.",
+        "Mixed *bold text* in a sentence, then _italic text_ after.",
+    ),
+    ("`inline code` and more `code spans`", "{{inline code}} and more {{code spans}}"),
+    ("```\nmultiline code\n```", "{code}multiline code\n{code}"),
+    (
+        "```python\ndef hello():\n    print('Hello World')\n```\n\nAfter the code.",
+        (
+            "{code:python}def hello():\n    print('Hello World')\n{code}\n\n"
+            "After the code."
+        ),
+    ),
+    (
+        "- Item 1\n- Item 2\n  - Nested item\n    - Deeper item",
+        "* Item 1\n* Item 2\n  * Nested item\n    * Deeper item",
+    ),
+    (
+        "1. First\n    1. Nested numbered\n2. Second",
+        "1. First\n### Nested numbered\n2. Second",
+    ),
+    (
+        (
+            "Text with <cite>a citation</cite>, <del>deleted</del>, "
+            "<ins>inserted</ins>, x<sup>2</sup> and H<sub>2</sub>O."
+        ),
+        "Text with ??a citation??, -deleted-, +inserted+, x^2^ and H~2~O.",
+    ),
+    (
+        'Some <span style="color:#ff0000">red text</span> here.',
+        "Some {color:#ff0000}red text{color} here.",
+    ),
+    ("This is ~~struck~~ text.", "This is -struck- text."),
+    ("![](https://example.com/image.png)", "!https://example.com/image.png!"),
+    (
+        "![Diagram](https://example.com/diagram.png) inline image",
+        "!https://example.com/diagram.png|alt=Diagram! inline image",
+    ),
+    (
+        "See [the docs](https://example.com/docs) and [API](https://example.com/api?x=1).",
+        "See [the docs|https://example.com/docs] and [API|https://example.com/api?x=1].",
+    ),
+    ("Autolink <https://example.com> here.", "Autolink [https://example.com] here."),
+    (
+        "| Name | Age |\n|------|-----|\n| Alice | 30 |\n| Bob | 25 |",
+        "|| Name || Age ||\n| Alice | 30 |\n| Bob | 25 |",
+    ),
+    (
+        "| **Key** | Value |\n| --- | --- |\n| a | b |",
+        "|| *Key* || Value ||\n| a | b |",
+    ),
+    (
+        "Intro\n\n| A | B |\n|---|---|\n| 1 | 2 |\n\nOutro",
+        "Intro\n\n|| A || B ||\n| 1 | 2 |\n\nOutro",
+    ),
+    ("Line one\nLine two\nLine three", "Line one\nLine two\nLine three"),
+    ("Ends with newline\n", "Ends with newline\n"),
+    (
+        (
+            "## Steps\n- Open [the page](https://example.com/page)\n"
+            "- Click **Save**\n- Check the `status` field\n"
+        ),
+        (
+            "h2. Steps\n* Open [the page|https://example.com/page]\n"
+            "* Click *Save*\n* Check the {{status}} field\n"
+        ),
+    ),
+    ("Text with a #hashtag and C# mention", "Text with a #hashtag and C# mention"),
+    ("#NoSpace heading", "h1.NoSpace heading"),
+]
+
+
+@pytest.mark.parametrize(("markdown", "expected"), MARKDOWN_TO_JIRA_GOLDEN)
+def test_markdown_to_jira_golden(preprocessor_with_jira, markdown, expected):
+    """Test that Markdown converts to the same markup as before."""
+    assert preprocessor_with_jira.markdown_to_jira(markdown) == expected
+
+
+def test_markdown_to_jira_protects_code(preprocessor_with_jira):
+    """Test that Markdown inside code blocks and code spans is left alone."""
+    converted = preprocessor_with_jira.markdown_to_jira(
+        "```python\n# comment\nvalue = a**b**c\n- not a list\n```\n"
+        "Use `*args` and `<T>`"
+    )
+    assert converted == (
+        "{code:python}# comment\nvalue = a**b**c\n- not a list\n{code}\n"
+        "Use {{*args}} and {{<T>}}"
+    )
+
+
+def test_markdown_to_jira_does_not_reconvert_output(preprocessor_with_jira):
+    """Test identifiers, bullets, nested emphasis and blank lines before lists."""
+    converted = preprocessor_with_jira.markdown_to_jira(
+        "Call my__private__name or x_y *then* this\n\n"
+        "* a *b*\n\n- **bold *italic* text**"
+    )
+    assert converted == (
+        "Call my__private__name or x_y _then_ this\n\n* a _b_\n\n* *bold _italic_ text*"
+    )
+    assert (
+        preprocessor_with_jira.markdown_to_jira("[link](https://example.com/__init__)")
+        == "[link|https://example.com/__init__]"
+    )
+
+
 def test_markdown_to_confluence_storage(preprocessor_with_confluence):
     """Test conversion of Markdown to Confluence storage format."""
     markdown = """# Heading 1
@@ -308,3 +537,402 @@ This is some **bold** and *italic* text.
     assert "<em>" in storage_format or "<i>" in storage_format  # Italic
     assert "<a href=" in storage_format.lower()  # Link
     assert "example.com" in storage_format
+
+
+def test_markdown_to_confluence_storage_is_memoized(monkeypatch):
+    """Test that resending the same body skips the conversion."""
+    processor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    calls = MagicMock(wraps=confluence_preprocessing.markdown_to_html)
+    monkeypatch.setattr(confluence_preprocessing, "markdown_to_html", calls)
+
+    first = processor.markdown_to_confluence_storage("# Title\n\nBody")
+    second = processor.markdown_to_confluence_storage("# Title\n\nBody")
+    other = processor.markdown_to_confluence_storage("# Other title")
+
+    assert first == second
+    assert "Other title" in other
+    assert calls.call_count == 2
+
+
+def test_markdown_to_confluence_storage_reuses_scratch_dir(monkeypatch):
+    """Test that conversions share one empty scratch directory."""
+    mkdtemp = MagicMock(wraps=confluence_preprocessing.tempfile.mkdtemp)
+    monkeypatch.setattr(confluence_preprocessing.tempfile, "mkdtemp", mkdtemp)
+    monkeypatch.setattr(confluence_preprocessing, "_scratch_dir", None)
+    processor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    processor.markdown_to_confluence_storage("[guide](docs/guide.md)")
+    processor.markdown_to_confluence_storage("![diagram](diagram.png)")
+
+    mkdtemp.assert_called_once()
+    scratch_dir = confluence_preprocessing._get_scratch_dir()
+    assert scratch_dir.is_dir()
+    assert not any(scratch_dir.iterdir())
+
+
+def test_markdown_to_confluence_storage_fallback(monkeypatch):
+    """Test that a failed conversion wraps the HTML it already produced."""
+    calls = MagicMock(wraps=confluence_preprocessing.markdown_to_html)
+    monkeypatch.setattr(confluence_preprocessing, "markdown_to_html", calls)
+    monkeypatch.setattr(
+        confluence_preprocessing,
+        "elements_from_string",
+        MagicMock(side_effect=ValueError("bad tree")),
+    )
+    processor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    storage_format = processor.markdown_to_confluence_storage("Some **bold** text")
+
+    assert storage_format.startswith("<p>")
+    assert "<strong>bold</strong>" in storage_format
+    calls.assert_called_once()
+
+
+def test_markdown_to_confluence_storage_fallback_is_not_cached(monkeypatch):
+    """Test that a failed conversion is retried instead of served from cache."""
+    monkeypatch.setattr(
+        confluence_preprocessing,
+        "elements_from_string",
+        MagicMock(side_effect=ValueError("bad tree")),
+    )
+    processor = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+
+    fallback = processor.markdown_to_confluence_storage("Some **bold** text")
+    monkeypatch.undo()
+    storage_format = processor.markdown_to_confluence_storage("Some **bold** text")
+
+    assert fallback.startswith("<p>")
+    assert storage_format != fallback
+    assert len(processor.storage_cache) == 1
+
+
+def test_conversion_store_round_trip(tmp_path):
+    """Test that conversions persist across store instances."""
+    path = tmp_path / "conversions.db"
+    store = ConversionStore(path)
+    key = store.key("<p>Hello</p>", "https://example.atlassian.net")
+
+    assert key != store.key("<p>Hello</p>", "https://other.atlassian.net")
+    assert store.get(key) is None
+    store.put(key, "<p>Hello</p>", "Hello")
+    store.close()
+
+    assert ConversionStore(path).get(key) == ("<p>Hello</p>", "Hello")
+
+
+def test_conversion_store_evicts_least_recently_used(tmp_path):
+    """Test that the size cap evicts the least recently used entries."""
+    store = ConversionStore(tmp_path / "conversions.db", max_bytes=300)
+    for name in ("a", "b", "c"):
+        store.put(name, "x" * 50, "y" * 50)
+    store.get("a")  # "b" is now least recently used
+    store.put("d", "x" * 50, "y" * 50)
+
+    assert store.get("b") is None
+    assert all(store.get(name) for name in ("a", "c", "d"))
+
+
+def test_process_html_content_uses_conversion_store(tmp_path, monkeypatch):
+    """Test that large pages are converted once and then read from the store."""
+    html_content = MOCK_PAGE_RESPONSE["body"]["storage"]["value"] * 4
+    store = ConversionStore(tmp_path / "conversions.db")
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=MockConfluenceClient(),
+        conversion_store=store,
+    )
+    converted = processor.process_html_content(html_content)
+
+    # A fresh processor (e.g. after a restart) must not parse the HTML again
+    restarted = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        conversion_store=ConversionStore(tmp_path / "conversions.db"),
+    )
+    monkeypatch.setattr(
+        "mcp_atlassian.preprocessing.base.BeautifulSoup",
+        lambda *args, **kwargs: pytest.fail("HTML was parsed again"),
+    )
+    assert restarted.process_html_content(html_content) == converted
+    assert "@Test User user123" in converted[1]
+
+
+def test_process_html_content_skips_store_for_unresolved_mentions(tmp_path):
+    """Test that fallback mentions from failed user lookups are not persisted."""
+    html_content = MOCK_PAGE_RESPONSE["body"]["storage"]["value"] * 4
+    store = ConversionStore(tmp_path / "conversions.db")
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", conversion_store=store
+    )
+
+    _, markdown = processor.process_html_content(html_content)
+
+    assert r"@user\_user123" in markdown
+    assert store.get(store.key(html_content, processor.base_url)) is None
+
+
+STORAGE_FORMAT_PAGE = (
+    MOCK_PAGE_RESPONSE["body"]["storage"]["value"]
+    + '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">'
+    "python</ac:parameter><ac:plain-text-body><![CDATA[if a < b and c > d:\n"
+    "    print('<p>&amp;</p>')]]></ac:plain-text-body></ac:structured-macro>"
+    "<table><tbody><tr><th>Key</th><th>Value</th></tr>"
+    "<tr><td>a</td><td><strong>1</strong></td></tr></tbody></table>"
+)
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [
+        "html.parser",
+        pytest.param(
+            "lxml",
+            marks=pytest.mark.skipif(base.lxml is None, reason="lxml not installed"),
+        ),
+    ],
+)
+def test_process_html_content_output_modes(parser):
+    """Test that single-format modes match the corresponding half of both."""
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=MockConfluenceClient(),
+        markdown_parser=parser,
+    )
+    processed_html, processed_markdown = processor.process_html_content(
+        STORAGE_FORMAT_PAGE
+    )
+
+    # The tree is converted directly, as markdownify would convert the HTML
+    assert processed_markdown == md(processed_html)
+    assert "print('<p>&amp;</p>')" in processed_markdown
+    assert processor.process_html_content(STORAGE_FORMAT_PAGE, output="html") == (
+        processed_html,
+        "",
+    )
+    assert processor.process_html_content(STORAGE_FORMAT_PAGE, output="markdown") == (
+        "",
+        processed_markdown,
+    )
+
+
+def test_process_html_content_output_modes_use_own_store_entries(tmp_path):
+    """Test that a single-format result is never served as the full result."""
+    html_content = STORAGE_FORMAT_PAGE * 4
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=MockConfluenceClient(),
+        conversion_store=ConversionStore(tmp_path / "conversions.db"),
+    )
+
+    markdown_only = processor.process_html_content(html_content, output="markdown")
+    both = processor.process_html_content(html_content)
+
+    assert markdown_only == ("", both[1])
+    assert both[0]
+    assert processor.process_html_content(html_content, output="markdown") == (
+        markdown_only
+    )
+
+
+def test_get_markdown_parser(monkeypatch):
+    """Test parser selection from the argument and the environment."""
+    monkeypatch.setattr(base, "lxml", MagicMock())
+    monkeypatch.delenv("CONFLUENCE_HTML_PARSER", raising=False)
+    assert get_markdown_parser() == "lxml"
+    assert get_markdown_parser("html.parser") == "html.parser"
+
+    monkeypatch.setenv("CONFLUENCE_HTML_PARSER", "html.parser")
+    assert get_markdown_parser() == "html.parser"
+    assert get_markdown_parser("LXML") == "lxml"
+
+    # Without lxml every choice falls back to the standard library parser
+    monkeypatch.setattr(base, "lxml", None)
+    assert get_markdown_parser("lxml") == "html.parser"
+    assert get_markdown_parser("auto") == "html.parser"
+
+
+@pytest.fixture
+def conversion_pool():
+    """Provide a single-worker pool that converts inputs of any size."""
+    pool = ConversionPool(max_workers=1, min_length=0)
+    yield pool
+    pool.shutdown()
+
+
+def test_conversion_pool_from_env(monkeypatch):
+    """Test that the pool is only configured with a positive worker count."""
+    monkeypatch.delenv("CONFLUENCE_CONVERSION_WORKERS", raising=False)
+    assert ConversionPool.from_env() is None
+
+    monkeypatch.setenv("CONFLUENCE_CONVERSION_WORKERS", "2")
+    monkeypatch.setenv("CONFLUENCE_CONVERSION_PROCESS_MIN_KB", "16")
+    pool = ConversionPool.from_env()
+    assert (pool.max_workers, pool.min_length) == (2, 16 * 1024)
+
+    monkeypatch.setenv("CONFLUENCE_CONVERSION_WORKERS", "many")
+    assert ConversionPool.from_env() is None
+
+
+def test_process_html_content_in_conversion_pool(conversion_pool):
+    """Test that pooled conversions match inline ones, with resolved mentions."""
+    inline = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=MockConfluenceClient(),
+    )
+    pooled = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=MockConfluenceClient(),
+        conversion_pool=conversion_pool,
+    )
+    conversion_pool.warm()
+
+    for output in ("both", "html", "markdown"):
+        assert pooled.process_html_content(
+            STORAGE_FORMAT_PAGE, output=output
+        ) == inline.process_html_content(STORAGE_FORMAT_PAGE, output=output)
+    assert "@Test User user123" in pooled.process_html_content(STORAGE_FORMAT_PAGE)[1]
+
+
+def test_markdown_to_confluence_storage_in_conversion_pool(conversion_pool):
+    """Test that Markdown converted in a worker process matches inline output."""
+    markdown = "# Title\n\nSome **bold** text and a [link](https://example.com)."
+    inline = ConfluencePreprocessor(base_url="https://example.atlassian.net")
+    pooled = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", conversion_pool=conversion_pool
+    )
+
+    assert pooled.markdown_to_confluence_storage(
+        markdown
+    ) == inline.markdown_to_confluence_storage(markdown)
+
+
+def test_small_inputs_are_converted_inline():
+    """Test that inputs below the size threshold never reach the pool."""
+    pool = MagicMock(min_length=1024 * 1024)
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", conversion_pool=pool
+    )
+
+    processor.process_html_content(STORAGE_FORMAT_PAGE)
+    processor.markdown_to_confluence_storage("# Title")
+
+    pool.run.assert_not_called()
+
+
+def test_broken_conversion_pool_falls_back_inline(conversion_pool, monkeypatch):
+    """Test that a conversion is run inline when a worker process dies."""
+    executor = MagicMock()
+    executor.submit.side_effect = BrokenProcessPool("worker died")
+    monkeypatch.setattr(conversion_pool, "_executor", executor)
+
+    assert conversion_pool.run(len, "abc") == 3
+    assert conversion_pool._executor is None
+    executor.shutdown.assert_called_once_with(wait=False)
+
+
+def test_user_mentions_are_resolved_once_per_user():
+    """Test that repeated mentions are deduplicated and looked up concurrently."""
+    mention = '<ac:link><ri:user ri:account-id="{}" /></ac:link>'
+    html_content = "".join(
+        f"<p>{mention.format(f'user{i % 3}')}</p>" for i in range(12)
+    )
+    client = MagicMock(wraps=MockConfluenceClient())
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+
+    _, markdown = processor.process_html_content(html_content)
+
+    assert markdown.count("@Test User user1") == 4
+    assert sorted(
+        c.args[0] for c in client.get_user_details_by_accountid.mock_calls
+    ) == [
+        "user0",
+        "user1",
+        "user2",
+    ]
+
+    # A second page mentioning the same users needs no lookups at all
+    client.get_user_details_by_accountid.reset_mock()
+    processor.process_html_content(f"<p>{mention.format('user2')}</p>")
+    client.get_user_details_by_accountid.assert_not_called()
+
+
+def test_user_mentions_use_names_from_parsed_users():
+    """Test that users parsed from API responses seed the mention name cache."""
+    ConfluenceUser.from_api_response(
+        {"accountId": "user123", "displayName": "Known Author"}
+    )
+    client = MagicMock()
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+
+    _, markdown = processor.process_html_content(
+        '<p><ac:link><ri:user ri:account-id="user123" /></ac:link></p>'
+    )
+
+    assert "@Known Author" in markdown
+    client.get_user_details_by_accountid.assert_not_called()
+
+
+def test_failed_user_lookup_is_not_cached():
+    """Test that a failed lookup falls back without caching the failure."""
+    client = MagicMock()
+    client.get_user_details_by_accountid.side_effect = Exception("API down")
+    processor = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net", confluence_client=client
+    )
+
+    _, markdown = processor.process_html_content(
+        '<p><ac:link><ri:user ri:account-id="user123" /></ac:link></p>'
+    )
+
+    assert r"@user\_user123" in markdown
+    assert display_names.get("user123") is None
+
+
+def test_split_storage_sections():
+    """Test that pages are split at top-level and layout headings only."""
+    html_content = (
+        "<p>Intro</p>"
+        "<h1>Setup &amp; <em>usage</em></h1><p>Text<br>more</p>"
+        "<table><tbody><tr><td><h2>Not a section</h2></td></tr></tbody></table>"
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body>'
+        "<![CDATA[<h1>Not a section</h1>]]></ac:plain-text-body>"
+        "</ac:structured-macro>"
+        "<ac:layout><ac:layout-section><ac:layout-cell>"
+        '<h2 id="faq">FAQ</h2><p>Answers</p>'
+        "</ac:layout-cell></ac:layout-section></ac:layout>"
+        '<h3>Links<ac:image><ri:url ri:value="a.png" /></ac:image></h3>'
+    )
+
+    sections = split_storage_sections(html_content)
+
+    assert [(s.index, s.level, s.title) for s in sections] == [
+        (0, 0, ""),
+        (1, 1, "Setup & usage"),
+        (2, 2, "FAQ"),
+        (3, 3, "Links"),
+    ]
+    assert "".join(html_content[s.start : s.end] for s in sections) == html_content
+    assert html_content[sections[1].start :].startswith("<h1>")
+
+
+@pytest.mark.parametrize(
+    ("html_content", "expected"),
+    [
+        ("", [(0, 0, "")]),
+        ("<p>No headings</p>", [(0, 0, "")]),
+        (
+            "\n<h2>First</h2><p>a</p><h2>Second</h2>",
+            [(0, 2, "First"), (1, 2, "Second")],
+        ),
+    ],
+)
+def test_split_storage_sections_edge_cases(html_content, expected):
+    """Test pages without headings and without content before the first one."""
+    sections = split_storage_sections(html_content)
+
+    assert [(s.index, s.level, s.title) for s in sections] == expected
+    assert sections[0].start == 0
+    assert sections[-1].end == len(html_content)
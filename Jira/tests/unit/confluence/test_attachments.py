@@ -0,0 +1,209 @@
+"""Unit tests for the AttachmentsMixin class."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from fixtures.confluence_mocks import MOCK_ATTACHMENTS_RESPONSE
+
+from mcp_atlassian.confluence.attachments import AttachmentsMixin
+from mcp_atlassian.models.confluence import ConfluenceAttachment, ConfluenceVersion
+
+CONTENT = b"0123456789" * 10
+
+
+def _response(body: bytes, status_code: int = 200) -> MagicMock:
+    """Create a streamed download response yielding body in small chunks."""
+    response = MagicMock(status_code=status_code)
+    response.__enter__.return_value = response
+    response.iter_content.side_effect = lambda chunk_size: (
+        body[i : i + 16] for i in range(0, len(body), 16)
+    )
+    return response
+
+
+class TestAttachmentsMixin:
+    """Tests for the AttachmentsMixin class."""
+
+    @pytest.fixture
+    def attachments_mixin(self, confluence_client):
+        """Create an AttachmentsMixin instance for testing."""
+        with patch(
+            "mcp_atlassian.confluence.attachments.ConfluenceClient.__init__"
+        ) as mock_init:
+            mock_init.return_value = None
+            mixin = AttachmentsMixin()
+            # Copy the necessary attributes from our mocked client
+            mixin.confluence = confluence_client.confluence
+            mixin.config = confluence_client.config
+            mixin.preprocessor = confluence_client.preprocessor
+            return mixin
+
+    @pytest.fixture
+    def attachment(self):
+        """Return an attachment whose content is CONTENT."""
+        return ConfluenceAttachment(
+            id="att1",
+            title="report.pdf",
+            media_type="application/pdf",
+            file_size=len(CONTENT),
+            version=ConfluenceVersion(number=3),
+            download_url="https://example.atlassian.net/wiki/download/attachments/1/report.pdf",
+        )
+
+    def test_get_page_attachments(self, attachments_mixin):
+        """Test listing the attachments of a page."""
+        attachments_mixin.confluence.get_attachments_from_content.return_value = (
+            MOCK_ATTACHMENTS_RESPONSE
+        )
+
+        result = attachments_mixin.get_page_attachments("987654321")
+
+        assert len(result) == 1
+        assert result[0].id == "att123456789"
+        assert result[0].title == "architecture-diagram.png"
+        assert result[0].media_type == "image/png"
+        assert result[0].file_size == 52348
+        assert result[0].page_id == "987654321"
+        assert result[0].download_url == (
+            "https://example.atlassian.net/wiki/download/attachments/987654321/"
+            "architecture-diagram.png?version=2&modificationDate=1704099600000&api=v2"
+        )
+
+    def test_get_page_attachments_paginates(self, attachments_mixin):
+        """Test that attachment listing follows the next links."""
+        item = MOCK_ATTACHMENTS_RESPONSE["results"][0]
+        attachments_mixin.confluence.get_attachments_from_content.side_effect = [
+            {"results": [item] * 50, "_links": {"next": "/next"}},
+            {"results": [item] * 3, "_links": {}},
+        ]
+
+        result = attachments_mixin.get_page_attachments("987654321")
+
+        assert len(result) == 53
+        calls = attachments_mixin.confluence.get_attachments_from_content.call_args_list
+        assert [c.kwargs["start"] for c in calls] == [0, 50]
+
+    def test_get_page_attachments_error(self, attachments_mixin):
+        """Test that listing errors return an empty list."""
+        attachments_mixin.confluence.get_attachments_from_content.side_effect = (
+            requests.RequestException("API error")
+        )
+
+        assert attachments_mixin.get_page_attachments("987654321") == []
+
+    def test_get_attachment_rejects_other_content(self, attachments_mixin):
+        """Test that looking up a page ID as an attachment returns None."""
+        attachments_mixin.confluence.get_page_by_id.return_value = {
+            "id": "987654321",
+            "type": "page",
+        }
+
+        assert attachments_mixin.get_attachment("987654321") is None
+
+    def test_download_attachment_streams_to_disk(
+        self, attachments_mixin, attachment, tmp_path
+    ):
+        """Test that the content is written chunk by chunk to the target file."""
+        attachments_mixin.confluence._session.get.return_value = _response(CONTENT)
+
+        path = attachments_mixin.download_attachment(attachment, tmp_path)
+
+        assert path == tmp_path / "report.pdf"
+        assert path.read_bytes() == CONTENT
+        assert list(tmp_path.iterdir()) == [path]
+        _, kwargs = attachments_mixin.confluence._session.get.call_args
+        assert kwargs["stream"] is True
+        assert kwargs["headers"] == {}
+
+    def test_download_attachment_resumes_partial_file(
+        self, attachments_mixin, attachment, tmp_path
+    ):
+        """Test that an interrupted download continues with a range request."""
+        (tmp_path / "report.pdf.v3.part").write_bytes(CONTENT[:40])
+        attachments_mixin.confluence._session.get.return_value = _response(
+            CONTENT[40:], status_code=206
+        )
+
+        path = attachments_mixin.download_attachment(attachment, tmp_path)
+
+        assert path.read_bytes() == CONTENT
+        _, kwargs = attachments_mixin.confluence._session.get.call_args
+        assert kwargs["headers"] == {"Range": "bytes=40-"}
+
+    def test_download_attachment_complete_partial_file(
+        self, attachments_mixin, attachment, tmp_path
+    ):
+        """Test that a complete partial file is renamed without a request."""
+        (tmp_path / "report.pdf.v3.part").write_bytes(CONTENT)
+
+        path = attachments_mixin.download_attachment(attachment, tmp_path)
+
+        assert path.read_bytes() == CONTENT
+        assert list(tmp_path.iterdir()) == [path]
+        attachments_mixin.confluence._session.get.assert_not_called()
+
+    def test_download_attachment_complete_partial_file_unknown_size(
+        self, attachments_mixin, attachment, tmp_path
+    ):
+        """Test that a refused range after a complete unknown-size file is done."""
+        attachment.file_size = None
+        (tmp_path / "report.pdf.v3.part").write_bytes(CONTENT)
+        response = _response(b"", status_code=416)
+        response.raise_for_status.side_effect = requests.HTTPError("416")
+        attachments_mixin.confluence._session.get.return_value = response
+
+        path = attachments_mixin.download_attachment(attachment, tmp_path)
+
+        assert path.read_bytes() == CONTENT
+        assert list(tmp_path.iterdir()) == [path]
+        _, kwargs = attachments_mixin.confluence._session.get.call_args
+        assert kwargs["headers"] == {"Range": f"bytes={len(CONTENT)}-"}
+
+    def test_download_attachment_ignored_range(
+        self, attachments_mixin, attachment, tmp_path
+    ):
+        """Test resuming from a server that answers a range with the full file."""
+        (tmp_path / "report.pdf.v3.part").write_bytes(CONTENT[:40])
+        attachments_mixin.confluence._session.get.return_value = _response(CONTENT)
+
+        path = attachments_mixin.download_attachment(attachment, tmp_path)
+
+        assert path.read_bytes() == CONTENT
+
+    def test_download_attachment_keeps_partial_on_error(
+        self, attachments_mixin, attachment, tmp_path
+    ):
+        """Test that a failed download leaves the partial file for resuming."""
+        response = _response(CONTENT)
+
+        def chunks(chunk_size):
+            yield CONTENT[:32]
+            raise requests.ConnectionError("reset")
+
+        response.iter_content.side_effect = chunks
+        attachments_mixin.confluence._session.get.return_value = response
+
+        with pytest.raises(Exception, match="Failed to download attachment att1"):
+            attachments_mixin.download_attachment(attachment, tmp_path)
+
+        assert (tmp_path / "report.pdf.v3.part").read_bytes() == CONTENT[:32]
+        assert not (tmp_path / "report.pdf").exists()
+
+    def test_size_cap(self, attachments_mixin, attachment, tmp_path):
+        """Test that attachments over the cap are not downloaded."""
+        with pytest.raises(ValueError, match="byte limit"):
+            attachments_mixin.download_attachment(attachment, tmp_path, max_bytes=50)
+        attachments_mixin.confluence._session.get.assert_not_called()
+
+        # Attachments of unknown size are cut off while streaming
+        attachment.file_size = None
+        attachments_mixin.confluence._session.get.return_value = _response(CONTENT)
+        with pytest.raises(ValueError, match="exceeds the 50 byte limit"):
+            attachments_mixin.read_attachment(attachment, max_bytes=50)
+
+    def test_read_attachment(self, attachments_mixin, attachment):
+        """Test reading a small attachment into memory."""
+        attachments_mixin.confluence._session.get.return_value = _response(CONTENT)
+
+        assert attachments_mixin.read_attachment(attachment) == CONTENT
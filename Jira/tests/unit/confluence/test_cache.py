@@ -0,0 +1,99 @@
+"""Unit tests for the Confluence caches."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.confluence.cache import SpaceIndex
+
+
+def _page(keys: list[str], limit: int) -> dict:
+    return {"results": [{"key": key} for key in keys], "limit": limit}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control time.monotonic as seen by the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_space_index_paginates_with_server_limit(clock):
+    """Test that the index follows pages using the limit the server applied."""
+    fetch = MagicMock(
+        side_effect=[_page(["A", "B"], 2), _page(["C", "D"], 2), _page(["E"], 2)]
+    )
+    index = SpaceIndex(fetch, ttl=60, page_size=500)
+
+    assert sorted(index.spaces()) == ["A", "B", "C", "D", "E"]
+    assert [c.args for c in fetch.call_args_list] == [(0, 500), (2, 500), (4, 500)]
+
+
+def test_space_index_stops_when_start_is_ignored(clock):
+    """Test that a server returning the same page forever does not loop."""
+    fetch = MagicMock(return_value=_page(["A", "B"], 2))
+    index = SpaceIndex(fetch, ttl=60)
+
+    assert sorted(index.spaces()) == ["A", "B"]
+    assert fetch.call_count == 2
+
+
+def test_space_index_caches_lookups(clock):
+    """Test that lookups are answered from the index until it expires."""
+    fetch = MagicMock(return_value=[{"key": "DEV"}])
+    index = SpaceIndex(fetch, ttl=60)
+
+    assert index.get("DEV") == {"key": "DEV"}
+    assert "DEV" in index
+    assert "MISSING" not in index
+    assert fetch.call_count == 1
+
+
+def test_space_index_reloads_for_unknown_keys(clock):
+    """Test that unknown keys reload the index at most once per interval."""
+    fetch = MagicMock(side_effect=[[{"key": "DEV"}], [{"key": "DEV"}, {"key": "NEW"}]])
+    index = SpaceIndex(fetch, ttl=300, min_refresh_interval=30)
+
+    assert index.get("NEW") is None
+    clock[0] += 31
+    assert index.get("NEW") == {"key": "NEW"}
+    assert fetch.call_count == 2
+
+
+def test_space_index_refreshes_stale_index_in_background(clock):
+    """Test that a stale index is served while it is reloaded in the background."""
+    fetch = MagicMock(side_effect=[[{"key": "OLD"}], [{"key": "NEW"}]])
+    index = SpaceIndex(fetch, ttl=60)
+    index.spaces()
+
+    clock[0] += 61
+    assert "OLD" in index.spaces()
+    index._refresh_thread.join(timeout=5)
+
+    assert list(index.spaces()) == ["NEW"]
+    assert fetch.call_count == 2
+
+
+def test_space_index_keeps_stale_index_on_refresh_error(clock):
+    """Test that a failed background refresh keeps the previous index."""
+    fetch = MagicMock(side_effect=[[{"key": "DEV"}], ConnectionError("down")])
+    index = SpaceIndex(fetch, ttl=60)
+    index.spaces()
+
+    clock[0] += 61
+    index.spaces()
+    index._refresh_thread.join(timeout=5)
+
+    assert "DEV" in index.spaces()
+
+
+def test_space_index_without_ttl_always_reloads(clock):
+    """Test that a TTL of zero disables caching."""
+    fetch = MagicMock(return_value=[{"key": "DEV"}])
+    index = SpaceIndex(fetch, ttl=0)
+
+    assert index.get("DEV") is not None
+    assert index.get("MISSING") is None
+    assert fetch.call_count == 2
@@ -24,6 +24,7 @@ class TestCommentsMixin:
             mixin.confluence = confluence_client.confluence
             mixin.config = confluence_client.config
             mixin.preprocessor = confluence_client.preprocessor
+            mixin.page_content_cache = confluence_client.page_content_cache
             return mixin
 
     def test_get_page_comments_success(self, comments_mixin):
@@ -53,7 +54,11 @@ class TestCommentsMixin:
 
         # Verify
         comments_mixin.confluence.get_page_comments.assert_called_once_with(
-            content_id=page_id, expand="body.view.value,version", depth="all"
+            content_id=page_id,
+            expand="body.view.value,version,container.space",
+            depth="all",
+            start=0,
+            limit=100,
         )
         assert len(result) == 1
         assert result[0].body == "Processed Markdown"
@@ -136,3 +141,52 @@ class TestCommentsMixin:
         # Assert
         assert isinstance(result, list)
         assert len(result) == 0  # Empty list with no comments
+
+    def test_get_page_comments_space_key_from_container(self, comments_mixin):
+        """Test that the space key comes from the comment container expansion."""
+        comments_mixin.confluence.get_page_comments.return_value = {
+            "results": [
+                {
+                    "id": "1",
+                    "body": {"view": {"value": "<p>Hi</p>"}},
+                    "container": {"id": "12345", "space": {"key": "PROJ"}},
+                }
+            ]
+        }
+
+        comments_mixin.get_page_comments("12345")
+
+        comments_mixin.confluence.get_page_by_id.assert_not_called()
+        comments_mixin.preprocessor.process_html_content.assert_called_once_with(
+            "<p>Hi</p>", space_key="PROJ", output="markdown"
+        )
+
+    def test_get_page_comments_streams_pages(self, comments_mixin):
+        """Test that comments are fetched page by page and converted in order."""
+
+        def comment(index: int) -> dict:
+            return {
+                "id": str(index),
+                "body": {"view": {"value": f"<p>{index}</p>"}},
+                "container": {"space": {"key": "PROJ"}},
+            }
+
+        comments_mixin.confluence.get_page_comments.side_effect = [
+            {
+                "results": [comment(i) for i in range(100)],
+                "_links": {"next": "/rest/api/content/12345/child/comment?start=100"},
+            },
+            {"results": [comment(i) for i in range(100, 105)], "_links": {}},
+        ]
+        comments_mixin.preprocessor.process_html_content.side_effect = (
+            lambda html, space_key="", output="both": (html, f"md:{html}")
+        )
+
+        result = comments_mixin.get_page_comments("12345")
+
+        assert [c.id for c in result] == [str(i) for i in range(105)]
+        assert result[42].body == "md:<p>42</p>"
+        assert [
+            c.kwargs["start"]
+            for c in comments_mixin.confluence.get_page_comments.call_args_list
+        ] == [0, 100]
@@ -0,0 +1,189 @@
+"""Unit tests for the local Confluence search index."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.confluence.cache import SpaceSnapshot
+from mcp_atlassian.confluence.index import SearchIndex
+from mcp_atlassian.confluence.search import SearchMixin
+from mcp_atlassian.models.confluence import (
+    ConfluencePage,
+    ConfluenceSpace,
+    ConfluenceVersion,
+)
+
+
+def _page(page_id: str, title: str, version: int = 1, space: str = "DOC"):
+    return ConfluencePage(
+        id=page_id,
+        title=title,
+        space=ConfluenceSpace(key=space, name=f"{space} space"),
+        version=ConfluenceVersion(number=version),
+        url=f"https://example.atlassian.net/wiki/pages/{page_id}",
+    )
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an empty search index."""
+    index = SearchIndex(tmp_path / "index.db")
+    yield index
+    index.close()
+
+
+def test_search_ranks_title_matches_first(index):
+    """Test that title matches outrank content matches."""
+    index.add(_page("1", "Release notes"), "The deployment checklist is elsewhere.")
+    index.add(_page("2", "Deployment checklist"), "Steps to follow.")
+
+    results = index.search("deployment checklist")
+
+    assert [page.id for page in results] == ["2", "1"]
+    assert results[0].space.key == "DOC"
+    assert results[0].url.endswith("/pages/2")
+    assert "checklist" in results[1].content
+
+
+def test_search_requires_all_terms_and_ignores_syntax(index):
+    """Test that every term must match and FTS5 operators are treated as text."""
+    index.add(_page("1", "Runbook"), "Restart the billing service.")
+
+    assert [page.id for page in index.search("billing service")] == ["1"]
+    assert index.search("billing payroll") == []
+    assert index.search('billing OR "payroll*') == []
+    assert index.search("***") == []
+
+
+def test_search_matches_without_diacritics(index):
+    """Test that accented content matches unaccented queries."""
+    index.add(_page("1", "Café menu"), "Crème brûlée")
+
+    assert [page.id for page in index.search("creme brulee")] == ["1"]
+
+
+def test_search_restricts_to_space(index):
+    """Test that a space key limits the results."""
+    index.add(_page("1", "Onboarding", space="HR"), "Welcome")
+    index.add(_page("2", "Onboarding", space="ENG"), "Welcome")
+
+    assert [page.id for page in index.search("onboarding", space_key="ENG")] == ["2"]
+
+
+def test_add_skips_unchanged_versions(index):
+    """Test incremental updates keyed by page version."""
+    assert index.add(_page("1", "Roadmap"), "first draft") is True
+    assert index.add(_page("1", "Roadmap"), "changed text") is False
+    assert index.search("changed") == []
+
+    assert index.add(_page("1", "Roadmap", version=2), "second draft") is True
+    assert len(index) == 1
+    assert index.search("first") == []
+    assert [page.id for page in index.search("second")] == ["1"]
+
+
+def test_remove(index):
+    """Test that removed pages are no longer found."""
+    index.add(_page("1", "Roadmap"), "plans")
+    index.remove("1")
+    index.remove("unknown")
+
+    assert len(index) == 0
+    assert index.search("roadmap") == []
+
+
+def test_from_env(tmp_path, monkeypatch):
+    """Test that the index is only enabled by CONFLUENCE_SEARCH_INDEX."""
+    monkeypatch.delenv("CONFLUENCE_SEARCH_INDEX", raising=False)
+    assert SearchIndex.from_env() is None
+
+    monkeypatch.setenv("CONFLUENCE_SEARCH_INDEX", str(tmp_path / "sub" / "index.db"))
+    index = SearchIndex.from_env()
+    assert isinstance(index, SearchIndex)
+    index.close()
+
+
+class TestSearchText:
+    """Tests for SearchMixin.search_text."""
+
+    @pytest.fixture
+    def search_mixin(self, index):
+        """Create a SearchMixin with a local index and a mocked remote client."""
+        with patch(
+            "mcp_atlassian.confluence.search.ConfluenceClient.__init__"
+        ) as mock_init:
+            mock_init.return_value = None
+            mixin = SearchMixin()
+            mixin.confluence = MagicMock()
+            mixin.config = MagicMock(url="https://example.atlassian.net/wiki")
+            mixin.preprocessor = MagicMock()
+            mixin.search_index = index
+            mixin.space_snapshots = {}
+            return mixin
+
+    def test_full_page_from_unsynced_space_uses_cql(self, search_mixin):
+        """Test that matches from a partially indexed space aren't trusted."""
+        search_mixin.search_index.add(_page("1", "Runbook"), "Restart billing")
+        search_mixin.confluence.cql.return_value = {"results": []}
+
+        search_mixin.search_text("billing", limit=1, space_key="DOC")
+
+        search_mixin.confluence.cql.assert_called_once_with(
+            cql='text ~ "billing" AND space = "DOC"', limit=1
+        )
+
+    def test_incomplete_snapshot_uses_cql(self, search_mixin):
+        """Test that a space whose sync stopped early is searched remotely."""
+        search_mixin.search_index.add(_page("1", "Runbook"), "Restart billing")
+        search_mixin.space_snapshots["DOC"] = SpaceSnapshot(
+            "DOC", synced_at=1.0, complete=False
+        )
+        search_mixin.confluence.cql.return_value = {"results": []}
+
+        search_mixin.search_text("billing", space_key="DOC")
+
+        search_mixin.confluence.cql.assert_called_once()
+
+    def test_partial_index_falls_back_to_cql(self, search_mixin):
+        """Test that fewer local matches than requested are searched remotely."""
+        search_mixin.search_index.add(_page("1", "Runbook"), "Restart billing")
+        search_mixin.confluence.cql.return_value = {"results": []}
+
+        search_mixin.search_text("billing", limit=10)
+
+        search_mixin.confluence.cql.assert_called_once_with(
+            cql='text ~ "billing"', limit=10
+        )
+
+    def test_answers_locally_for_synced_space(self, search_mixin):
+        """Test that a synced space is searched locally even with few matches."""
+        search_mixin.search_index.add(_page("1", "Runbook"), "Restart billing")
+        search_mixin.space_snapshots["DOC"] = SpaceSnapshot(
+            "DOC", synced_at=1.0, complete=True
+        )
+
+        results = search_mixin.search_text("billing", space_key="DOC")
+
+        assert [page.id for page in results] == ["1"]
+        search_mixin.confluence.cql.assert_not_called()
+
+    def test_falls_back_to_cql(self, search_mixin):
+        """Test that queries without local matches are searched remotely."""
+        search_mixin.confluence.cql.return_value = {"results": []}
+
+        search_mixin.search_text("billing", limit=5, space_key="ENG")
+
+        search_mixin.confluence.cql.assert_called_once_with(
+            cql='text ~ "billing" AND space = "ENG"', limit=5
+        )
+
+    def test_without_index(self, search_mixin):
+        """Test that the remote search is used when no index is configured."""
+        search_mixin.search_index = None
+        search_mixin.confluence.cql.return_value = {"results": []}
+
+        search_mixin.search_text("billing")
+
+        search_mixin.confluence.cql.assert_called_once_with(
+            cql='text ~ "billing"', limit=10
+        )
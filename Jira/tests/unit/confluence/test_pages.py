@@ -3,7 +3,9 @@
 from unittest.mock import patch
 
 import pytest
+from atlassian.errors import ApiError
 
+from mcp_atlassian.confluence.index import SearchIndex
 from mcp_atlassian.confluence.pages import PagesMixin
 from mcp_atlassian.models.confluence import ConfluencePage
 
@@ -24,6 +26,10 @@ class TestPagesMixin:
             mixin.confluence = confluence_client.confluence
             mixin.config = confluence_client.config
             mixin.preprocessor = confluence_client.preprocessor
+            mixin.space_index = confluence_client.space_index
+            mixin.page_id_cache = confluence_client.page_id_cache
+            mixin.page_content_cache = confluence_client.page_content_cache
+            mixin.search_index = confluence_client.search_index
             return mixin
 
     def test_get_page_content(self, pages_mixin):
@@ -60,6 +66,210 @@ class TestPagesMixin:
         assert result.version is not None
         assert result.version.number == 1
 
+    def test_get_page_content_reuses_unchanged_content(self, pages_mixin):
+        """Test that an unchanged page is revalidated without refetching its body."""
+        # Arrange
+        page_id = "987654321"
+        full_page = pages_mixin.confluence.get_page_by_id.return_value
+
+        # Act
+        first = pages_mixin.get_page_content(page_id)
+        pages_mixin.confluence.get_page_by_id.return_value = {
+            "id": page_id,
+            "version": full_page["version"],
+        }
+        second = pages_mixin.get_page_content(page_id, convert_to_markdown=False)
+
+        # Assert
+        assert first.content == "Processed Markdown"
+        assert second.content == "<p>Processed HTML</p>"
+        assert second.title == first.title
+        pages_mixin.confluence.get_page_by_id.assert_called_with(
+            page_id=page_id, expand="version"
+        )
+        pages_mixin.preprocessor.process_html_content.assert_called_once()
+
+    def test_get_page_content_converts_only_requested_format(self, pages_mixin):
+        """Test that a read converts one format and a later read adds the other."""
+        # Arrange
+        page_id = "987654321"
+        full_page = pages_mixin.confluence.get_page_by_id.return_value
+        pages_mixin.preprocessor.process_html_content.side_effect = [
+            ("<p>Processed HTML</p>", ""),
+            ("", "Processed Markdown"),
+        ]
+
+        # Act
+        first = pages_mixin.get_page_content(page_id, convert_to_markdown=False)
+        pages_mixin.confluence.get_page_by_id.return_value = {
+            "id": page_id,
+            "version": full_page["version"],
+        }
+        second = pages_mixin.get_page_content(page_id)
+        third = pages_mixin.get_page_content(page_id, convert_to_markdown=False)
+
+        # Assert
+        assert first.content == third.content == "<p>Processed HTML</p>"
+        assert second.content == "Processed Markdown"
+        body = full_page["body"]["storage"]["value"]
+        assert [
+            (c.args[0], c.kwargs["output"])
+            for c in pages_mixin.preprocessor.process_html_content.call_args_list
+        ] == [(body, "html"), (body, "markdown")]
+
+    def test_get_page_content_adds_page_to_search_index(self, pages_mixin, tmp_path):
+        """Test that fetched pages are indexed with their converted content."""
+        # Arrange
+        pages_mixin.search_index = SearchIndex(tmp_path / "index.db")
+        pages_mixin.preprocessor.process_html_content.return_value = (
+            "<p>Agenda</p>",
+            "Agenda and action items",
+        )
+
+        # Act
+        pages_mixin.get_page_content("987654321")
+        results = pages_mixin.search_index.search("action items")
+
+        # Assert
+        assert [page.id for page in results] == ["987654321"]
+        assert results[0].title == "Example Meeting Notes"
+        assert results[0].space.key == "PROJ"
+
+    def test_get_page_content_html_only_with_search_index(self, pages_mixin, tmp_path):
+        """Test that HTML-only reads don't convert Markdown just for the index."""
+        # Arrange
+        pages_mixin.search_index = SearchIndex(tmp_path / "index.db")
+        pages_mixin.preprocessor.process_html_content.return_value = (
+            "<p>Agenda</p>",
+            "",
+        )
+
+        # Act
+        pages_mixin.get_page_content("987654321", convert_to_markdown=False)
+
+        # Assert
+        call = pages_mixin.preprocessor.process_html_content.call_args
+        assert call.kwargs["output"] == "html"
+        assert len(pages_mixin.search_index) == 0
+
+    def test_get_page_content_refetches_new_version(self, pages_mixin):
+        """Test that a new page version is fetched and converted again."""
+        # Arrange
+        page_id = "987654321"
+        full_page = pages_mixin.confluence.get_page_by_id.return_value
+        pages_mixin.get_page_content(page_id)
+        new_version = {
+            **full_page["version"],
+            "number": full_page["version"]["number"] + 1,
+        }
+        pages_mixin.confluence.get_page_by_id.side_effect = [
+            {"id": page_id, "version": new_version},
+            {**full_page, "version": new_version},
+        ]
+
+        # Act
+        pages_mixin.get_page_content(page_id)
+
+        # Assert
+        assert [
+            c.kwargs["expand"]
+            for c in pages_mixin.confluence.get_page_by_id.call_args_list
+        ] == [
+            "body.storage,version,space",
+            "version",
+            "body.storage,version,space",
+        ]
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_sections(self, pages_mixin):
+        """Test that only the requested sections of a page are converted."""
+        # Arrange
+        page = pages_mixin.confluence.get_page_by_id.return_value
+        pages_mixin.confluence.get_page_by_id.return_value = {
+            **page,
+            "body": {
+                "storage": {
+                    "value": "<h1>One</h1><p>1</p><h2>Two</h2><p>2</p>"
+                    "<h2>Three</h2><p>3</p>"
+                }
+            },
+        }
+        pages_mixin.preprocessor.process_html_content.side_effect = (
+            lambda html, space_key="", output="both": ("", f"md:{html}")
+        )
+
+        # Act
+        result, sections = pages_mixin.get_page_sections("987654321", 1, 2)
+
+        # Assert
+        assert result.id == "987654321"
+        assert result.content == ""
+        assert [(s.index, s.level, s.title, s.size) for s in sections] == [
+            (0, 1, "One", 20),
+            (1, 2, "Two", 20),
+            (2, 2, "Three", 22),
+        ]
+        assert [s.content for s in sections] == [
+            None,
+            "md:<h2>Two</h2><p>2</p>",
+            "md:<h2>Three</h2><p>3</p>",
+        ]
+        assert pages_mixin.preprocessor.process_html_content.call_count == 2
+
+    def test_get_page_sections_outline(self, pages_mixin):
+        """Test that listing the sections converts nothing."""
+        # Act
+        _, sections = pages_mixin.get_page_sections("987654321")
+
+        # Assert
+        assert sections
+        assert all(section.content is None for section in sections)
+        pages_mixin.preprocessor.process_html_content.assert_not_called()
+
+    def test_get_page_sections_reuses_fetched_page(self, pages_mixin):
+        """Test that reading a page section by section fetches its body once."""
+        # Act
+        pages_mixin.get_page_sections("987654321")
+        pages_mixin.get_page_sections("987654321", 0)
+        pages_mixin.get_page_sections("987654321", 1)
+
+        # Assert: later calls only check the version
+        expands = [
+            call.kwargs["expand"]
+            for call in pages_mixin.confluence.get_page_by_id.call_args_list
+        ]
+        assert expands == ["body.storage,version,space", "version", "version"]
+
+    def test_get_page_content_after_sections(self, pages_mixin):
+        """Test that a page cached by a section read is converted when read."""
+        # Arrange
+        pages_mixin.get_page_sections("987654321")
+
+        # Act
+        result = pages_mixin.get_page_content("987654321", convert_to_markdown=False)
+
+        # Assert
+        assert result.content == "<p>Processed HTML</p>"
+        call = pages_mixin.preprocessor.process_html_content.call_args
+        assert call.kwargs["output"] == "html"
+
+    def test_get_page_sections_space_from_title_lookup(self, pages_mixin):
+        """Test that pages cached by title still resolve links in their space."""
+        # Arrange: a page read by title has no expanded space
+        page = pages_mixin.confluence.get_page_by_id.return_value
+        title_page = {key: value for key, value in page.items() if key != "space"}
+        title_page["_expandable"] = {"space": "/rest/api/space/TEAM"}
+        pages_mixin.page_content_cache.set(
+            ("987654321", "body.storage,version"), (title_page, "", "")
+        )
+
+        # Act
+        pages_mixin.get_page_sections("987654321", 0)
+
+        # Assert
+        call = pages_mixin.preprocessor.process_html_content.call_args
+        assert call.kwargs["space_key"] == "TEAM"
+
     def test_get_page_ancestors(self, pages_mixin):
         """Test getting page ancestors (parent pages)."""
         # Arrange
@@ -187,6 +397,56 @@ class TestPagesMixin:
         assert result.title == title
         assert result.content == "Processed Markdown"
 
+    def test_get_page_by_title_uses_cached_lookups(self, pages_mixin):
+        """Test that repeated title lookups reuse the space index and page ID."""
+        # Arrange
+        page = {
+            "id": "987654321",
+            "title": "Example Page",
+            "space": {"key": "DEMO"},
+            "body": {"storage": {"value": "<p>Example content</p>"}},
+            "version": {"number": 1},
+        }
+        pages_mixin.confluence.get_all_spaces.return_value = {
+            "results": [{"key": "DEMO"}]
+        }
+        pages_mixin.confluence.get_page_by_title.return_value = page
+        pages_mixin.confluence.get_page_by_id.return_value = page
+
+        # Act
+        first = pages_mixin.get_page_by_title("DEMO", "Example Page")
+        second = pages_mixin.get_page_by_title("DEMO", "Example Page")
+
+        # Assert
+        assert first.id == second.id == "987654321"
+        pages_mixin.confluence.get_all_spaces.assert_called_once()
+        pages_mixin.confluence.get_page_by_title.assert_called_once()
+        pages_mixin.confluence.get_page_by_id.assert_called_once_with(
+            page_id="987654321", expand="version"
+        )
+        pages_mixin.preprocessor.process_html_content.assert_called_once()
+
+    def test_get_page_by_title_renamed_page(self, pages_mixin):
+        """Test that a cached page ID is dropped once the page is renamed."""
+        # Arrange
+        pages_mixin.confluence.get_all_spaces.return_value = {
+            "results": [{"key": "DEMO"}]
+        }
+        pages_mixin.page_id_cache.set(("DEMO", "Old Title"), "987654321")
+        pages_mixin.confluence.get_page_by_id.return_value = {
+            "id": "987654321",
+            "title": "New Title",
+        }
+        pages_mixin.confluence.get_page_by_title.return_value = None
+
+        # Act
+        result = pages_mixin.get_page_by_title("DEMO", "Old Title")
+
+        # Assert
+        assert result is None
+        pages_mixin.confluence.get_page_by_title.assert_called_once()
+        assert pages_mixin.page_id_cache.get(("DEMO", "Old Title")) is None
+
     def test_get_page_by_title_space_not_found(self, pages_mixin):
         """Test getting a page when the space doesn't exist."""
         # Arrange
@@ -363,6 +623,112 @@ class TestPagesMixin:
         with pytest.raises(Exception, match="Failed to update page"):
             pages_mixin.update_page("987654321", "Test Page", "<p>Content</p>")
 
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [
+            ("append", "{current}<p>New paragraph</p>"),
+            ("prepend", "<p>New paragraph</p>{current}"),
+        ],
+    )
+    def test_update_page_adds_to_current_body(self, pages_mixin, mode, expected):
+        """Test that appended content is combined with the current body."""
+        # Arrange
+        page_id = "987654321"
+        current = pages_mixin.confluence.get_page_by_id.return_value
+        current_body = current["body"]["storage"]["value"]
+        pages_mixin.preprocessor.markdown_to_confluence_storage.return_value = (
+            "<p>New paragraph</p>"
+        )
+
+        # Act
+        with patch.object(pages_mixin, "get_page_content"):
+            pages_mixin.update_page(
+                page_id, current["title"], "New paragraph", mode=mode
+            )
+
+        # Assert
+        pages_mixin.preprocessor.markdown_to_confluence_storage.assert_called_once_with(
+            "New paragraph"
+        )
+        _, kwargs = pages_mixin.confluence.update_page.call_args
+        assert kwargs["body"] == expected.format(current=current_body)
+
+    def test_update_page_appends_to_cached_body(self, pages_mixin):
+        """Test that a current cached page is not fetched again for appending."""
+        # Arrange
+        page_id = "987654321"
+        current = pages_mixin.confluence.get_page_by_id.return_value
+        pages_mixin.get_page_content(page_id)
+        pages_mixin.confluence.get_page_by_id.reset_mock()
+        pages_mixin.confluence.get_page_by_id.return_value = {
+            "id": page_id,
+            "version": current["version"],
+        }
+
+        # Act
+        with patch.object(pages_mixin, "get_page_content"):
+            pages_mixin.update_page(
+                page_id,
+                current["title"],
+                "<p>More</p>",
+                is_markdown=False,
+                mode="append",
+            )
+
+        # Assert
+        pages_mixin.confluence.get_page_by_id.assert_called_once_with(
+            page_id=page_id, expand="version"
+        )
+        _, kwargs = pages_mixin.confluence.update_page.call_args
+        assert kwargs["body"] == current["body"]["storage"]["value"] + "<p>More</p>"
+
+    def test_update_page_skips_unchanged_page(self, pages_mixin):
+        """Test that resending the current content creates no new version."""
+        # Arrange
+        page_id = "987654321"
+        current = pages_mixin.confluence.get_page_by_id.return_value
+        pages_mixin.get_page_content(page_id)
+
+        # Act
+        result = pages_mixin.update_page(
+            page_id,
+            current["title"],
+            current["body"]["storage"]["value"],
+            is_markdown=False,
+        )
+        pages_mixin.update_page(
+            page_id, current["title"], "", is_markdown=False, mode="append"
+        )
+
+        # Assert
+        pages_mixin.confluence.update_page.assert_not_called()
+        assert result.id == page_id
+
+    def test_update_page_changes_title_of_unchanged_body(self, pages_mixin):
+        """Test that a new title is saved even if the body is unchanged."""
+        # Arrange
+        page_id = "987654321"
+        current = pages_mixin.confluence.get_page_by_id.return_value
+        pages_mixin.get_page_content(page_id)
+
+        # Act
+        with patch.object(pages_mixin, "get_page_content"):
+            pages_mixin.update_page(
+                page_id,
+                "Renamed page",
+                current["body"]["storage"]["value"],
+                is_markdown=False,
+            )
+
+        # Assert
+        pages_mixin.confluence.update_page.assert_called_once()
+
+    def test_update_page_invalid_mode(self, pages_mixin):
+        """Test that an unknown update mode is rejected."""
+        with pytest.raises(Exception, match="Invalid update mode: merge"):
+            pages_mixin.update_page("987654321", "Title", "Body", mode="merge")
+        pages_mixin.confluence.update_page.assert_not_called()
+
     def test_delete_page_success(self, pages_mixin):
         """Test successfully deleting a page."""
         # Arrange
@@ -464,7 +830,7 @@ class TestPagesMixin:
         assert len(results) == 1
         assert results[0].content == "Processed Markdown"
         pages_mixin.preprocessor.process_html_content.assert_called_once_with(
-            "<p>This is some content</p>", space_key="DEMO"
+            "<p>This is some content</p>", space_key="DEMO", output="markdown"
         )
 
     def test_get_page_children_empty(self, pages_mixin):
@@ -481,6 +847,65 @@ class TestPagesMixin:
         # Assert
         assert len(results) == 0
 
+    @pytest.fixture
+    def page_tree(self, pages_mixin):
+        """Mock a page tree where page 4 is reachable through two parents."""
+        children = {"1": ["2", "3"], "2": ["4"], "3": ["4"], "4": ["5"], "5": []}
+
+        def get_page_by_id(page_id, expand=None):
+            if page_id == "3":
+                raise ApiError("Forbidden")
+            return {
+                "id": page_id,
+                "title": f"Page {page_id}",
+                "type": "page",
+                "space": {"key": "DOCS"},
+                "version": {"number": 1},
+                "body": {"storage": {"value": f"<p>Page {page_id}</p>"}},
+            }
+
+        def get_page_child_by_type(page_id, type, start, limit):
+            return [{"id": child_id} for child_id in children[page_id]][start:]
+
+        pages_mixin.confluence.get_page_by_id.side_effect = get_page_by_id
+        pages_mixin.confluence.get_page_child_by_type.side_effect = (
+            get_page_child_by_type
+        )
+        return pages_mixin
+
+    def test_iter_page_tree(self, page_tree):
+        """Test crawling descendants with depth information and deduplication."""
+        # Act
+        nodes = list(page_tree.iter_page_tree("1", max_depth=2))
+
+        # Assert
+        assert sorted((n.page.id, n.depth, n.parent_id) for n in nodes) == [
+            ("1", 0, None),
+            ("2", 1, "1"),
+            ("4", 2, "2"),
+        ]
+        assert all(n.page.content == "Processed Markdown" for n in nodes)
+        # Page 3 failed to load and page 5 is below max_depth
+        listed = {
+            c.kwargs["page_id"]
+            for c in page_tree.confluence.get_page_child_by_type.call_args_list
+        }
+        assert listed == {"1", "2"}
+
+    def test_iter_page_tree_limits_pages(self, page_tree):
+        """Test that the crawl stops scheduling pages at max_pages."""
+        # Act
+        nodes = list(
+            page_tree.iter_page_tree(
+                "1", max_depth=5, max_pages=2, include_content=False
+            )
+        )
+
+        # Assert
+        assert [n.page.id for n in nodes] == ["1", "2"]
+        assert nodes[1].page.content == ""
+        page_tree.preprocessor.process_html_content.assert_not_called()
+
     def test_get_page_children_error(self, pages_mixin):
         """Test error handling when getting child pages."""
         # Arrange
@@ -24,6 +24,7 @@ class TestSearchMixin:
             mixin.confluence = confluence_client.confluence
             mixin.config = confluence_client.config
             mixin.preprocessor = confluence_client.preprocessor
+            mixin.search_index = confluence_client.search_index
             return mixin
 
     def test_search_success(self, search_mixin):
@@ -157,3 +158,29 @@ class TestSearchMixin:
         # Assert
         assert isinstance(results, list)
         assert len(results) == 0
+
+    def test_search_matches_excerpts_by_content_id(self, search_mixin):
+        """Test that every result gets the excerpt of its own content."""
+        search_mixin.confluence.cql.return_value = {
+            "results": [
+                {
+                    "content": {"id": str(index), "title": f"Page {index}"},
+                    "excerpt": f"excerpt {index}" if index % 3 else "",
+                }
+                for index in range(30)
+            ]
+        }
+        search_mixin.preprocessor.process_html_content.side_effect = (
+            lambda html, space_key="", output="both": (html, f"md:{html}")
+        )
+
+        results = search_mixin.search("large query", limit=30)
+
+        assert [page.id for page in results] == [str(i) for i in range(30)]
+        for index, page in enumerate(results):
+            if index % 3:
+                assert page.content == f"md:excerpt {index}"
+            else:
+                assert page.content == ""
+        # Results without an excerpt are not converted
+        assert search_mixin.preprocessor.process_html_content.call_count == 20
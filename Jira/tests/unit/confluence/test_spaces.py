@@ -1,11 +1,13 @@
 """Unit tests for the SpacesMixin class."""
 
+import time
 from unittest.mock import patch
 
 import pytest
 import requests
 from fixtures.confluence_mocks import MOCK_SPACES_RESPONSE
 
+from mcp_atlassian.confluence.client import SPACE_SNAPSHOT_CACHE_SIZE
 from mcp_atlassian.confluence.spaces import SpacesMixin
 
 
@@ -25,6 +27,11 @@ class TestSpacesMixin:
             mixin.confluence = confluence_client.confluence
             mixin.config = confluence_client.config
             mixin.preprocessor = confluence_client.preprocessor
+            mixin.space_index = confluence_client.space_index
+            mixin.page_id_cache = confluence_client.page_id_cache
+            mixin.page_content_cache = confluence_client.page_content_cache
+            mixin.space_snapshots = confluence_client.space_snapshots
+            mixin.search_index = confluence_client.search_index
             return mixin
 
     def test_get_spaces(self, spaces_mixin):
@@ -38,6 +45,19 @@ class TestSpacesMixin:
         )
         assert result == MOCK_SPACES_RESPONSE
 
+    def test_get_space(self, spaces_mixin):
+        """Test that space lookups are answered from the cached space index."""
+        # Act
+        space = spaces_mixin.get_space("PROJ")
+
+        # Assert
+        assert space["name"] == "Project Space"
+        assert spaces_mixin.space_exists("PROJ")
+        assert not spaces_mixin.space_exists("MISSING")
+        spaces_mixin.confluence.get_all_spaces.assert_called_once_with(
+            start=0, limit=500
+        )
+
     def test_get_user_contributed_spaces_success(self, spaces_mixin):
         """Test getting spaces that the user has contributed to."""
         # Arrange
@@ -165,3 +185,180 @@ class TestSpacesMixin:
 
         # Assert
         assert result == {}
+
+    @staticmethod
+    def _cql_result(page_id: str, version: int, modified: str) -> dict:
+        return {
+            "content": {
+                "id": page_id,
+                "type": "page",
+                "title": f"Page {page_id}",
+                "version": {"number": version},
+                "body": {"storage": {"value": f"<p>Page {page_id}</p>"}},
+            },
+            "lastModified": modified,
+        }
+
+    def test_sync_space_snapshot_is_incremental(self, spaces_mixin, monkeypatch):
+        """Test that later syncs only query and convert modified pages."""
+        # Arrange
+        now = [1_700_000_000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cql = spaces_mixin.confluence.cql
+        cql.return_value = {
+            "results": [
+                self._cql_result("1", 1, "2024-01-02T00:00:00.000Z"),
+                self._cql_result("2", 1, "2024-01-01T00:00:00.000Z"),
+            ]
+        }
+
+        # Act - full sync, then a delta sync ten minutes later
+        snapshot = spaces_mixin.sync_space_snapshot("DOCS")
+        now[0] += 600
+        cql.return_value = {
+            "results": [
+                self._cql_result("2", 2, "2024-01-03T00:00:00.000Z"),
+                self._cql_result("1", 1, "2024-01-02T00:00:00.000Z"),
+            ]
+        }
+        spaces_mixin.sync_space_snapshot("DOCS")
+
+        # Assert
+        first, second = (c.kwargs["cql"] for c in cql.call_args_list)
+        assert first == 'space = "DOCS" AND type = page ORDER BY lastmodified DESC'
+        assert 'lastmodified >= now("-12m")' in second
+        assert [page.id for page in snapshot.recent()] == ["2", "1"]
+        assert snapshot.pages["2"].version.number == 2
+        assert snapshot.pages["2"].content == "Processed Markdown"
+        assert snapshot.pages["2"].space.key == "DOCS"
+        # Page 1 was unchanged in the delta and not converted again
+        assert spaces_mixin.preprocessor.process_html_content.call_count == 3
+
+    def test_sync_space_snapshot_drops_deleted_pages(self, spaces_mixin, monkeypatch):
+        """Test that deleted pages are dropped by the periodic ID listing."""
+        # Arrange
+        now = [1_700_000_000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cql = spaces_mixin.confluence.cql
+        cql.return_value = {
+            "results": [
+                self._cql_result("1", 1, "2024-01-02T00:00:00.000Z"),
+                self._cql_result("2", 1, "2024-01-01T00:00:00.000Z"),
+            ]
+        }
+        snapshot = spaces_mixin.sync_space_snapshot("DOCS")
+
+        # Act
+        now[0] += 7200
+        cql.side_effect = [
+            {"results": []},
+            {"results": [{"content": {"id": "1"}}]},
+        ]
+        spaces_mixin.sync_space_snapshot("DOCS")
+
+        # Assert
+        assert list(snapshot.pages) == ["1"]
+        assert cql.call_args.kwargs == {
+            "cql": 'space = "DOCS" AND type = page',
+            "start": 0,
+            "limit": 50,
+            "expand": None,
+        }
+
+    def test_sync_space_snapshot_is_bounded(self, spaces_mixin, monkeypatch):
+        """Test that a snapshot keeps only the most recently modified pages."""
+        # Arrange
+        now = [1_700_000_000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cql = spaces_mixin.confluence.cql
+        cql.return_value = {
+            "results": [
+                self._cql_result("3", 1, "2024-01-03T00:00:00.000Z"),
+                self._cql_result("2", 1, "2024-01-02T00:00:00.000Z"),
+                self._cql_result("1", 1, "2024-01-01T00:00:00.000Z"),
+            ]
+        }
+
+        # Act
+        snapshot = spaces_mixin.sync_space_snapshot("DOCS", max_pages=2)
+
+        # Assert: older pages are neither converted nor kept
+        assert [page.id for page in snapshot.recent()] == ["3", "2"]
+        assert spaces_mixin.preprocessor.process_html_content.call_count == 2
+        assert not snapshot.complete
+
+    def test_sync_space_snapshot_trims_to_bound(self, spaces_mixin, monkeypatch):
+        """Test that pages modified after the first sync push out older ones."""
+        # Arrange
+        now = [1_700_000_000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cql = spaces_mixin.confluence.cql
+        cql.return_value = {
+            "results": [
+                self._cql_result("2", 1, "2024-01-02T00:00:00.000Z"),
+                self._cql_result("1", 1, "2024-01-01T00:00:00.000Z"),
+            ]
+        }
+        snapshot = spaces_mixin.sync_space_snapshot("DOCS", max_pages=2)
+        assert snapshot.complete
+
+        # Act
+        now[0] += 600
+        cql.return_value = {
+            "results": [self._cql_result("3", 1, "2024-01-03T00:00:00.000Z")]
+        }
+        spaces_mixin.sync_space_snapshot("DOCS", max_pages=2)
+
+        # Assert
+        assert [page.id for page in snapshot.recent()] == ["3", "2"]
+        assert not snapshot.complete
+
+    def test_sync_space_snapshot_error_keeps_watermark(self, spaces_mixin):
+        """Test that a failed sync keeps the previous snapshot and watermark."""
+        # Arrange
+        spaces_mixin.confluence.cql.return_value = {
+            "results": [self._cql_result("1", 1, "2024-01-02T00:00:00.000Z")]
+        }
+        snapshot = spaces_mixin.sync_space_snapshot("DOCS")
+        synced_at = snapshot.synced_at
+        spaces_mixin.confluence.cql.side_effect = requests.RequestException("down")
+
+        # Act
+        result = spaces_mixin.sync_space_snapshot("DOCS")
+
+        # Assert
+        assert result is snapshot
+        assert list(result.pages) == ["1"]
+        assert result.synced_at == synced_at
+
+    def test_space_snapshots_are_bounded(self, spaces_mixin):
+        """Test that only the most recently used space snapshots are kept."""
+        # Arrange
+        spaces_mixin.confluence.cql.return_value = {"results": []}
+
+        # Act
+        for index in range(SPACE_SNAPSHOT_CACHE_SIZE + 5):
+            spaces_mixin.sync_space_snapshot(f"SPACE{index}")
+
+        # Assert
+        assert len(spaces_mixin.space_snapshots) == SPACE_SNAPSHOT_CACHE_SIZE
+        assert spaces_mixin.get_space_snapshot("SPACE0") is None
+        assert spaces_mixin.get_space_snapshot(f"SPACE{SPACE_SNAPSHOT_CACHE_SIZE}")
+
+    def test_sync_space_snapshot_in_background(self, spaces_mixin):
+        """Test that a background sync makes the snapshot available."""
+        # Arrange
+        spaces_mixin.confluence.cql.return_value = {
+            "results": [self._cql_result("1", 1, "2024-01-02T00:00:00.000Z")]
+        }
+        assert spaces_mixin.get_space_snapshot("DOCS") is None
+
+        # Act
+        spaces_mixin.sync_space_snapshot_in_background("DOCS")
+        deadline = time.monotonic() + 5
+        while spaces_mixin.get_space_snapshot("DOCS") is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        # Assert
+        assert list(spaces_mixin.get_space_snapshot("DOCS").pages) == ["1"]
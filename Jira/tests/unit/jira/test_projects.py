@@ -422,7 +422,7 @@ def test_get_project_issues_with_search_mixin(projects_mixin):
     result = projects_mixin.get_project_issues("PROJ1", start=10, limit=20)
     assert result == mock_search_result
     projects_mixin.search_issues.assert_called_once_with(
-        "project = PROJ1", start=10, limit=20
+        "project = PROJ1", start=10, limit=20, simplified=False
     )
     projects_mixin.jira.jql.assert_not_called()
 
@@ -177,7 +177,7 @@ class TestSearchMixin:
 
         # Verify
         search_mixin.search_issues.assert_called_once_with(
-            "project = TEST ORDER BY created DESC", start=0, limit=20
+            "project = TEST ORDER BY created DESC", start=0, limit=20, simplified=False
         )
         assert isinstance(result, list)
         assert len(result) == 1
@@ -63,6 +63,20 @@ class TestTimestampMixin:
 
         assert result == "2024-01-01 12:34:56"
 
+    def test_format_timestamp_keeps_local_time(self):
+        """Test that timestamps with an offset are formatted in their own time."""
+        formatter = TimestampMixin()
+
+        assert formatter.format_timestamp("2024-03-15T08:00:00.000-0500") == (
+            "2024-03-15 08:00:00"
+        )
+        assert formatter.format_timestamp("2024-03-15 08:00:00+01:00") == (
+            "2024-03-15 08:00:00"
+        )
+        assert formatter.format_timestamp("2024-13-01T08:00:00.000+0000") == (
+            "2024-13-01T08:00:00.000+0000"
+        )
+
     def test_format_timestamp_none(self):
         """Test formatting a None timestamp."""
         formatter = TimestampMixin()
@@ -8,6 +8,7 @@ and the simplified dictionary conversion for API responses.
 import pytest
 
 from src.mcp_atlassian.models.confluence import (
+    ConfluenceAttachment,
     ConfluenceComment,
     ConfluencePage,
     ConfluenceSearchResult,
@@ -247,6 +248,66 @@ class TestConfluenceComment:
         assert simplified["author"] == "Comment Author"
 
 
+class TestConfluenceAttachment:
+    """Tests for the ConfluenceAttachment model."""
+
+    def test_from_api_response_with_valid_data(self):
+        """Test creating a ConfluenceAttachment from valid API data."""
+        attachment = ConfluenceAttachment.from_api_response(
+            {
+                "id": "att123",
+                "type": "attachment",
+                "title": "report.pdf",
+                "extensions": {"mediaType": "application/pdf", "fileSize": 2048},
+                "metadata": {"comment": "Q1 report"},
+                "version": {"number": 2},
+                "container": {"id": 987654321, "type": "page"},
+                "_links": {"download": "/download/attachments/987654321/report.pdf"},
+            },
+            base_url="https://example.atlassian.net/wiki/",
+        )
+
+        assert attachment.id == "att123"
+        assert attachment.media_type == "application/pdf"
+        assert attachment.file_size == 2048
+        assert attachment.comment == "Q1 report"
+        assert attachment.page_id == "987654321"
+        assert attachment.version.number == 2
+        assert attachment.download_url == (
+            "https://example.atlassian.net/wiki/download/attachments/987654321/report.pdf"
+        )
+
+    def test_from_api_response_with_empty_data(self):
+        """Test creating a ConfluenceAttachment from empty data."""
+        attachment = ConfluenceAttachment.from_api_response({})
+
+        assert attachment.id == "0"
+        assert attachment.media_type == "application/octet-stream"
+        assert attachment.file_size is None
+        assert attachment.download_url is None
+
+    def test_to_simplified_dict(self):
+        """Test converting ConfluenceAttachment to a simplified dictionary."""
+        attachment = ConfluenceAttachment(
+            id="att123",
+            title="report.pdf",
+            media_type="application/pdf",
+            file_size=2048,
+            page_id="987654321",
+            version=ConfluenceVersion(number=2),
+            download_url="https://example.atlassian.net/wiki/download/report.pdf",
+        )
+
+        assert attachment.to_simplified_dict() == {
+            "id": "att123",
+            "title": "report.pdf",
+            "media_type": "application/pdf",
+            "file_size": 2048,
+            "page_id": "987654321",
+            "version": 2,
+        }
+
+
 class TestConfluencePage:
     """Tests for the ConfluencePage model."""
 
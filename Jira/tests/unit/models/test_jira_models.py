@@ -5,6 +5,7 @@ These tests validate the conversion of Jira API responses to structured models
 and the simplified dictionary conversion for API responses.
 """
 
+import json
 import os
 
 import pytest
@@ -21,6 +22,7 @@ from src.mcp_atlassian.models.jira import (
     JiraTransition,
     JiraUser,
     JiraWorklog,
+    _resolve_custom_field_id,
 )
 
 # Optional: Import real API client for optional real-data testing
@@ -450,6 +452,73 @@ class TestJiraIssue:
         result = JiraIssue._find_custom_field_by_name(None, ["Epic Link"])
         assert result is None
 
+    def test_custom_field_resolution_is_cached_per_schema(self):
+        """Test that the schema is resolved once for issues sharing a schema."""
+        schema = {
+            "fields": {
+                "customfield_10000": {"name": "Custom Field", "type": "string"},
+                "customfield_10014": {"name": "Epic Link", "type": "string"},
+                "customfield_10011": {"name": "Epic Name", "type": "string"},
+            }
+        }
+        issues = [
+            {
+                "id": str(index),
+                "key": f"PROJ-{index}",
+                "fields": {
+                    "customfield_10014": f"EPIC-{index}",
+                    "customfield_10011": "Epic Name Test",
+                    "schema": schema,
+                },
+            }
+            for index in range(1000)
+        ]
+
+        _resolve_custom_field_id.cache_clear()
+        parsed = [JiraIssue.from_api_response(issue) for issue in issues]
+
+        assert parsed[999].epic_key == "EPIC-999"
+        assert parsed[999].epic_name == "Epic Name Test"
+        # One schema scan per pattern set (Epic Link and Epic Name)
+        assert _resolve_custom_field_id.cache_info().misses == 2
+
+        # A different schema is resolved separately
+        renamed = {
+            "fields": {"customfield_20000": {"name": "Epic-Link", "type": "string"}}
+        }
+        issue = JiraIssue.from_api_response(
+            {"fields": {"customfield_20000": "EPIC-2", "schema": renamed}}
+        )
+        assert issue.epic_key == "EPIC-2"
+        assert _resolve_custom_field_id.cache_info().misses == 4
+
+    def test_custom_field_cache_hits_for_decoded_issues(self):
+        """Test that JSON-decoded issues with equal schemas share cache entries."""
+        schema = {
+            "fields": {
+                "customfield_10014": {"name": "Epic Link", "type": "string"},
+                "customfield_10011": {"name": "Epic Name", "type": "string"},
+            }
+        }
+        payloads = [
+            json.dumps(
+                {
+                    "key": f"PROJ-{index}",
+                    "fields": {"customfield_10014": f"EPIC-{index}", "schema": schema},
+                }
+            )
+            for index in range(10)
+        ]
+
+        _resolve_custom_field_id.cache_clear()
+        issues = [JiraIssue.from_api_response(json.loads(p)) for p in payloads]
+
+        assert issues[9].epic_key == "EPIC-9"
+        # Each decoded issue has its own schema dict, yet only the first misses
+        info = _resolve_custom_field_id.cache_info()
+        assert info.misses == 2
+        assert info.hits == 18
+
     def test_epic_field_extraction_different_field_ids(self):
         """Test finding epic fields with different customfield IDs."""
         # Create a test issue with different field IDs than the common ones
@@ -654,6 +723,60 @@ class TestJiraSearchResult:
         assert result.max_results == 0
         assert result.issues == []
 
+    def test_simplify_api_response(self, jira_search_data):
+        """Test that the fast path matches the simplified models."""
+        base_url = "https://example.atlassian.net"
+        search_result = JiraSearchResult.from_api_response(
+            jira_search_data, base_url=base_url
+        )
+
+        simplified = JiraSearchResult.simplify_api_response(
+            jira_search_data, base_url=base_url
+        )
+
+        assert simplified == [
+            issue.to_simplified_dict() for issue in search_result.issues
+        ]
+        assert JiraSearchResult.simplify_api_response({}) == []
+
+    @pytest.mark.parametrize(
+        "issue_data",
+        [
+            {},
+            "PROJ-1",
+            {"key": "PROJ-1", "fields": "not a dict"},
+            {"id": 42, "key": "PROJ-2"},
+            {
+                "key": "PROJ-3",
+                "fields": {
+                    "summary": None,
+                    "description": 123,
+                    "created": "not a timestamp",
+                    "status": {"name": "Open", "statusCategory": "broken"},
+                    "issuetype": "Bug",
+                    "priority": {"iconUrl": "https://example.com/p.png"},
+                    "assignee": {"displayName": "Alice", "avatarUrls": []},
+                    "reporter": {},
+                    "labels": ["a", None, 1],
+                    "components": [{"name": "API"}, {"id": "1"}, "UI"],
+                    "comment": {"comments": [{}, {"body": "Hi", "author": {}}]},
+                },
+            },
+        ],
+    )
+    def test_simplify_api_response_edge_cases(self, issue_data):
+        """Test that the fast path matches the models for unusual payloads."""
+        expected = JiraIssue.from_api_response(
+            issue_data, base_url="https://example.atlassian.net"
+        ).to_simplified_dict()
+
+        assert (
+            JiraIssue.simplify_api_response(
+                issue_data, base_url="https://example.atlassian.net"
+            )
+            == expected
+        )
+
 
 class TestJiraProject:
     """Tests for the JiraProject model."""
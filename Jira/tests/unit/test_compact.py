@@ -0,0 +1,260 @@
+"""Tests for the compact output module."""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from mcp_atlassian.compact import (
+    ContinuationStore,
+    OutputOptions,
+    compact_result,
+    drop_empty,
+    read_continuation,
+    summarize_text,
+    truncate_text_fields,
+)
+
+
+def test_output_options_from_env():
+    """Test that output options are read from the environment."""
+    with patch.dict(
+        os.environ,
+        {"ATLASSIAN_COMPACT_OUTPUT": "true", "ATLASSIAN_MAX_TEXT_LENGTH": "500"},
+    ):
+        options = OutputOptions.from_env()
+
+    assert options.compact is True
+    assert options.max_text_length == 500
+
+
+def test_output_options_defaults():
+    """Test that output stays pretty-printed and untruncated by default."""
+    with patch.dict(os.environ, {}, clear=True):
+        options = OutputOptions.from_env()
+
+    assert options == OutputOptions()
+    assert options.dumps({"key": "ü"}) == json.dumps(
+        {"key": "ü"}, indent=2, ensure_ascii=False
+    )
+
+
+def test_with_arguments_pops_overrides():
+    """Test that per-call overrides are applied and removed from the arguments."""
+    arguments = {
+        "issue_key": "PROJ-1",
+        "compact": True,
+        "max_text_length": 10,
+        "truncation": "summary",
+    }
+
+    options = OutputOptions().with_arguments(arguments)
+
+    assert options == OutputOptions(
+        compact=True, max_text_length=10, truncation="summary"
+    )
+    assert arguments == {"issue_key": "PROJ-1"}
+
+
+def test_output_options_unknown_truncation_mode():
+    """Test that unknown truncation modes fall back to cutting after the head."""
+    with patch.dict(os.environ, {"ATLASSIAN_TEXT_TRUNCATION": "middle"}):
+        assert OutputOptions.from_env().truncation == "head"
+
+
+def test_drop_empty():
+    """Test that empty values are removed recursively."""
+    data = {"a": None, "b": "", "c": [], "d": {"e": {}}, "f": 0, "g": [{"h": None}]}
+
+    assert drop_empty(data) == {"f": 0, "g": [{}]}
+
+
+def test_compact_result_interns_repeated_users_and_statuses():
+    """Test that repeated users and statuses are replaced by references."""
+    alice = {"display_name": "Alice", "email": "alice@example.com"}
+    done = {"name": "Done", "category": "Done"}
+    data = [
+        {"key": "PROJ-1", "assignee": alice, "status": done},
+        {"key": "PROJ-2", "assignee": alice, "status": done},
+        {"key": "PROJ-3", "assignee": {"display_name": "Bob"}},
+    ]
+
+    result = compact_result(data)
+
+    assert result["refs"] == {"users": {"u1": alice}, "statuses": {"s1": done}}
+    assert result["data"][0] == {"key": "PROJ-1", "assignee": "u1", "status": "s1"}
+    assert result["data"][1] == {"key": "PROJ-2", "assignee": "u1", "status": "s1"}
+    # Objects occurring only once are kept inline
+    assert result["data"][2]["assignee"] == {"display_name": "Bob"}
+
+
+def test_compact_result_without_repeats_is_not_wrapped():
+    """Test that results without repeated objects keep their shape."""
+    data = {"key": "PROJ-1", "assignee": {"display_name": "Alice"}, "labels": []}
+
+    assert compact_result(data) == {
+        "key": "PROJ-1",
+        "assignee": {"display_name": "Alice"},
+    }
+
+
+def test_compact_dumps_is_minified():
+    """Test that compact mode emits minified JSON."""
+    text = OutputOptions(compact=True).dumps({"key": "PROJ-1", "summary": None})
+
+    assert text == '{"key":"PROJ-1"}'
+
+
+def test_truncate_text_fields_adds_continuation():
+    """Test that long text fields are cut and can be continued."""
+    store = ContinuationStore()
+    description = "a" * 30
+    data = {"issues": [{"key": "PROJ-1", "description": description}]}
+
+    result = truncate_text_fields(data, 10, store)
+
+    issue = result["issues"][0]
+    assert issue["description"] == "a" * 10
+    handle = issue["description_continuation"]
+    assert read_continuation(handle, store=store) == {"text": "a" * 20}
+
+
+def test_truncate_text_fields_prefers_line_breaks():
+    """Test that text is cut at a line break when one is close to the budget."""
+    store = ContinuationStore()
+    data = {"content": "line one\nline two\nline three"}
+
+    result = truncate_text_fields(data, 20, store)
+
+    assert result["content"] == "line one\nline two"
+    remainder = read_continuation(result["content_continuation"], store=store)
+    assert remainder == {"text": "\nline three"}
+
+
+def test_truncate_text_fields_keeps_short_text():
+    """Test that text within the budget is left untouched."""
+    data = {"body": "short", "summary": "x" * 50}
+
+    assert truncate_text_fields(data, 10, ContinuationStore()) == data
+
+
+def test_summarize_text_keeps_outline_and_end():
+    """Test that summaries keep the ends and the middle's headings."""
+    store = ContinuationStore()
+    text = (
+        "h1. Summary\n"
+        + "".join(f"Intro line {i}\n" for i in range(10))
+        + "h2. Details\n"
+        + "".join(f"Detail line {i}\n" for i in range(50))
+        + "h2. Outcome\n"
+        + "".join(f"Outcome line {i}\n" for i in range(10))
+    )
+
+    summary, handle = summarize_text(text, 400, store)
+
+    assert len(summary) <= 400
+    assert summary.startswith("h1. Summary\nIntro line 0\n")
+    assert summary.endswith("Outcome line 9\n")
+    assert "h2. Details\n" in summary
+    assert "h2. Outcome\n" in summary
+    assert "lines omitted ...]" in summary
+    assert "Detail line 25" not in summary
+
+    # The continuation holds the omitted lines in full
+    middle = read_continuation(handle, store=store)["text"]
+    assert "Detail line 25\n" in middle
+    assert text.startswith(summary[: summary.index("[...")] + middle)
+
+
+def test_summarize_text_balances_code_fences():
+    """Test that code blocks cut by the summary are closed and reopened."""
+    store = ContinuationStore()
+    text = (
+        "".join(f"Line {i}\n" for i in range(5))
+        + "```python\n"
+        + "".join(f"x = {i}\n" for i in range(60))
+        + "```\n"
+    )
+
+    summary, handle = summarize_text(text, 120, store)
+
+    assert summary.count("```") % 2 == 0
+    assert summary.endswith("x = 59\n```\n")
+    assert handle is not None
+
+
+def test_summarize_text_honours_budget_with_many_headings():
+    """Test that omission markers count against the budget."""
+    store = ContinuationStore()
+    text = "".join(
+        f"## Heading {i}\nBody line {i} of the section\n" for i in range(2500)
+    )
+
+    for max_length in (100, 500, 2000):
+        summary, handle = summarize_text(text, max_length, store)
+
+        assert len(summary) <= max_length
+        assert handle is not None
+    assert summary.count("lines omitted ...]") > 1
+
+
+def test_summarize_text_keeps_short_text():
+    """Test that text within the budget is left untouched."""
+    assert summarize_text("short\ntext", 20, ContinuationStore()) == (
+        "short\ntext",
+        None,
+    )
+
+
+def test_summarize_text_without_line_breaks():
+    """Test that a single long line falls back to cutting after the head."""
+    store = ContinuationStore()
+
+    summary, handle = summarize_text("a" * 30, 10, store)
+
+    assert summary == "a" * 10
+    assert read_continuation(handle, store=store) == {"text": "a" * 20}
+
+
+def test_dumps_summarizes_text_fields():
+    """Test that the summary truncation mode applies to every text field."""
+    options = OutputOptions(max_text_length=120, truncation="summary")
+    description = "".join(f"Line {i}\n" for i in range(40))
+
+    result = json.loads(options.dumps({"issue": {"description": description}}))
+
+    issue = result["issue"]
+    assert issue["description"].startswith("Line 0\n")
+    assert issue["description"].endswith("Line 39\n")
+    assert issue["description_continuation"].startswith("cont-")
+
+
+def test_read_continuation_in_chunks():
+    """Test that continuations can be read in chunks."""
+    store = ContinuationStore()
+    handle = store.put("b" * 25)
+
+    first = read_continuation(handle, max_length=10, store=store)
+    assert first["text"] == "b" * 10
+
+    second = read_continuation(first["continuation"], max_length=20, store=store)
+    assert second == {"text": "b" * 15}
+
+
+def test_read_continuation_unknown_handle():
+    """Test that unknown handles raise a ValueError."""
+    with pytest.raises(ValueError, match="unknown or has expired"):
+        read_continuation("cont-missing", store=ContinuationStore())
+
+
+def test_continuation_store_expiry_and_eviction():
+    """Test that continuations expire and the store stays bounded."""
+    expired = ContinuationStore(ttl=-1)
+    assert expired.get(expired.put("text")) is None
+
+    bounded = ContinuationStore(max_entries=2)
+    first = bounded.put("one")
+    bounded.put("two")
+    bounded.put("three")
+    assert bounded.get(first) is None
@@ -0,0 +1,98 @@
+"""Tests for the JSON codec module."""
+
+import json
+import math
+
+import pytest
+import requests
+from requests import Response
+from requests.sessions import Session
+
+from mcp_atlassian import json_codec
+from mcp_atlassian.json_codec import (
+    OrjsonCodec,
+    StdlibCodec,
+    configure_json_decoding,
+    get_codec,
+)
+from tests.fixtures.jira_mocks import MOCK_JIRA_JQL_RESPONSE
+
+CODECS = [StdlibCodec()]
+if json_codec.orjson is not None:
+    CODECS.append(OrjsonCodec())
+
+
+def _response(content: bytes, encoding: str | None = "utf-8") -> Response:
+    response = Response()
+    response._content = content
+    response.encoding = encoding
+    response.status_code = 200
+    return response
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_codec_matches_stdlib_output(codec):
+    """Test that every codec produces the documents the stdlib would."""
+    data = {**MOCK_JIRA_JQL_RESPONSE, "unicode": "Ärger → ✓"}
+
+    assert codec.dumps(data, pretty=True) == json.dumps(
+        data, indent=2, ensure_ascii=False
+    )
+    assert codec.dumps(data) == json.dumps(
+        data, separators=(",", ":"), ensure_ascii=False
+    )
+    assert codec.loads(json.dumps(data).encode()) == data
+
+
+@pytest.mark.skipif(json_codec.orjson is None, reason="orjson is not installed")
+def test_orjson_codec_falls_back_for_unsupported_input():
+    """Test that inputs orjson rejects are handled by the stdlib."""
+    codec = OrjsonCodec()
+
+    assert codec.dumps({"big": 2**70}) == '{"big":1180591620717411303424}'
+    assert math.isnan(codec.loads('{"value": NaN}')["value"])
+
+
+def test_get_codec_selection(monkeypatch):
+    """Test that the codec can be forced and falls back without orjson."""
+    assert get_codec("stdlib").name == "stdlib"
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+    assert get_codec("orjson").name == "stdlib"
+    assert get_codec("auto").name == "stdlib"
+
+
+@pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+def test_response_decoding_uses_codec(codec, monkeypatch):
+    """Test that session responses are decoded with the configured codec."""
+    monkeypatch.setattr(json_codec, "codec", codec)
+    session = Session()
+    configure_json_decoding(session)
+    configure_json_decoding(session)
+
+    assert session.hooks["response"].count(json_codec._install_decoder) == 1
+
+    response = _response(b'{"key": "PROJ-1", "summary": "\xc3\x84rger"}')
+    for hook in session.hooks["response"]:
+        hook(response)
+
+    assert response.json() == {"key": "PROJ-1", "summary": "Ärger"}
+
+
+def test_response_decoding_keeps_requests_errors(monkeypatch):
+    """Test that invalid JSON still raises the requests decode error."""
+    monkeypatch.setattr(json_codec, "codec", CODECS[-1])
+    response = _response(b"<html>not json</html>")
+    json_codec._install_decoder(response)
+
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        response.json()
+
+
+def test_response_decoding_respects_other_encodings(monkeypatch):
+    """Test that non UTF-8 responses are decoded by requests itself."""
+    monkeypatch.setattr(json_codec, "codec", CODECS[-1])
+    response = _response('{"name": "Jürgen"}'.encode("latin-1"), "iso-8859-1")
+    json_codec._install_decoder(response)
+
+    assert response.json() == {"name": "Jürgen"}
@@ -0,0 +1,205 @@
+"""Tests for the MCP server tool handlers."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+from mcp_atlassian import server
+from mcp_atlassian.compact import OutputOptions
+
+
+def test_call_tool_runs_fetchers_off_the_event_loop():
+    """Test that a slow page conversion doesn't block other tool calls."""
+    conversion_started = threading.Event()
+    release_conversion = threading.Event()
+
+    def convert_large_page(page_id, *, convert_to_markdown=True):
+        conversion_started.set()
+        # Blocks like a CPU-bound conversion until the second call is done
+        assert release_conversion.wait(timeout=5)
+        page = MagicMock()
+        page.to_simplified_dict.return_value = {"id": page_id}
+        return page
+
+    confluence = MagicMock()
+    confluence.get_page_content.side_effect = convert_large_page
+    jira = MagicMock()
+    jira.get_available_transitions.return_value = [{"id": "11", "name": "To Do"}]
+    app_context = server.AppContext(confluence=confluence, jira=jira)
+
+    async def run():
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            page_call = asyncio.create_task(
+                server.call_tool("confluence_get_page", {"page_id": "123"})
+            )
+            await asyncio.to_thread(conversion_started.wait, 5)
+
+            # The event loop still answers while the conversion is running
+            transitions = await asyncio.wait_for(
+                server.call_tool("jira_get_transitions", {"issue_key": "PROJ-1"}),
+                timeout=5,
+            )
+            assert not page_call.done()
+
+            release_conversion.set()
+            return transitions, await page_call
+        finally:
+            request_ctx.reset(token)
+
+    transitions, page = asyncio.run(run())
+
+    assert json.loads(transitions[0].text)[0]["id"] == "11"
+    assert json.loads(page[0].text) == {"metadata": {"id": "123"}}
+
+
+def test_call_tool_uses_startup_output_options(monkeypatch):
+    """Test that output options come from the context, not a per-call env read."""
+    monkeypatch.setenv("ATLASSIAN_COMPACT_OUTPUT", "false")
+    jira = MagicMock()
+    jira.get_available_transitions.return_value = [{"id": "11", "name": "To Do"}]
+    app_context = server.AppContext(jira=jira, output=OutputOptions(compact=True))
+
+    async def run():
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            return await server.call_tool(
+                "jira_get_transitions", {"issue_key": "PROJ-1"}
+            )
+        finally:
+            request_ctx.reset(token)
+
+    result = asyncio.run(run())
+
+    assert result[0].text == '[{"id":"11","name":"To Do"}]'
+
+
+def test_call_tool_reports_invalid_arguments():
+    """Test that arguments that can't be read return an error result."""
+    app_context = server.AppContext(jira=MagicMock())
+
+    async def run():
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            return await server.call_tool("jira_get_transitions", ["issue_key"])
+        finally:
+            request_ctx.reset(token)
+
+    result = asyncio.run(run())
+
+    assert result[0].text.startswith("Error: ")
+
+
+def test_confluence_update_page_output_format():
+    """Test that the updated page is returned as single-line JSON."""
+    confluence = MagicMock()
+    confluence.update_page.return_value.to_simplified_dict.return_value = {
+        "id": "123",
+        "title": "Title",
+    }
+    app_context = server.AppContext(confluence=confluence)
+
+    async def run():
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            return await server.call_tool(
+                "confluence_update_page",
+                {"page_id": "123", "title": "Title", "content": "Body"},
+            )
+        finally:
+            request_ctx.reset(token)
+
+    result = asyncio.run(run())
+
+    assert result[0].text == '{"page": {"id": "123", "title": "Title"}}'
+
+
+def test_confluence_search_passes_space_key():
+    """Test that simple searches are restricted to the requested space."""
+    confluence = MagicMock()
+    confluence.search_text.return_value = []
+    app_context = server.AppContext(confluence=confluence)
+
+    async def run():
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            return await server.call_tool(
+                "confluence_search", {"query": "billing", "space_key": "DOC"}
+            )
+        finally:
+            request_ctx.reset(token)
+
+    asyncio.run(run())
+
+    confluence.search_text.assert_called_once_with("billing", limit=10, space_key="DOC")
+
+
+def _read_resource(app_context, uri):
+    async def run():
+        token = request_ctx.set(
+            RequestContext(
+                request_id=0, meta=None, session=None, lifespan_context=app_context
+            )
+        )
+        try:
+            return await server.read_resource(uri)
+        finally:
+            request_ctx.reset(token)
+
+    return asyncio.run(run())
+
+
+def test_first_space_read_syncs_in_background():
+    """Test that an unsynced space is served by the contributor query."""
+    page = MagicMock(page_content="Body")
+    page.to_simplified_dict.return_value = {"title": "Mine", "url": "https://x/1"}
+    confluence = MagicMock()
+    confluence.get_space_snapshot.return_value = None
+    confluence.search.return_value = [page]
+    app_context = server.AppContext(confluence=confluence)
+
+    content, _ = _read_resource(app_context, "confluence://DOC")
+
+    assert content.startswith("# [Mine](https://x/1)")
+    confluence.sync_space_snapshot_in_background.assert_called_once_with("DOC")
+    confluence.sync_space_snapshot.assert_not_called()
+    assert "contributor = currentUser()" in confluence.search.call_args.args[0]
+
+
+def test_synced_space_read_uses_snapshot():
+    """Test that a synced space is served from its snapshot."""
+    page = MagicMock(page_content="Body")
+    page.to_simplified_dict.return_value = {"title": "Recent", "url": "https://x/2"}
+    confluence = MagicMock()
+    confluence.sync_space_snapshot.return_value.recent.return_value = [page]
+    app_context = server.AppContext(confluence=confluence)
+
+    content, _ = _read_resource(app_context, "confluence://DOC")
+
+    assert content.startswith("# [Recent](https://x/2)")
+    confluence.sync_space_snapshot.assert_called_once_with("DOC")
+    confluence.search.assert_not_called()
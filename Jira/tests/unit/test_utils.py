@@ -1,6 +1,7 @@
 """Tests for the utilities module."""
 
 import ssl
+import time
 from unittest.mock import MagicMock, patch
 
 from requests.adapters import HTTPAdapter
@@ -8,6 +9,7 @@ from requests.sessions import Session
 
 from mcp_atlassian.utils import (
     SSLIgnoreAdapter,
+    TTLCache,
     configure_ssl_verification,
     is_atlassian_cloud_url,
 )
@@ -179,3 +181,29 @@ def test_ssl_ignore_adapter():
     with patch.object(HTTPAdapter, "cert_verify") as mock_cert_verify:
         adapter.cert_verify(conn, url, verify=False, cert=cert)
         mock_cert_verify.assert_called_once_with(conn, url, verify=False, cert=cert)
+
+
+def test_ttl_cache_expiry_and_eviction(monkeypatch):
+    """Test that TTLCache expires entries and evicts the least recently used."""
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache = TTLCache(ttl=10, maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    now[0] += 10
+    assert cache.get("a", "expired") == "expired"
+    assert cache.pop("c") == 3
+    assert len(cache) == 0
+
+
+def test_ttl_cache_disabled():
+    """Test that a TTL of zero disables caching."""
+    cache = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None